@@ -1,25 +1,23 @@
-# This script does not check for errors or malformed files.
-# It only validates that neighbooring cells sharing a wall have
-#  both the correct encoding.
-# Usage: python3 output_validator.py output_maze.txt
+# Validates a maze output file with MazeValidator: shared walls,
+# closed border and 42 pattern, connectivity, and the solution.
+# Prints the report as JSON, exits with 1 if the maze is not valid.
+# With --shortest, a solution in a maze with loops is compared with
+# a BFS, which loads the whole maze instead of two rows.
+# Usage: python3 output_validator.py [--shortest] output_maze.txt
 
+import json
 import sys
 
-if len(sys.argv) != 2:
-    print(f"Usage: python3 {sys.argv[0]} <output_file>")
-    sys.exit(1)
+from mazegen.io import MazeValidator
 
-g = []
-for line in open(sys.argv[1]):
-    if line.strip() == '':
-        break
-    g.append([int(c, 16) for c in line.strip(' \t\n\r')])
+args = sys.argv[1:]
+check_shortest = "--shortest" in args
+if check_shortest:
+    args.remove("--shortest")
+if len(args) != 1:
+    print(f"Usage: python3 {sys.argv[0]} [--shortest] <output_file>")
+    sys.exit(1)
 
-for r in range(len(g)):
-    for c in range(len(g[0])):
-        v = g[r][c]
-        if not all([(r < 1 or v & 1 == (g[r-1][c] >> 2) & 1),
-                    (c >= len(g[0])-1 or (v >> 1) & 1 == (g[r][c+1] >> 3) & 1),
-                    (r >= len(g)-1 or (v >> 2) & 1 == g[r+1][c] & 1),
-                    (c < 1 or (v >> 3) & 1 == (g[r][c-1] >> 1) & 1)]):
-            print(f'Wrong encoding for ({c},{r})')
+report = MazeValidator(args[0], check_shortest=check_shortest).validate()
+print(json.dumps(report, indent=2))
+sys.exit(0 if report["valid"] else 1)
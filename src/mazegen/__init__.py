@@ -1,9 +1,11 @@
-from . import algo, config, grid, solve
+from . import algo, config, grid, io, rng, solve
 
 
 __all__ = [
     "algo",
     "config",
     "grid",
+    "io",
+    "rng",
     "solve"
 ]
@@ -1,9 +1,17 @@
 from mazegen.algo.maze_algo_dfs import MazeDFS
+from mazegen.algo.maze_algo_eller import MazeEller
+from mazegen.algo.maze_algo_kruskal import MazeKruskal
 from mazegen.algo.maze_algo_prim import MazePrim
+from mazegen.algo.maze_eller_rows import EllerRowGenerator
 from mazegen.algo.maze_imperfect import MazeImperfect
+from mazegen.algo.maze_tiled import MazeTiled
 
 __all__ = [
     "MazeDFS",
+    "MazeEller",
+    "MazeKruskal",
     "MazePrim",
-    "MazeImperfect"
+    "MazeImperfect",
+    "MazeTiled",
+    "EllerRowGenerator"
 ]
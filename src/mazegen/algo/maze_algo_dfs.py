@@ -1,12 +1,11 @@
-import random
-
 from mazegen.config.maze_config import Config, ConfigError
 from mazegen.maze_generator import MazeGenerator
 
 
 class MazeDFS(MazeGenerator):
-    def __init__(self: "MazeDFS", config: Config) -> None:
-        super().__init__(config)
+    def __init__(self: "MazeDFS", config: Config,
+                 cells_42: set[tuple[int, int]] | None = None) -> None:
+        super().__init__(config, cells_42)
 
     # added perfect maze generator
     def generate(self: "MazeDFS") -> None:
@@ -16,19 +15,16 @@ class MazeDFS(MazeGenerator):
         Uses DFS iterative backtracker algorithm.
         """
 
-        start = self.get_cell(self.entry[0], self.entry[1])
-        if start is None:
+        start_cell = self.get_cell(self.entry[0], self.entry[1])
+        if start_cell is None:
             raise ConfigError("Start cell cannot be None")
-        if start.visited:
+        if start_cell.visited:
             raise ConfigError("Start cell already visited")
-        if start.is_42:
+        if start_cell.is_42:
             raise ConfigError("Start cell cannot be inside 42 pattern")
+        start = start_cell.index
 
-        # Set random seed
-        if hasattr(self, "seed"):
-            random.seed(self.seed)
-
-        start.visited = True
+        self.visited[start] = True
         stack = [start]
 
         while stack:
@@ -36,10 +32,10 @@ class MazeDFS(MazeGenerator):
             neighbors = self.get_unvisited_neighbors(current)
             if neighbors:
                 # Choose a random neighbor
-                neighbor, direction = random.choice(neighbors)
+                neighbor, direction = self.rng.choice(neighbors)
                 # Remove wall between current and neighbor
                 self.remove_wall_btw(current, direction)
-                neighbor.visited = True
+                self.visited[neighbor] = True
                 stack.append(neighbor)
             else:
                 # Backtrack
@@ -0,0 +1,33 @@
+"""
+MazeEller class that generates a maze using Eller's algorithm.
+"""
+
+
+from mazegen.algo.maze_eller_rows import EllerRowGenerator
+from mazegen.config.maze_config import Config
+from mazegen.maze_generator import MazeGenerator
+
+
+class MazeEller(MazeGenerator):
+    """
+    Subclass of Grid.
+    Creates a maze using Eller's algorithm,
+    by filling the grid with the rows of an EllerRowGenerator.
+    To generate a maze without storing the whole grid,
+    use EllerRowGenerator directly.
+    """
+    def __init__(self: "MazeEller", config: Config,
+                 cells_42: set[tuple[int, int]] | None = None) -> None:
+        super().__init__(config, cells_42)
+        self.config = config
+
+    def generate(self: "MazeEller") -> None:
+        """A function the generate a maze using Eller's algorithm."""
+        generator = EllerRowGenerator(self.config, self.cells_42)
+        generator.rng = self.rng
+        rows = generator.generate_rows()
+        for y, row in enumerate(rows):
+            self.walls[y * self.width:(y + 1) * self.width] = row
+
+        # All cells are connected
+        self.visited.fill()
@@ -0,0 +1,95 @@
+"""
+MazeKruskal class that generates a maze using Kruskal's algorithm.
+"""
+
+
+from array import array
+from itertools import compress
+
+from mazegen.config.maze_config import Config
+from mazegen.grid.maze_cell import Cell
+from mazegen.maze_generator import MazeGenerator
+
+
+class MazeKruskal(MazeGenerator):
+    """
+    Subclass of Grid.
+    Creates a maze using Kruskal's algorithm.
+    """
+
+    # Translation tables from neighbor masks to 1 if the wall
+    # to the EAST or SOUTH neighbor can be removed
+    EAST_EDGES = bytes(1 if mask >> 4 & Cell.EAST else 0
+                       for mask in range(256))
+    SOUTH_EDGES = bytes(1 if mask >> 4 & Cell.SOUTH else 0
+                        for mask in range(256))
+
+    def __init__(self: "MazeKruskal", config: Config,
+                 cells_42: set[tuple[int, int]] | None = None) -> None:
+        super().__init__(config, cells_42)
+
+    def get_edges(self: "MazeKruskal") -> "array[int]":
+        """
+        Get all walls between two connectable cells.
+        Only count EAST and SOUTH to avoid double counting.
+        A wall is encoded as one int, the index of the cell shifted
+        by one bit, and the last bit set for SOUTH.
+        The walls are picked with translation tables and stored
+        in an array of 8 byte ints, in the order of the cells.
+        """
+        flags = bytearray(2 * self.size)
+        flags[0::2] = self.neighbor_mask.translate(self.EAST_EDGES)
+        flags[1::2] = self.neighbor_mask.translate(self.SOUTH_EDGES)
+        return array("q", compress(range(2 * self.size), flags))
+
+    def generate(self: "MazeKruskal") -> None:
+        """
+        A function the generate a maze using Kruskal's algorithm.
+
+        Every cell starts in its own set. The walls are shuffled once
+        in place with the generator of the maze,
+        then each wall between two cells of different sets is removed
+        and the two sets are joined, until all cells are in one set.
+        The sets are stored in a union-find parent array
+        with path halving and union by rank.
+        The 42 pattern cells are never part of a set.
+        """
+        edges = self.get_edges()
+        self.rng.shuffle(edges)
+
+        parent = array("i", range(self.size))
+        rank = bytearray(self.size)
+        offsets = (self.offsets[Cell.EAST], self.offsets[Cell.SOUTH])
+        dirs = (Cell.EAST, Cell.SOUTH)
+
+        # A spanning tree has one wall less than cells
+        remaining = self.size - self.is_42.count() - 1
+        for edge in edges:
+            if remaining <= 0:
+                break
+            cell = edge >> 1
+            neighbor = cell + offsets[edge & 1]
+
+            # Find the root of both sets, with path halving
+            root_a = cell
+            while parent[root_a] != root_a:
+                parent[root_a] = parent[parent[root_a]]
+                root_a = parent[root_a]
+            root_b = neighbor
+            while parent[root_b] != root_b:
+                parent[root_b] = parent[parent[root_b]]
+                root_b = parent[root_b]
+            if root_a == root_b:
+                continue
+
+            # Union by rank
+            if rank[root_a] < rank[root_b]:
+                root_a, root_b = root_b, root_a
+            parent[root_b] = root_a
+            if rank[root_a] == rank[root_b]:
+                rank[root_a] += 1
+
+            self.remove_wall_btw(cell, dirs[edge & 1])
+            self.visited[cell] = True
+            self.visited[neighbor] = True
+            remaining -= 1
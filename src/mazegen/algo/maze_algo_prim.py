@@ -3,8 +3,7 @@ MazePrim class that generates a maze using Prim's algorithm.
 """
 
 
-import random
-
+from mazegen.algo.maze_frontier import Frontier
 from mazegen.config.maze_config import Config, ConfigError
 from mazegen.maze_generator import MazeGenerator
 
@@ -14,8 +13,9 @@ class MazePrim(MazeGenerator):
     Subclass of Grid.
     Creates a maze using Prim's algorithm.
     """
-    def __init__(self: "MazePrim", config: Config) -> None:
-        super().__init__(config)
+    def __init__(self: "MazePrim", config: Config,
+                 cells_42: set[tuple[int, int]] | None = None) -> None:
+        super().__init__(config, cells_42)
 
     def generate(self: "MazePrim") -> None:
         """
@@ -25,40 +25,36 @@ class MazePrim(MazeGenerator):
         start: The entry cell.
         """
 
-        # Set random seed
-        if hasattr(self, "seed"):
-            random.seed(self.seed)
-
         # Start from the entry cell
-        start = self.get_cell(self.entry[0], self.entry[1])
-        if start is None:
+        start_cell = self.get_cell(self.entry[0], self.entry[1])
+        if start_cell is None:
             raise ConfigError("Start cell cannot be None")
-        if start.visited:
+        if start_cell.visited:
             raise ConfigError("Start cell already visited")
-        if start.is_42:
+        if start_cell.is_42:
             raise ConfigError("Start cell cannot be inside 42 pattern")
+        start = start_cell.index
 
-        start.visited = True
+        self.visited[start] = True
         # Get frontier
-        frontier = self.get_unvisited_neighbors(start)
+        frontier = Frontier(self.size)
+        for new_cell, _ in self.get_unvisited_neighbors(start):
+            frontier.add(new_cell)
         while frontier:
             # Randomly pick an cell from the frontier to go next
-            (new_cell, dir) = random.choice(frontier)
-            frontier.remove((new_cell, dir))
-
-            # Skip if the new_cell has already been visited
-            if new_cell.visited:
-                continue
+            new_cell = frontier.pop(self.rng.randbelow(len(frontier)))
 
             # Randomly choose a visited neighbor of the selected frontier cell
             neighbors = self.get_visited_neighbors(new_cell)
-            (neighbor, direction) = random.choice(neighbors)
+            (neighbor, direction) = self.rng.choice(neighbors)
 
             # Remove wall btw new_cell and visited neighbor
             self.remove_wall_btw(new_cell, direction)
 
             # Mark new_cell as visited
-            new_cell.visited = True
+            self.visited[new_cell] = True
 
-            # Add the unvisted neighbors of the new cell to the frontier
-            frontier.extend(self.get_unvisited_neighbors(new_cell))
+            # Add the unvisted neighbors of the new cell to the frontier,
+            # cells already in the frontier are not added twice
+            for neighbor, _ in self.get_unvisited_neighbors(new_cell):
+                frontier.add(neighbor)
@@ -0,0 +1,220 @@
+"""
+EllerRowGenerator class that generates a maze row by row
+using Eller's algorithm, without keeping the whole maze in memory.
+"""
+
+
+from collections.abc import Iterator
+
+from mazegen.config.maze_config import Config, ConfigError
+from mazegen.grid.maze_cell import Cell
+from mazegen.grid.maze_grid import Grid
+from mazegen.rng.maze_rng import MazeRNG, PythonRNG
+
+
+class EllerRowGenerator:
+    """
+    A class that generates a perfect maze with Eller's algorithm.
+    Only the set labels of the current row are kept in memory,
+    so the memory use depends on the width but not on the height.
+    Each finished row is yielded as a bytearray of wall values,
+    the same values as one row of Grid.walls.
+    """
+    def __init__(self: "EllerRowGenerator", config: Config,
+                 cells_42: set[tuple[int, int]] | None = None) -> None:
+        """
+        Initialize the generator with the size of the maze.
+
+        Args:
+            config (Config): The maze configuration.
+            cells_42 (set[tuple[int, int]] | None): The positions (x, y)
+            of the cells of the 42 pattern.
+            Default: the "42" pattern in the center of the maze.
+        """
+        self.width = config.width
+        self.height = config.height
+        self.entry = config.entry
+        self.exit = config.exit
+        if hasattr(config, "seed"):
+            self.seed = config.seed
+        self.rng: MazeRNG = PythonRNG(config.seed
+                                      if hasattr(config, "seed") else None)
+        if cells_42 is None:
+            cells_42 = Grid.get_42_cells(self.width, self.height)
+        self.cells_42 = cells_42
+
+        # Check if entry and exit points are in the 42 pattern
+        if self.entry in self.cells_42:
+            raise ConfigError("ConfigError: "
+                              "Entry point is inside 42 pattern.")
+        if self.exit in self.cells_42:
+            raise ConfigError("ConfigError: "
+                              "Exit point is inside 42 pattern.")
+
+    def get_row_42(self: "EllerRowGenerator", y: int) -> list[bool]:
+        """Get whether each cell of row y is part of the 42 pattern."""
+        return [(x, y) in self.cells_42 for x in range(self.width)]
+
+    def generate_rows(self: "EllerRowGenerator") -> Iterator[bytearray]:
+        """
+        Generate the maze and yield it row by row, from top to bottom.
+
+        If the 42 pattern reaches the last row (for the default pattern
+        only with a height of 5 or 6), sets that are separated by the
+        pattern in the last row can no longer be joined. In this case
+        the rows are kept and connected at the end.
+        """
+        last_row_42 = self.get_row_42(self.height - 1)
+        if not any(last_row_42):
+            yield from self.eller_rows()
+        else:
+            yield from self.connect_rows(list(self.eller_rows()))
+
+    def eller_rows(self: "EllerRowGenerator") -> Iterator[bytearray]:
+        """
+        Eller's algorithm, for each row:
+        - Step 1: Cells that are not connected to the row above
+          are put in a new set.
+        - Step 2: Randomly remove walls between neighboring cells
+          of different sets and join the sets.
+          In the last row, join all neighboring sets.
+        - Step 3: Join sets that cannot go down (the cells below are
+          in the 42 pattern) with a neighboring set.
+        - Step 4: Randomly remove at least one south wall of each set,
+          the cell below belongs to the same set.
+        The labels of the sets are always in the range 1 to width,
+        0 means no set (cell of the 42 pattern).
+        """
+        width = self.width
+        below = [0] * width
+        row_42 = self.get_row_42(0)
+
+        for y in range(self.height):
+            last = y == self.height - 1
+            walls = bytearray(b"\x0f") * width
+
+            # Step 1: keep sets linked from above, new sets for the others
+            labels = below
+            used = set(labels)
+            free = (label for label in range(1, width + 1)
+                    if label not in used)
+            for x in range(width):
+                if labels[x]:
+                    walls[x] &= ~Cell.NORTH
+                elif not row_42[x]:
+                    labels[x] = next(free)
+
+            # Union-find over the labels of this row
+            parent = list(range(width + 1))
+
+            def find(label: int) -> int:
+                while parent[label] != label:
+                    parent[label] = parent[parent[label]]
+                    label = parent[label]
+                return label
+
+            # Step 2: join neighboring sets, one coin flip per wall
+            flips = self.rng.coin_batch(width)
+            for x in range(width - 1):
+                if row_42[x] or row_42[x + 1]:
+                    continue
+                a = find(labels[x])
+                b = find(labels[x + 1])
+                if a != b and (last or flips[x]):
+                    parent[b] = a
+                    walls[x] &= ~Cell.EAST
+                    walls[x + 1] &= ~Cell.WEST
+
+            if last:
+                yield walls
+                return
+
+            # Step 3: join sets that have no cell above a free cell
+            next_42 = self.get_row_42(y + 1)
+            joined = True
+            while joined:
+                joined = False
+                can_go_down = {find(labels[x]) for x in range(width)
+                               if labels[x] and not next_42[x]}
+                for x in range(width - 1):
+                    if row_42[x] or row_42[x + 1]:
+                        continue
+                    a = find(labels[x])
+                    b = find(labels[x + 1])
+                    if a == b or (a in can_go_down and b in can_go_down):
+                        continue
+                    parent[b] = a
+                    walls[x] &= ~Cell.EAST
+                    walls[x + 1] &= ~Cell.WEST
+                    if b in can_go_down:
+                        can_go_down.add(a)
+                    joined = True
+
+            # Step 4: at least one cell of each set goes down
+            groups: dict[int, list[int]] = {}
+            for x in range(width):
+                if labels[x] and not next_42[x]:
+                    groups.setdefault(find(labels[x]), []).append(x)
+            below = [0] * width
+            flips = self.rng.coin_batch(width)
+            for root, cells in groups.items():
+                chosen = [x for x in cells if flips[x]]
+                if not chosen:
+                    chosen = [self.rng.choice(cells)]
+                for x in chosen:
+                    walls[x] &= ~Cell.SOUTH
+                    below[x] = root
+
+            row_42 = next_42
+            yield walls
+
+    def connect_rows(self: "EllerRowGenerator",
+                     rows: list[bytearray]) -> list[bytearray]:
+        """
+        Join the parts of a small maze that are not connected,
+        by removing walls between them in random order.
+
+        Args:
+            rows (list[bytearray]): All rows of the maze.
+        """
+        width = self.width
+        size = width * len(rows)
+        walls = bytearray().join(rows)
+        is_42 = [(i % width, i // width) in self.cells_42
+                 for i in range(size)]
+        parent = list(range(size))
+
+        def find(cell: int) -> int:
+            while parent[cell] != cell:
+                parent[cell] = parent[parent[cell]]
+                cell = parent[cell]
+            return cell
+
+        # Join the cells that are already connected,
+        # and collect the closed walls (EAST and SOUTH)
+        closed = []
+        for cell in range(size):
+            if is_42[cell]:
+                continue
+            if cell % width < width - 1 and not is_42[cell + 1]:
+                if walls[cell] & Cell.EAST:
+                    closed.append((cell, Cell.EAST))
+                else:
+                    parent[find(cell + 1)] = find(cell)
+            if cell + width < size and not is_42[cell + width]:
+                if walls[cell] & Cell.SOUTH:
+                    closed.append((cell, Cell.SOUTH))
+                else:
+                    parent[find(cell + width)] = find(cell)
+
+        self.rng.shuffle(closed)
+        for cell, dir in closed:
+            neighbor = cell + (1 if dir == Cell.EAST else width)
+            a = find(cell)
+            b = find(neighbor)
+            if a != b:
+                parent[b] = a
+                walls[cell] &= ~dir
+                walls[neighbor] &= ~Grid.get_opposite_direction(dir)
+
+        return [walls[y * width:(y + 1) * width] for y in range(len(rows))]
@@ -0,0 +1,56 @@
+"""
+Defines the class Frontier, the set of cells waiting to be connected
+to the maze in Prim's algorithm.
+"""
+
+from mazegen.grid.maze_bitset import BitSet
+
+
+class Frontier:
+    """
+    A set of cell indices that supports adding a cell
+    and removing the cell at a random position, both in O(1).
+    Each cell can only be in the frontier once,
+    membership is tracked with one bit per cell of the grid.
+    """
+
+    def __init__(self: "Frontier", size: int) -> None:
+        """
+        Creates an empty frontier.
+
+        Args:
+            size (int): The number of cells in the grid.
+        """
+        self.cells: list[int] = []
+        self.members = BitSet(size)
+
+    def __len__(self: "Frontier") -> int:
+        """Returns the number of cells in the frontier."""
+        return len(self.cells)
+
+    def __contains__(self: "Frontier", cell: int) -> bool:
+        """Check whether a cell is in the frontier."""
+        return self.members[cell]
+
+    def add(self: "Frontier", cell: int) -> None:
+        """Add a cell to the frontier if it is not already in it."""
+        if not self.members[cell]:
+            self.members[cell] = True
+            self.cells.append(cell)
+
+    def pop(self: "Frontier", position: int) -> int:
+        """
+        Remove and return the cell at a given position
+        by moving the last cell into its place.
+
+        Args:
+            position (int): The position in the frontier,
+            from 0 to len(frontier) - 1.
+        """
+        cells = self.cells
+        cell = cells[position]
+        last = cells.pop()
+        if position < len(cells):
+            cells[position] = last
+        self.members[cell] = False
+        return cell
@@ -4,11 +4,11 @@ by removing some walls from the perfect maze.
 """
 
 from __future__ import annotations
-import random
 from typing import TYPE_CHECKING
 
 from mazegen.grid.maze_cell import Cell
 from mazegen.grid.maze_grid import Grid
+from mazegen.rng.maze_rng import MazeRNG, PythonRNG
 # Import only for the type hint to avoid runtime import overhead
 if TYPE_CHECKING:
     from mazegen.config.maze_config import Config
@@ -30,38 +30,57 @@ class MazeImperfect(Grid):
             self.seed = config.seed
         if hasattr(config, "algo"):
             self.algo = config.algo
-        self.grid = maze.grid
+        self.rng: MazeRNG = PythonRNG(config.seed
+                                      if hasattr(config, "seed") else None)
+        # Share the arrays and the revision of the perfect maze
+        self.maze = maze
+        self.size = maze.size
+        self.cache = maze.cache
+        self.walls = maze.walls
+        self.visited = maze.visited
+        self.is_42 = maze.is_42
+        self.cells_42 = maze.cells_42
+        self.neighbor_mask = maze.neighbor_mask
+        self.offsets = maze.offsets
+        self.steps = maze.steps
+
+    @property
+    def revision(self: "MazeImperfect") -> int:
+        """
+        The revision of the walls, kept by the perfect maze, so that
+        walls changed through either maze change the revision of both.
+        """
+        return self.maze.revision
+
+    @revision.setter
+    def revision(self: "MazeImperfect", revision: int) -> None:
+        self.maze.revision = revision
 
-    def get_internal_walls(self: "MazeImperfect") -> list[tuple[Cell, int]]:
+    def get_internal_walls(self: "MazeImperfect") -> list[tuple[int, int]]:
         """
         Get a list of wall remianing walls inside of the maze.
         Only count EAST and SOUTH to avoid double counting.
         """
         all_walls = []
 
-        for y in range(self.height):
-            for x in range(self.width):
-                cell = self.grid[y][x]
-
-                if cell.is_42:
-                    continue
-
-                for dir in [Cell.EAST, Cell.SOUTH]:
-                    neighbor = self.get_neighbor(cell, dir)
-                    if neighbor is None or neighbor.is_42:
-                        continue
-                    if cell.has_wall(dir):
-                        all_walls.append((cell, dir))
+        walls = self.walls
+        neighbor_mask = self.neighbor_mask
+        for cell in range(self.size):
+            # Closed walls to a connectable neighbor
+            candidates = walls[cell] & neighbor_mask[cell] >> 4
+            for dir in (Cell.EAST, Cell.SOUTH):
+                if candidates & dir:
+                    all_walls.append((cell, dir))
 
         return all_walls
 
-    def check_2x2(self: "MazeImperfect", cell: "Cell", dir: int) -> bool:
+    def check_2x2(self: "MazeImperfect", cell: int, dir: int) -> bool:
         """
         Check whether removing a wall will create a open area of 2x2
         by checking if the given wall is the only wall inside of the square.
 
         Args:
-            cell (Cell): The top right cell of the square.
+            cell (int): The index of the top right cell of the square.
             dir (int): The direction of the wall to be checked.
             Can only be EAST or SOUTH to avoid double counting.
 
@@ -69,27 +88,26 @@ class MazeImperfect(Grid):
             bool: True if removing the wall will create a 2x2 open area.
             False if it would not.
         """
-        (x, y) = cell.pos
         tr = self.get_neighbor(cell, Cell.EAST)
-        if tr is None or tr.is_42:
+        if tr is None or self.is_42[tr]:
             return False
         bl = self.get_neighbor(cell, Cell.SOUTH)
-        if bl is None or bl.is_42:
+        if bl is None or self.is_42[bl]:
             return False
         br = self.get_neighbor(bl, Cell.EAST)
-        if br is None or br.is_42:
+        if br is None or self.is_42[br]:
             return False
         if dir == Cell.EAST:
-            if bl.has_wall(Cell.NORTH) or bl.has_wall(Cell.EAST) \
-               or br.has_wall(Cell.NORTH):
+            if self.has_wall(bl, Cell.NORTH) or self.has_wall(bl, Cell.EAST) \
+               or self.has_wall(br, Cell.NORTH):
                 return False
         if dir == Cell.SOUTH:
-            if tr.has_wall(Cell.WEST) or tr.has_wall(Cell.SOUTH) \
-               or br.has_wall(Cell.WEST):
+            if self.has_wall(tr, Cell.WEST) or self.has_wall(tr, Cell.SOUTH) \
+               or self.has_wall(br, Cell.WEST):
                 return False
         return True
 
-    def check_opening(self: "MazeImperfect", cell: Cell, dir: int) -> bool:
+    def check_opening(self: "MazeImperfect", cell: int, dir: int) -> bool:
         """
         Check whether removing a wall will create a open area
         of 3x3 or larger.
@@ -99,7 +117,6 @@ class MazeImperfect(Grid):
             bool: True if removing the wall will create a large open area.
             False if it would not.
         """
-        (x, y) = cell.pos
         if dir == Cell.SOUTH:
             res_right = self.check_2x2(cell, dir)
             cell_left = self.get_neighbor(cell, Cell.WEST)
@@ -122,9 +139,7 @@ class MazeImperfect(Grid):
         """
         all_walls = self.get_internal_walls()
 
-        if hasattr(self, "seed"):
-            random.seed(self.seed)
-        random.shuffle(all_walls)
+        self.rng.shuffle(all_walls)
 
         num_to_remove = int(len(all_walls) * rate)
         num_removed = 0
@@ -0,0 +1,242 @@
+"""
+MazeTiled class that generates a maze in tiles on multiple processes
+and stitches the tiles together.
+"""
+
+
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from mazegen.config.maze_config import Config
+from mazegen.grid.maze_cell import Cell
+from mazegen.grid.maze_grid import Grid
+from mazegen.maze_generator import MazeGenerator
+from mazegen.rng.maze_rng import PythonRNG
+
+# Task of one tile: algorithm, width, height, seed, 42 cells of the tile
+TileTask = tuple[str, int, int, str, set[tuple[int, int]]]
+# Result of one tile: walls, component of each cell (None if only one)
+TileResult = tuple[bytes, "array[int] | None"]
+
+
+class MazeTiled(MazeGenerator):
+    """
+    Subclass of Grid.
+    Splits the grid into tiles and generates each tile independently
+    in a process pool, using the algorithm in the config.
+    The seed of each tile is derived from the seed of the maze
+    and the position of the tile, so the maze is the same
+    for a given seed and number of workers.
+    The tiles are then joined by removing a random spanning set
+    of walls on the seams between them, so the maze stays perfect.
+    """
+
+    # Tiles are at least as big as the 42 pattern
+    MIN_TILE_WIDTH = 7
+    MIN_TILE_HEIGHT = 5
+
+    def __init__(self: "MazeTiled", config: Config,
+                 cells_42: set[tuple[int, int]] | None = None) -> None:
+        super().__init__(config, cells_42)
+        self.config = config
+        self.workers = config.workers if hasattr(config, "workers") else 1
+        # Check the algorithm before starting the workers
+        MazeGenerator.get_algorithm(config)
+
+    def get_tile_bounds(self: "MazeTiled") -> tuple[list[int], list[int]]:
+        """
+        Split the grid into about as many tiles as there are workers.
+
+        Returns:
+            tuple[list[int], list[int]]: The x positions of the columns
+            and the y positions of the rows of tiles,
+            including the right and bottom border of the grid.
+        """
+        tiles_y = 1
+        while tiles_y * tiles_y < self.workers:
+            tiles_y += 1
+        tiles_x = -(-self.workers // tiles_y)
+
+        tiles_x = max(1, min(tiles_x, self.width // self.MIN_TILE_WIDTH))
+        tiles_y = max(1, min(tiles_y, self.height // self.MIN_TILE_HEIGHT))
+
+        xs = [i * self.width // tiles_x for i in range(tiles_x + 1)]
+        ys = [i * self.height // tiles_y for i in range(tiles_y + 1)]
+        return xs, ys
+
+    @staticmethod
+    def generate_tile(task: TileTask) -> TileResult:
+        """
+        Generate one tile as a perfect maze. Runs in a worker process.
+
+        Args:
+            task (TileTask): The algorithm, width, height, seed
+            and 42 pattern cells of the tile.
+
+        Returns:
+            TileResult: The walls of the tile, and if the 42 pattern
+            is in the tile, the component of each cell of the tile.
+        """
+        algo, width, height, seed, cells_42 = task
+
+        # Use the first and last free cell as entry and exit
+        free = [(x, y) for y in range(height) for x in range(width)
+                if (x, y) not in cells_42]
+        config = Config({
+            "WIDTH": str(width),
+            "HEIGHT": str(height),
+            "ENTRY": f"{free[0][0]},{free[0][1]}",
+            "EXIT": f"{free[-1][0]},{free[-1][1]}",
+            "OUTPUT_FILE": "",
+            "PERFECT": "true",
+            "SEED": seed,
+            "ALGORITHM": algo
+        })
+        maze = MazeGenerator.get_algorithm(config)(config, cells_42)
+        maze.generate()
+
+        if not cells_42:
+            return bytes(maze.walls), None
+        components = MazeTiled.connect_components(maze)
+        return bytes(maze.walls), components
+
+    @staticmethod
+    def connect_components(maze: Grid) -> "array[int]":
+        """
+        The 42 pattern can split a tile into parts that the algorithm
+        does not reach from its start cell. Join all parts that
+        can be connected by removing walls between them in random order.
+
+        Returns:
+            array[int]: The component of each cell of the tile.
+        """
+        walls = maze.walls
+        neighbor_mask = maze.neighbor_mask
+        parent = array("i", range(maze.size))
+
+        def find(cell: int) -> int:
+            while parent[cell] != cell:
+                parent[cell] = parent[parent[cell]]
+                cell = parent[cell]
+            return cell
+
+        # Join the cells that are already connected,
+        # and collect the closed walls (EAST and SOUTH)
+        closed = []
+        for cell in range(maze.size):
+            connectable = neighbor_mask[cell] >> 4
+            for dir in (Cell.EAST, Cell.SOUTH):
+                if not connectable & dir:
+                    continue
+                if walls[cell] & dir:
+                    closed.append((cell, dir))
+                else:
+                    neighbor = cell + maze.offsets[dir]
+                    parent[find(neighbor)] = find(cell)
+
+        maze.rng.shuffle(closed)
+        for cell, dir in closed:
+            a = find(cell)
+            b = find(cell + maze.offsets[dir])
+            if a != b:
+                parent[b] = a
+                maze.remove_wall_btw(cell, dir)
+
+        return array("i", (find(cell) for cell in range(maze.size)))
+
+    def generate(self: "MazeTiled") -> None:
+        """
+        A function the generate a maze in tiles.
+        """
+        # Seed of the maze that the seeds of the tiles are derived from
+        if hasattr(self, "seed"):
+            seed = self.seed
+        else:
+            seed = str(self.rng.getrandbits(64))
+        algo = self.algo if hasattr(self, "algo") else "dfs"
+
+        xs, ys = self.get_tile_bounds()
+        tiles = [(xs[tx], ys[ty], xs[tx + 1] - xs[tx], ys[ty + 1] - ys[ty])
+                 for ty in range(len(ys) - 1) for tx in range(len(xs) - 1)]
+        tasks: list[TileTask] = []
+        for (x0, y0, width, height) in tiles:
+            cells_42 = {(x - x0, y - y0) for (x, y) in self.cells_42
+                        if x0 <= x < x0 + width and y0 <= y < y0 + height}
+            tasks.append((algo, width, height, f"{seed}:{x0},{y0}",
+                          cells_42))
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            results = list(executor.map(MazeTiled.generate_tile, tasks))
+
+        # Copy the tiles into the grid
+        for (x0, y0, width, height), (walls, _) in zip(tiles, results):
+            for y in range(height):
+                start = self.index(x0, y0 + y)
+                self.walls[start:start + width] = \
+                    walls[y * width:(y + 1) * width]
+
+        self.stitch_tiles(tiles, results, len(xs) - 1, seed)
+
+        # All cells are connected
+        self.visited.fill()
+
+    def stitch_tiles(self: "MazeTiled",
+                     tiles: list[tuple[int, int, int, int]],
+                     results: list[TileResult],
+                     tiles_x: int, seed: str) -> None:
+        """
+        Join the tiles by removing walls on the seams between them.
+        Each part of a tile (the whole tile if the 42 pattern is not in it)
+        is a node of a union-find. The walls on the seams are shuffled
+        and removed when they join two different nodes.
+        """
+        # Number the nodes of each tile from the number of cells
+        # in the tiles before it
+        bases = [0]
+        for (_, _, width, height) in tiles:
+            bases.append(bases[-1] + width * height)
+
+        def node(tile: int, x: int, y: int) -> int:
+            """Get the node of the cell at (x, y) in the tile."""
+            components = results[tile][1]
+            if components is None:
+                return bases[tile]
+            return bases[tile] + components[y * tiles[tile][2] + x]
+
+        # Collect the walls on the seams
+        seams = []
+        for tile, (x0, y0, width, height) in enumerate(tiles):
+            # Seam to the tile on the right
+            if (tile + 1) % tiles_x != 0:
+                for y in range(height):
+                    cell = self.index(x0 + width - 1, y0 + y)
+                    if self.neighbor_mask[cell] >> 4 & Cell.EAST:
+                        seams.append((cell, Cell.EAST,
+                                      node(tile, width - 1, y),
+                                      node(tile + 1, 0, y)))
+            # Seam to the tile below
+            if tile + tiles_x < len(tiles):
+                for x in range(width):
+                    cell = self.index(x0 + x, y0 + height - 1)
+                    if self.neighbor_mask[cell] >> 4 & Cell.SOUTH:
+                        seams.append((cell, Cell.SOUTH,
+                                      node(tile, x, height - 1),
+                                      node(tile + tiles_x, x, 0)))
+
+        PythonRNG(f"{seed}:seams").shuffle(seams)
+
+        parent: dict[int, int] = {}
+
+        def find(node: int) -> int:
+            parent.setdefault(node, node)
+            while parent[node] != node:
+                parent[node] = parent[parent[node]]
+                node = parent[node]
+            return node
+
+        for cell, dir, node_a, node_b in seams:
+            a = find(node_a)
+            b = find(node_b)
+            if a != b:
+                parent[b] = a
+                self.remove_wall_btw(cell, dir)
@@ -96,3 +96,41 @@ class Config():
             self.seed = config["SEED"]
         if "ALGORITHM" in config:
             self.algo = config["ALGORITHM"].lower()
+        if "SOLVER" in config:
+            self.solver = config["SOLVER"].lower()
+        if "COMPRESSION" in config:
+            self.compression = config["COMPRESSION"].lower()
+            if self.compression not in ("none", "gzip", "zlib", "lzma"):
+                raise ConfigError("ConfigError: "
+                                  "Invalid 'COMPRESSION' value.")
+        if "CACHE" in config:
+            self.cache = config["CACHE"].lower()
+            if self.cache != "true" and self.cache != "false":
+                raise ConfigError("ConfigError: Value of 'CACHE' invalid.")
+        if "CACHE_DIR" in config:
+            self.cache_dir = config["CACHE_DIR"]
+        if "CACHE_SIZE" in config:
+            try:
+                self.cache_size = int(config["CACHE_SIZE"])
+            except ValueError:
+                raise ValueError("ConfigError: "
+                                 "Value of 'CACHE_SIZE' is not a number.")
+            if self.cache_size < 0:
+                raise ConfigError("ConfigError: Invalid 'CACHE_SIZE' value.")
+        if "ANIMATION_SPEED" in config:
+            try:
+                self.animation_speed = int(config["ANIMATION_SPEED"])
+            except ValueError:
+                raise ValueError("ConfigError: "
+                                 "Value of 'ANIMATION_SPEED' is not a number.")
+            if self.animation_speed < 0:
+                raise ConfigError("ConfigError: "
+                                  "Invalid 'ANIMATION_SPEED' value.")
+        if "WORKERS" in config:
+            try:
+                self.workers = int(config["WORKERS"])
+            except ValueError:
+                raise ValueError("ConfigError: "
+                                 "Value of 'WORKERS' is not a number.")
+            if self.workers < 1:
+                raise ConfigError("ConfigError: Invalid 'WORKERS' value.")
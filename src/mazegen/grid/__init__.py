@@ -1,7 +1,9 @@
+from mazegen.grid.maze_bitset import BitSet
 from mazegen.grid.maze_cell import Cell
 from mazegen.grid.maze_grid import Grid
 
 __all__ = [
+    "BitSet",
     "Cell",
     "Grid"
 ]
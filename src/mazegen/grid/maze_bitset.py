@@ -0,0 +1,56 @@
+"""
+Defines the class BitSet, a fixed size set of flags packed 8 per byte.
+Used by Grid to store the 'visited' and 'is_42' status of all cells.
+"""
+
+
+class BitSet:
+    """
+    A class that represents a fixed number of boolean flags.
+    The flag of index i is stored in bit (i % 8) of byte (i // 8),
+    so a grid of n cells only needs n / 8 bytes per flag.
+    """
+
+    def __init__(self: "BitSet", size: int) -> None:
+        """
+        Creates a bit set with all flags unset.
+
+        Args:
+            size (int): The number of flags.
+        """
+        self.size = size
+        self.bits = bytearray((size + 7) >> 3)
+
+    def __len__(self: "BitSet") -> int:
+        """Returns the number of flags."""
+        return self.size
+
+    def __getitem__(self: "BitSet", index: int) -> bool:
+        """Check whether the flag at a given index is set."""
+        return bool(self.bits[index >> 3] >> (index & 7) & 1)
+
+    def __setitem__(self: "BitSet", index: int, value: bool) -> None:
+        """Set or unset the flag at a given index."""
+        if value:
+            self.bits[index >> 3] |= 1 << (index & 7)
+        else:
+            self.bits[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+
+    def clear(self: "BitSet") -> None:
+        """Unset all flags."""
+        self.bits[:] = bytes(len(self.bits))
+
+    def fill(self: "BitSet") -> None:
+        """Set all flags."""
+        self.bits[:] = b"\xff" * len(self.bits)
+        # Keep the unused bits of the last byte unset
+        if self.size & 7:
+            self.bits[-1] = (1 << (self.size & 7)) - 1
+
+    def copy_from(self: "BitSet", other: "BitSet") -> None:
+        """Overwrite all flags with the flags of another bit set."""
+        self.bits[:] = other.bits
+
+    def count(self: "BitSet") -> int:
+        """Count the number of set flags."""
+        return int.from_bytes(self.bits, "little").bit_count()
@@ -2,6 +2,13 @@
 Defines the class Cell which represents a cell in a maze.
 """
 
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+# Import only for the type hint to avoid circular imports
+if TYPE_CHECKING:
+    from mazegen.grid.maze_grid import Grid
+
 
 class Cell:
     """
@@ -14,6 +21,10 @@ class Cell:
     the east wall is the second bit,
     the south wall is the third bit,
     the west wall is the 4th bit.
+
+    The data of the cell is stored in the arrays of the Grid.
+    A Cell is only a lightweight view on one index of these arrays,
+    created on demand by Grid.get_cell().
     """
 
     # Constants for wall directions
@@ -21,32 +32,66 @@ class Cell:
     EAST = 2  # 0010
     SOUTH = 4  # 0100
     WEST = 8  # 1000
+    DIRS = (NORTH, EAST, SOUTH, WEST)
+
+    __slots__ = ("grid", "index")
 
-    def __init__(self: "Cell", pos: tuple[int, int], visited: bool = False,
-                 walls: int = 15, is_42: bool = False) -> None:
+    def __init__(self: "Cell", grid: Grid, index: int) -> None:
         """
-        Creates a cell.
+        Creates a view on a cell of a grid.
 
         Args:
-            pos (tuple): The position pf the cell (x, y).
-            visited (bool): Whether the cell has been visited. Default false.
-            walls (int): Value that represents the status of the 4 walls.
-                         Default 15, all 4 walls closed.
-            is_42 (bool): Whether the cell is part of the 42 pattern.
-                         Default false.
-            prev (tuple): The previous cell in the solution and the direction
-                        of the open wall from previous to current cell.
-                        Default (None, 0)
+            grid (Grid): The grid that stores the cell.
+            index (int): The flat index of the cell in the grid,
+                         y * width + x.
         """
-        self.pos = pos
-        self.visited = visited
-        self.walls = walls
-        self.is_42 = is_42
+        self.grid = grid
+        self.index = index
+
+    def __eq__(self: "Cell", other: object) -> bool:
+        """Two views are equal if they point to the same cell."""
+        if not isinstance(other, Cell):
+            return NotImplemented
+        return self.grid is other.grid and self.index == other.index
+
+    def __hash__(self: "Cell") -> int:
+        return hash((id(self.grid), self.index))
+
+    def __repr__(self: "Cell") -> str:
+        return f"Cell(pos={self.pos}, walls={self.walls})"
+
+    @property
+    def pos(self: "Cell") -> tuple[int, int]:
+        """The position of the cell (x, y)."""
+        return self.grid.get_pos(self.index)
+
+    @property
+    def visited(self: "Cell") -> bool:
+        """Whether the cell has been visited."""
+        return self.grid.visited[self.index]
+
+    @visited.setter
+    def visited(self: "Cell", value: bool) -> None:
+        self.grid.visited[self.index] = value
+
+    @property
+    def walls(self: "Cell") -> int:
+        """Value that represents the status of the 4 walls."""
+        return self.grid.walls[self.index]
+
+    @walls.setter
+    def walls(self: "Cell", value: int) -> None:
+        self.grid.walls[self.index] = value
+
+    @property
+    def is_42(self: "Cell") -> bool:
+        """Whether the cell is part of the 42 pattern."""
+        return self.grid.is_42[self.index]
 
     @classmethod
-    def get_dirs(cls: "type[Cell]") -> list[int]:
-        """Returns a list of all directions."""
-        return [cls.NORTH, cls.EAST, cls.SOUTH, cls.WEST]
+    def get_dirs(cls: "type[Cell]") -> tuple[int, ...]:
+        """Returns a tuple of all directions."""
+        return cls.DIRS
 
     @classmethod
     def dir_to_str(cls: "type[Cell]", dir: int) -> str | None:
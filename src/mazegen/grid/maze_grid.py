@@ -1,20 +1,56 @@
 """
 Generate a grid with all closed cells and a 42 pattern in the center.
-Defines class Grid -- a 2D array, each element is a Cell.
+Defines class Grid -- a flat array of wall values, one per cell.
 """
 
+from typing import TYPE_CHECKING
+
 from mazegen.config.maze_config import Config, ConfigError
+from mazegen.grid.maze_bitset import BitSet
 from mazegen.grid.maze_cell import Cell
+from mazegen.rng.maze_rng import MazeRNG, PythonRNG
+# Import only for the type hint to avoid circular imports
+if TYPE_CHECKING:
+    from mazegen.io.maze_cache import MazeCache
 
 
 class Grid:
     """
-    A class that represents a grid, which is a 2D array.
-    Each element in the grid is a Cell.
+    A class that represents a grid.
+    The cells are stored row by row in flat arrays,
+    the cell at position (x, y) has the index y * width + x:
+    - walls (bytearray): The walls value of each cell.
+    - visited (BitSet): Whether each cell has been visited.
+    - is_42 (BitSet): Whether each cell is part of the 42 pattern.
+    - rng (MazeRNG): The random number generator of the maze,
+      seeded with the seed of the config.
+    - neighbor_mask (bytearray): The directions in which each cell has
+      a neighbor inside of the grid (low 4 bits), and the directions
+      of those neighbors that can be connected to the cell (high 4 bits),
+      i.e. neither the cell nor the neighbor is part of the 42 pattern.
+    - revision (int): Incremented each time a wall is removed with
+      remove_wall_btw() or added with add_wall_btw(), so that
+      cached solutions can tell that the walls have changed.
+    - cache (MazeCache | None): The cache the maze was generated with,
+      where the solvers also keep its solutions (see MazeSolver.solve).
+    Cell objects are only created as views when asked for by get_cell().
     """
 
-    def __init__(self: "Grid", config: Config) -> None:
-        """Initialize the grid with a given width and height."""
+    # Opposite of each direction, indexed by direction
+    OPPOSITE = (0, Cell.SOUTH, Cell.WEST, 0, Cell.NORTH,
+                0, 0, 0, Cell.EAST)
+
+    def __init__(self: "Grid", config: Config,
+                 cells_42: set[tuple[int, int]] | None = None) -> None:
+        """
+        Initialize the grid with a given width and height.
+
+        Args:
+            config (Config): The maze configuration.
+            cells_42 (set[tuple[int, int]] | None): The positions (x, y)
+            of the cells to close as the 42 pattern.
+            Default: the "42" pattern in the center of the grid.
+        """
         self.width = config.width
         self.height = config.height
         self.entry = config.entry
@@ -24,28 +60,83 @@ class Grid:
             self.seed = config.seed
         if hasattr(config, "algo"):
             self.algo = config.algo
-        self.grid = self.make_grid()
-        if self.width >= 7 and self.height >= 5:
+        self.rng: MazeRNG = PythonRNG(config.seed
+                                      if hasattr(config, "seed") else None)
+        self.size = self.width * self.height
+        self.revision = 0
+        self.cache: MazeCache | None = None
+        self.walls = self.make_grid()
+        self.visited = BitSet(self.size)
+        self.is_42 = BitSet(self.size)
+        self.make_neighbor_table()
+        if cells_42 is None:
+            cells_42 = self.get_42_cells(self.width, self.height)
+        self.cells_42 = cells_42
+        if self.cells_42:
             self.make_42()
 
-    def make_grid(self: "Grid") -> list[list[Cell]]:
+    def make_grid(self: "Grid") -> bytearray:
         """
-        Create a grid with each cell having default values.
+        Create the walls of a grid with all walls of all cells closed.
         """
-        grid = []
-        for y in range(self.height):
-            row = []
-            for x in range(self.width):
-                cell = Cell((x, y))
-                row.append(cell)
-            grid.append(row)
-        return grid
+        return bytearray(b"\x0f") * self.size
 
-    def make_42(self: "Grid") -> None:
+    def make_neighbor_table(self: "Grid") -> None:
         """
-        If the grid is big enough, reserve a part with closed cells
-        in a "42" pattern in the center of the grid.
+        Precompute the neighbors of all cells, so that finding a neighbor
+        is a table lookup instead of a bounds check:
+        - offsets: The index offset of the neighbor in each direction.
+        - steps: For each 4 bit mask of directions, the pairs of
+          (direction, offset) of the directions in the mask.
+        - neighbor_mask: See the class docstring.
+        """
+        self.offsets = {
+            Cell.NORTH: -self.width,
+            Cell.EAST: 1,
+            Cell.SOUTH: self.width,
+            Cell.WEST: -1
+        }
+        self.steps = tuple(
+            tuple((dir, self.offsets[dir])
+                  for dir in Cell.get_dirs() if mask & dir)
+            for mask in range(16)
+        )
+
+        # Every row has no neighbor to the west of the first cell
+        # and to the east of the last cell
+        row = bytearray(b"\x0f") * self.width
+        row[0] &= ~Cell.WEST
+        row[-1] &= ~Cell.EAST
+        table = row * self.height
+        # The first and last row have no neighbor to the north and south
+        last_row = self.size - self.width
+        for x in range(self.width):
+            table[x] &= ~Cell.NORTH
+            table[last_row + x] &= ~Cell.SOUTH
+        # Copy the low 4 bits to the high 4 bits
+        self.neighbor_mask = table.translate(
+            bytes((b * 17) & 0xFF for b in range(256)))
+
+    def exclude_from_neighbors(self: "Grid", index: int) -> None:
+        """
+        Mark a cell in the neighbor table as unconnectable,
+        for the cell itself and for all of its neighbors.
+        """
+        mask = self.neighbor_mask
+        for dir, offset in self.steps[mask[index] & 15]:
+            mask[index + offset] &= ~(self.OPPOSITE[dir] << 4)
+        mask[index] &= 15
+
+    @staticmethod
+    def get_42_cells(width: int, height: int) -> set[tuple[int, int]]:
+        """
+        Get the positions (x, y) of the cells of the "42" pattern
+        in the center of a grid of the given size.
+        The set is empty if the grid is too small for the pattern.
         """
+        if width < 7 or height < 5:
+            return set()
+
         # Predefine 42 pattern, 0 = empty, 1 = filled
         pattern = [
             [1, 0, 0, 0, 1, 1, 1],
@@ -60,25 +151,36 @@ class Grid:
         pattern_width = len(pattern[0])
 
         # Find center of the grid
-        center_x = self.width // 2
-        center_y = self.height // 2
+        center_x = width // 2
+        center_y = height // 2
 
         # Find starting point, top left of the 42 pattern
         start_x = center_x - pattern_width // 2
         start_y = center_y - pattern_height // 2
 
-        # Apply pattern to grid
+        cells = set()
         for py in range(pattern_height):
             for px in range(pattern_width):
                 grid_x = start_x + px
                 grid_y = start_y + py
 
-                if 0 <= grid_x < self.width and 0 <= grid_y < self.height:
+                if 0 <= grid_x < width and 0 <= grid_y < height:
                     if pattern[py][px] == 1:
-                        cell = self.grid[grid_y][grid_x]
-                        cell.is_42 = True
-                        cell.walls = 15
-                        cell.visited = True
+                        cells.add((grid_x, grid_y))
+        return cells
+
+    def make_42(self: "Grid") -> None:
+        """
+        If the grid is big enough, reserve a part with closed cells
+        in a "42" pattern in the center of the grid.
+        """
+        # Apply pattern to grid
+        for (x, y) in sorted(self.cells_42):
+            index = self.index(x, y)
+            self.is_42[index] = True
+            self.walls[index] = 15
+            self.visited[index] = True
+            self.exclude_from_neighbors(index)
 
         # Check if entry and exit points are in the 42 pattern
         entry_cell = self.get_cell(self.entry[0], self.entry[1])
@@ -93,69 +195,76 @@ class Grid:
             raise ConfigError("ConfigError: "
                               "Exit point is inside 42 pattern.")
 
+    def index(self: "Grid", x: int, y: int) -> int:
+        """Get the flat index of the cell at position (x, y)."""
+        return y * self.width + x
+
+    def get_pos(self: "Grid", index: int) -> tuple[int, int]:
+        """Get the position (x, y) of the cell at a flat index."""
+        y, x = divmod(index, self.width)
+        return (x, y)
+
     def get_cell(self: "Grid", x: int, y: int) -> Cell | None:
-        """Get cell at position (x, y)."""
+        """Get a view on the cell at position (x, y)."""
         if 0 <= x < self.width and 0 <= y < self.height:
-            return self.grid[y][x]
+            return Cell(self, y * self.width + x)
         return None
 
-    def get_neighbor(self: "Grid", cell: Cell, direction: int) -> Cell | None:
-        """Get neightbor in the given direction."""
-        x, y = cell.pos
-        if direction == Cell.NORTH:
-            neighbor = self.get_cell(x, y - 1)
-        elif direction == Cell.EAST:
-            neighbor = self.get_cell(x + 1, y)
-        elif direction == Cell.SOUTH:
-            neighbor = self.get_cell(x, y + 1)
-        elif direction == Cell.WEST:
-            neighbor = self.get_cell(x - 1, y)
-        else:
+    def has_wall(self: "Grid", index: int, direction: int) -> bool:
+        """Check whether a cell has a wall in a given direction."""
+        return bool(self.walls[index] & direction)
+
+    def get_neighbor(self: "Grid", index: int, direction: int) -> int | None:
+        """Get the index of the neighbor in the given direction."""
+        offset = self.offsets.get(direction)
+        if offset is None or not self.neighbor_mask[index] & direction:
             return None
-        return neighbor
+        return index + offset
 
     # added unvidited neighbors
     def get_unvisited_neighbors(self: "Grid",
-                                cell: Cell) -> list[tuple[Cell, int]]:
-        neighbors = []
-
-        for direction in Cell.get_dirs():
-            neighbor = self.get_neighbor(cell, direction)
-            if neighbor and not neighbor.visited and not neighbor.is_42:
-                neighbors.append((neighbor, direction))
-        return neighbors
+                                index: int) -> list[tuple[int, int]]:
+        """Get a list of neighbors that are not visited yet."""
+        visited = self.visited
+        return [(index + offset, dir)
+                for dir, offset in self.steps[self.neighbor_mask[index] >> 4]
+                if not visited[index + offset]]
 
     def get_visited_neighbors(self: "Grid",
-                              cell: Cell) -> list[tuple[Cell, int]]:
+                              index: int) -> list[tuple[int, int]]:
         """Get a list of neighbors that are already visited."""
-        neighbors = []
+        visited = self.visited
+        return [(index + offset, dir)
+                for dir, offset in self.steps[self.neighbor_mask[index] >> 4]
+                if visited[index + offset]]
 
-        for direction in Cell.get_dirs():
-            neighbor = self.get_neighbor(cell, direction)
-            if neighbor and neighbor.visited and not neighbor.is_42:
-                neighbors.append((neighbor, direction))
-        return neighbors
+    def get_open_neighbors(self: "Grid", index: int) -> list[tuple[int, int]]:
+        """Get a list of neighbors that are not separated by a wall."""
+        open_dirs = (self.walls[index] ^ 15) & self.neighbor_mask[index]
+        return [(index + offset, dir)
+                for dir, offset in self.steps[open_dirs]]
 
-    @staticmethod
-    def get_opposite_direction(direction: int) -> int:
+    @classmethod
+    def get_opposite_direction(cls: "type[Grid]", direction: int) -> int:
         """Get the opposite wall direction."""
-        opposites = {
-            Cell.NORTH: Cell.SOUTH,
-            Cell.SOUTH: Cell.NORTH,
-            Cell.EAST: Cell.WEST,
-            Cell.WEST: Cell.EAST
-        }
-        return opposites[direction]
+        return cls.OPPOSITE[direction]
 
-    def remove_wall_btw(self: "Grid", cell: Cell, direction: int) -> None:
+    def remove_wall_btw(self: "Grid", index: int, direction: int) -> None:
         """Remove a wall between two cells."""
-        if cell.is_42:
+        if not self.neighbor_mask[index] >> 4 & direction:
             return
 
-        neighbor = self.get_neighbor(cell, direction)
-        if neighbor is None or neighbor.is_42:
+        neighbor = index + self.offsets[direction]
+        self.walls[index] &= ~direction
+        self.walls[neighbor] &= ~self.OPPOSITE[direction]
+        self.revision += 1
+
+    def add_wall_btw(self: "Grid", index: int, direction: int) -> None:
+        """Add a wall between two cells."""
+        if not self.neighbor_mask[index] >> 4 & direction:
             return
 
-        cell.remove_wall(direction)
-        opp_dir = self.get_opposite_direction(direction)
-        neighbor.remove_wall(opp_dir)
+        neighbor = index + self.offsets[direction]
+        self.walls[index] |= direction
+        self.walls[neighbor] |= self.OPPOSITE[direction]
+        self.revision += 1
@@ -0,0 +1,13 @@
+from mazegen.io.maze_cache import MazeCache
+from mazegen.io.maze_compression import MazeCompression
+from mazegen.io.maze_loader import load_maze
+from mazegen.io.maze_packed import MazePacked
+from mazegen.io.maze_validator import MazeValidator
+
+__all__ = [
+    "MazeCache",
+    "MazeCompression",
+    "MazePacked",
+    "MazeValidator",
+    "load_maze"
+]
@@ -0,0 +1,247 @@
+"""
+Defines the class MazeCache, a cache of generated mazes and of their
+solutions on the local disk, with a size limit.
+"""
+
+from __future__ import annotations
+import hashlib
+import json
+import os
+import struct
+import tempfile
+from typing import TYPE_CHECKING
+
+from mazegen.io.maze_packed import MazePacked
+
+# Import only for the type hint to avoid runtime import overhead
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from mazegen.config.maze_config import Config
+    from mazegen.grid.maze_grid import Grid
+
+
+class MazeCache:
+    """
+    A class that stores generated mazes and their solutions in files
+    named after a hash of what they depend on:
+    - A maze (.mzb, in the packed format of MazePacked) depends on the
+      config: size, entry, exit, PERFECT, SEED, ALGORITHM and WORKERS.
+      Only mazes generated with a SEED are stored, the others
+      are random.
+    - A solution (.sol) depends on the walls, entry and exit of
+      the maze and on the solver.
+    Both keys include REVISION and the version of the packed format,
+    so that entries written before a change are never read.
+    The cache is only used when the config sets CACHE to true.
+
+    Each entry is written to a temporary file and renamed,
+    so several processes can share the cache. The modification time
+    of an entry is updated when it is read, and the least recently
+    used entries are removed when the cache is larger than its limit.
+    """
+
+    # Revision of the generators and solvers: must be increased with
+    # any change to the maze generated from a config or to a solution
+    REVISION = 1
+    # Default size limit of the cache, in bytes
+    MAX_SIZE = 256 << 20
+    # Header of a solution file: number of steps
+    SOLUTION_HEADER = struct.Struct("<I")
+    # Number of steps stored for a maze without solution
+    NO_SOLUTION = 0xFFFFFFFF
+
+    def __init__(self: "MazeCache", directory: str | None = None,
+                 max_size: int = MAX_SIZE) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            directory (str | None): The directory of the cache.
+            Default: $MAZEGEN_CACHE_DIR, or mazegen in the user cache
+            directory ($XDG_CACHE_HOME or ~/.cache).
+            max_size (int): The size limit of the cache, in bytes.
+        """
+        if directory is None:
+            directory = os.environ.get("MAZEGEN_CACHE_DIR")
+        if directory is None:
+            base = os.environ.get("XDG_CACHE_HOME",
+                                  os.path.join(os.path.expanduser("~"),
+                                               ".cache"))
+            directory = os.path.join(base, "mazegen")
+        self.directory = directory
+        self.max_size = max_size
+
+    @classmethod
+    def from_config(cls: "type[MazeCache]",
+                    config: Config) -> "MazeCache | None":
+        """
+        Get the cache of a config, with the CACHE_DIR and CACHE_SIZE
+        (in MB) keys if they exist.
+
+        Returns:
+            MazeCache | None: The cache, None if CACHE is not true
+            (the default) or if the config has no SEED
+            (the maze is random).
+        """
+        if not hasattr(config, "cache") or config.cache != "true":
+            return None
+        if not hasattr(config, "seed"):
+            return None
+        directory = config.cache_dir if hasattr(config, "cache_dir") else None
+        max_size = (config.cache_size << 20 if hasattr(config, "cache_size")
+                    else cls.MAX_SIZE)
+        return cls(directory, max_size)
+
+    @classmethod
+    def get_config_key(cls: "type[MazeCache]", config: Config) -> str:
+        """Get the key of the maze generated from a config."""
+        normalized = {
+            "revision": cls.REVISION,
+            "format": MazePacked.VERSION,
+            "width": config.width,
+            "height": config.height,
+            "entry": list(config.entry),
+            "exit": list(config.exit),
+            "perfect": config.perfect,
+            "seed": config.seed if hasattr(config, "seed") else None,
+            "algorithm": config.algo if hasattr(config, "algo") else "dfs",
+            "workers": config.workers if hasattr(config, "workers") else 1
+        }
+        text = json.dumps(normalized, sort_keys=True)
+        return hashlib.sha256(text.encode()).hexdigest()
+
+    @classmethod
+    def get_solution_key(cls: "type[MazeCache]", maze: Grid,
+                         solver: str) -> str:
+        """Get the key of the solution of a maze found by a solver."""
+        digest = hashlib.sha256(f"{cls.REVISION} {solver} {maze.width} "
+                                f"{maze.height} {maze.entry} {maze.exit} "
+                                .encode())
+        digest.update(maze.walls)
+        return digest.hexdigest()
+
+    def get_path(self: "MazeCache", key: str, extension: str) -> str:
+        """Get the path of the file of an entry."""
+        return os.path.join(self.directory, key + extension)
+
+    def load_walls(self: "MazeCache", key: str) -> bytearray | None:
+        """
+        Read the walls of a maze.
+
+        Returns:
+            bytearray | None: The walls value of each cell,
+            None if the maze is not in the cache.
+        """
+        path = self.get_path(key, MazePacked.EXTENSION)
+        try:
+            with MazePacked(path) as packed:
+                walls = packed.get_cells(0, packed.size)
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return walls
+
+    def store_maze(self: "MazeCache", key: str, maze: Grid) -> None:
+        """Write a maze to the cache, without its solution."""
+        self.store(key, MazePacked.EXTENSION,
+                   lambda path: MazePacked.write(path, maze, None))
+
+    def load_solution(self: "MazeCache",
+                      key: str) -> tuple[bool, list[int] | None]:
+        """
+        Read the solution of a maze.
+
+        Returns:
+            tuple[bool, list[int] | None]: Whether the solution is
+            in the cache, and the solution (None if the maze
+            has no solution).
+        """
+        path = self.get_path(key, ".sol")
+        try:
+            with open(path, "rb") as fd:
+                data = fd.read()
+            os.utime(path)
+            (length,) = self.SOLUTION_HEADER.unpack_from(data)
+        except (OSError, struct.error):
+            return False, None
+        if length == self.NO_SOLUTION:
+            return True, None
+
+        packed = data[self.SOLUTION_HEADER.size:]
+        if 4 * len(packed) < length:
+            return False, None
+        return True, MazePacked.unpack_solution(packed, length)
+
+    def store_solution(self: "MazeCache", key: str,
+                       solution: list[int] | None) -> None:
+        """Write the solution of a maze to the cache."""
+        if solution is None:
+            data = self.SOLUTION_HEADER.pack(self.NO_SOLUTION)
+        else:
+            data = (self.SOLUTION_HEADER.pack(len(solution))
+                    + MazePacked.pack_solution(solution))
+
+        def write(path: str) -> None:
+            with open(path, "wb") as fd:
+                fd.write(data)
+
+        self.store(key, ".sol", write)
+
+    def store(self: "MazeCache", key: str, extension: str,
+              write: Callable[[str], None]) -> None:
+        """
+        Write an entry to a temporary file with a function, rename it,
+        and remove the least recently used entries if needed.
+        A cache that cannot be written is ignored.
+        """
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, temp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            os.close(fd)
+            try:
+                write(temp)
+                os.replace(temp, self.get_path(key, extension))
+            finally:
+                if os.path.exists(temp):
+                    os.remove(temp)
+            self.evict()
+        except OSError:
+            pass
+
+    def evict(self: "MazeCache", max_size: int | None = None) -> None:
+        """
+        Remove the least recently used entries until the cache
+        is not larger than a size (default: the size limit).
+        """
+        if max_size is None:
+            max_size = self.max_size
+        entries = []
+        total = 0
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if not entry.name.endswith((MazePacked.EXTENSION, ".sol")):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+        if total <= max_size:
+            return
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
+
+    def clear(self: "MazeCache") -> None:
+        """Remove all entries of the cache."""
+        if os.path.isdir(self.directory):
+            self.evict(-1)
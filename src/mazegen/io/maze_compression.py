@@ -0,0 +1,169 @@
+"""
+Defines the class MazeCompression, which opens maze files compressed
+with gzip, zlib or lzma as binary streams, and the raw streams
+ZlibReader and ZlibWriter for the zlib format.
+"""
+
+from __future__ import annotations
+import gzip
+import io
+import lzma
+import zlib
+from typing import IO, TYPE_CHECKING
+
+# Import only for the type hint to avoid runtime import overhead
+if TYPE_CHECKING:
+    from collections.abc import Buffer
+
+    from mazegen.config.maze_config import Config
+
+
+class MazeCompression:
+    """
+    A class that opens maze files, compressed or not.
+    The format is chosen from the extension of the file or from the
+    COMPRESSION key of the config when writing, and from the first
+    bytes of the file when reading, so a file can be loaded
+    whatever its name. The data goes through a buffer, so it is
+    compressed and decompressed by chunks of BUFFER_SIZE bytes,
+    never as a whole.
+    """
+
+    NONE = "none"
+    GZIP = "gzip"
+    ZLIB = "zlib"
+    LZMA = "lzma"
+    FORMATS = (NONE, GZIP, ZLIB, LZMA)
+    EXTENSIONS = {".gz": GZIP, ".zz": ZLIB, ".xz": LZMA}
+    # First bytes of each format (a zlib stream starts with 0x78
+    # for the default window size, which is not a hex digit)
+    MAGIC = {b"\x1f\x8b": GZIP, b"\x78": ZLIB, b"\xfd7zXZ\x00": LZMA}
+    # Compression level of gzip and zlib
+    LEVEL = 6
+    # Size of the chunks compressed and decompressed at once
+    BUFFER_SIZE = 1 << 20
+
+    @classmethod
+    def get_format(cls: "type[MazeCompression]", path: str,
+                   config: Config | None = None) -> str:
+        """
+        Get the compression format to write a file with.
+
+        Args:
+            path (str): The path to the file.
+            config (Config | None): The config, whose COMPRESSION key
+            is used if the extension is not one of a compressed format.
+
+        Returns:
+            str: The format, one of FORMATS.
+        """
+        for extension, format in cls.EXTENSIONS.items():
+            if path.endswith(extension):
+                return format
+        if config is not None and hasattr(config, "compression"):
+            return str(config.compression)
+        return cls.NONE
+
+    @classmethod
+    def detect_format(cls: "type[MazeCompression]", path: str) -> str:
+        """Get the compression format of a file from its first bytes."""
+        with open(path, "rb") as fd:
+            start = fd.read(6)
+        for magic, format in cls.MAGIC.items():
+            if start.startswith(magic):
+                return format
+        return cls.NONE
+
+    @classmethod
+    def open(cls: "type[MazeCompression]", path: str, mode: str,
+             format: str | None = None) -> IO[bytes]:
+        """
+        Open a file as a buffered binary stream.
+
+        Args:
+            path (str): The path to the file.
+            mode (str): "rb" to read, "wb" to write.
+            format (str | None): The compression format.
+            Default: found from the first bytes when reading,
+            none when writing.
+
+        Returns:
+            IO[bytes]: The stream of the uncompressed data.
+
+        Raises:
+            ValueError: If the format is not one of FORMATS.
+        """
+        if format is None:
+            format = cls.detect_format(path) if mode == "rb" else cls.NONE
+        if format not in cls.FORMATS:
+            raise ValueError(f"MazeCompression: Unknown format '{format}'.")
+
+        stream: io.RawIOBase | io.BufferedIOBase | lzma.LZMAFile
+        if format == cls.NONE:
+            return open(path, mode, buffering=cls.BUFFER_SIZE)
+        elif format == cls.GZIP:
+            stream = gzip.GzipFile(path, mode, compresslevel=cls.LEVEL)
+        elif format == cls.ZLIB:
+            file = open(path, mode)
+            stream = (ZlibReader(file) if mode == "rb"
+                      else ZlibWriter(file, cls.LEVEL))
+        else:
+            stream = lzma.LZMAFile(path, mode)
+
+        if mode == "rb":
+            return io.BufferedReader(stream, cls.BUFFER_SIZE)
+        return io.BufferedWriter(stream, cls.BUFFER_SIZE)
+
+
+class ZlibReader(io.RawIOBase):
+    """A raw stream that decompresses a zlib file chunk by chunk."""
+
+    def __init__(self: "ZlibReader", file: IO[bytes]) -> None:
+        self.file = file
+        self.decompressor = zlib.decompressobj()
+        self.pending = b""
+
+    def readable(self: "ZlibReader") -> bool:
+        return True
+
+    def readinto(self: "ZlibReader", buffer: Buffer) -> int:
+        """Decompress at most the size of the buffer into it."""
+        view = memoryview(buffer).cast("B")
+        data = b""
+        while not data and not self.decompressor.eof:
+            if not self.pending:
+                self.pending = self.file.read(MazeCompression.BUFFER_SIZE)
+                if not self.pending:
+                    break
+            data = self.decompressor.decompress(self.pending, len(view))
+            self.pending = self.decompressor.unconsumed_tail
+        view[:len(data)] = data
+        return len(data)
+
+    def close(self: "ZlibReader") -> None:
+        if not self.closed:
+            self.file.close()
+        super().close()
+
+
+class ZlibWriter(io.RawIOBase):
+    """A raw stream that compresses into a zlib file chunk by chunk."""
+
+    def __init__(self: "ZlibWriter", file: IO[bytes], level: int) -> None:
+        self.file = file
+        self.compressor = zlib.compressobj(level)
+
+    def writable(self: "ZlibWriter") -> bool:
+        return True
+
+    def write(self: "ZlibWriter", data: Buffer) -> int:
+        """Compress the data and write what is ready."""
+        view = memoryview(data)
+        self.file.write(self.compressor.compress(view))
+        return view.nbytes
+
+    def close(self: "ZlibWriter") -> None:
+        if not self.closed:
+            self.file.write(self.compressor.flush())
+            self.file.close()
+        super().close()
@@ -0,0 +1,163 @@
+"""
+Load a maze from an output file back into a Grid.
+
+The text format written by OutputWriter is decoded row by row with
+translation tables, so even huge files are loaded at the speed
+of reading them. Compressed files are decompressed row by row
+as well. Files in the packed binary format are loaded
+with MazePacked.
+"""
+
+from mazegen.config.maze_config import Config, ConfigError
+from mazegen.grid.maze_cell import Cell
+from mazegen.grid.maze_grid import Grid
+from mazegen.io.maze_compression import MazeCompression
+from mazegen.io.maze_packed import MazePacked
+
+# Translation table from hex digits to wall values,
+# and the characters that are not hex digits
+HEX_VALUES = bytes.maketrans(b"0123456789ABCDEFabcdef",
+                             bytes(range(16)) + bytes(range(10, 16)))
+HEX_DIGITS = b"0123456789ABCDEFabcdef"
+# Translation table from letters to directions
+DIR_VALUES = bytes.maketrans(b"NESW", bytes(Cell.DIRS))
+# Number of open walls of each wall value
+OPEN_WALLS = bytes(bin(walls ^ 15).count("1") if walls < 16 else 0
+                   for walls in range(256))
+# Translation tables from wall values to 1 if the wall
+# of a direction is closed, 0 otherwise
+WALL_BITS = {dir: bytes(1 if walls & dir else 0 for walls in range(256))
+             for dir in Cell.DIRS}
+
+
+def load_maze(path: str) -> tuple[Grid, list[int] | None]:
+    """
+    Load a maze from a file written by OutputWriter.
+
+    Args:
+        path (str): The path to the file, in the text format
+        (compressed with gzip, zlib or lzma or not) or,
+        with the extension .mzb, in the packed binary format.
+
+    Returns:
+        tuple[Grid, list[int] | None]: The maze, with its entry, exit
+        and 42 pattern, and the solution written in the file
+        (None if there is no solution).
+
+    Raises:
+        ValueError: If the file is not a valid maze file, or if its
+        walls are open on the border or differ between neighbors.
+        OSError: If the file cannot be read.
+    """
+    if path.endswith(MazePacked.EXTENSION):
+        with MazePacked(path) as packed:
+            grid = packed.to_grid()
+            check_walls(grid, path)
+            return grid, packed.get_solution()
+
+    walls = bytearray()
+    width = 0
+    with MazeCompression.open(path, "rb") as fd:
+        # The maze, one row per line until an empty line
+        for line in fd:
+            row = line.rstrip(b"\r\n")
+            if not row:
+                break
+            if row.translate(None, HEX_DIGITS):
+                raise ValueError(f"load_maze: Invalid cell in {path}.")
+            if not width:
+                width = len(row)
+            elif len(row) != width:
+                raise ValueError(f"load_maze: Rows of different width "
+                                 f"in {path}.")
+            walls += row.translate(HEX_VALUES)
+
+        footer = [line.strip() for line in fd]
+
+    if not width or len(footer) < 2:
+        raise ValueError(f"load_maze: {path} is not a maze file.")
+    height = len(walls) // width
+
+    # An empty line means there is no solution
+    letters = footer[2] if len(footer) > 2 else b""
+    if letters.translate(None, b"NESW"):
+        raise ValueError(f"load_maze: Invalid solution in {path}.")
+    solution = list(letters.translate(DIR_VALUES)) if letters else None
+
+    cells_42 = find_42_cells(width, height, walls)
+    try:
+        config = Config({
+            "WIDTH": str(width),
+            "HEIGHT": str(height),
+            "ENTRY": footer[0].decode(),
+            "EXIT": footer[1].decode(),
+            "OUTPUT_FILE": path,
+            "PERFECT": ("true" if is_perfect(walls, len(cells_42))
+                        else "false")
+        })
+        grid = Grid(config, cells_42)
+    except (ConfigError, IndexError) as e:
+        raise ValueError(f"load_maze: Invalid entry or exit in {path}. {e}")
+    grid.walls[:] = walls
+    check_walls(grid, path)
+    grid.visited.fill()
+    return grid, solution
+
+
+def check_walls(grid: Grid, path: str) -> None:
+    """
+    Check that the walls of a maze are consistent: the walls on the
+    border are closed (there is no neighbor on that side, given by
+    the low 4 bits of neighbor_mask), and neighboring cells agree
+    about the wall between them.
+
+    Raises:
+        ValueError: If the walls are not consistent.
+    """
+    walls = grid.walls
+    size = grid.size
+    width = grid.width
+    east = walls.translate(WALL_BITS[Cell.EAST])
+    west = walls.translate(WALL_BITS[Cell.WEST])
+    south = walls.translate(WALL_BITS[Cell.SOUTH])
+    north = walls.translate(WALL_BITS[Cell.NORTH])
+
+    # The walls without neighbor are those of the border: each cell
+    # has the walls missing from the low 4 bits of neighbor_mask closed
+    if (0 in north[:width] or 0 in south[size - width:]
+            or 0 in west[::width] or 0 in east[width - 1::width]):
+        index = next(i for i in range(size)
+                     if (walls[i] | grid.neighbor_mask[i]) & 15 != 15)
+        raise ValueError(f"load_maze: Open wall on the border at "
+                         f"{grid.get_pos(index)} in {path}.")
+
+    # With closed borders, the east wall of the last cell of a row
+    # and the west wall of the first cell of the next row match
+    if east[:-1] != west[1:] or south[:-width] != north[width:]:
+        index = next(i for i in range(size)
+                     if (i + 1 < size and east[i] != west[i + 1])
+                     or (i + width < size and south[i] != north[i + width]))
+        raise ValueError(f"load_maze: Walls of neighboring cells do not "
+                         f"match at {grid.get_pos(index)} in {path}.")
+
+
+def find_42_cells(width: int, height: int,
+                  walls: bytearray) -> set[tuple[int, int]]:
+    """
+    Find the 42 pattern of a maze: the cells of the pattern
+    if all of them are closed, otherwise there is no pattern.
+    """
+    cells = Grid.get_42_cells(width, height)
+    if all(walls[y * width + x] == 15 for (x, y) in cells):
+        return cells
+    return set()
+
+
+def is_perfect(walls: bytearray, closed_cells: int) -> bool:
+    """
+    Check whether a maze is perfect, i.e. the open walls form a tree:
+    there is one less passage than cells outside of the 42 pattern.
+    """
+    # Each passage is counted once from each side
+    passages = sum(walls.translate(OPEN_WALLS)) // 2
+    return passages == len(walls) - closed_cells - 1
@@ -0,0 +1,433 @@
+"""
+Defines the class MazePacked, a compact binary file format for mazes
+and a reader that maps the file into memory.
+
+The file is made of:
+- A header: magic, version, flags, width, height, entry, exit,
+  length of the solution, seed and algorithm.
+- If the maze has a 42 pattern: the number of its cells, then the
+  position (x, y) of each of them.
+- The walls, two cells per byte, the first cell in the low 4 bits.
+- The solution, four steps per byte, two bits per step
+  (0: N, 1: E, 2: S, 3: W), the first step in the lowest bits.
+"""
+
+from __future__ import annotations
+import mmap
+import struct
+from types import TracebackType
+from typing import TYPE_CHECKING, overload
+
+from mazegen.config.maze_config import Config
+from mazegen.grid.maze_bitset import BitSet
+from mazegen.grid.maze_cell import Cell
+from mazegen.grid.maze_grid import Grid
+
+# Import only for the type hint to avoid runtime import overhead
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Sequence
+
+
+class MazePacked:
+    """
+    A class that reads a maze in the packed binary format.
+    The file is mapped into memory and only the header is read when
+    it is opened, so opening is instant even for huge mazes.
+    The walls and solution are decoded when they are asked for.
+
+    It is a read-only view with the attributes of Grid that describe
+    the maze: width, height, size, entry, exit, perfect, cells_42,
+    is_42, offsets, steps and revision (always 0, the walls of the file
+    never change), and walls and neighbor_mask as CellView sequences
+    that compute the value of a cell when it is indexed.
+    index(), get_pos(), has_wall() and get_open_neighbors() work
+    as in Grid. Code that only indexes these attributes cell by cell
+    accepts the view; it has no visited, rng, cache or get_cell(),
+    and walls cannot be changed, so the generators, solvers, writers
+    and visualizers take the Grid decoded by to_grid().
+    """
+
+    EXTENSION = ".mzb"
+    MAGIC = b"MAZB"
+    # Version 2 stores the cells of the 42 pattern, version 1 files
+    # have the default pattern of their size when HAS_42 is set
+    VERSION = 2
+    # Magic, version, flags, width, height, entry x, entry y, exit x,
+    # exit y, solution length, seed length, algorithm length
+    HEADER = struct.Struct("<4sBBIIIIIIIHH")
+    # Number of cells of the 42 pattern, and position of a cell
+    COUNT_42 = struct.Struct("<I")
+    CELL_42 = struct.Struct("<II")
+
+    # Flags of the header
+    PERFECT = 1
+    HAS_SOLUTION = 2
+    HAS_42 = 4
+    HAS_SEED = 8
+
+    # Translation tables to pack and unpack the walls
+    HIGH_NIBBLE = bytes((b << 4) & 0xFF for b in range(256))
+    LOW_BITS = bytes(b & 15 for b in range(256))
+    HIGH_BITS = bytes(b >> 4 for b in range(256))
+
+    # Translation tables from directions to 2 bit codes and back,
+    # and from packed bytes to the code of each of the 4 steps
+    DIR_CODES = bytes.maketrans(bytes(Cell.DIRS), bytes(range(4)))
+    CODE_SHIFTS = tuple(bytes((b << 2 * k) & 0xFF for b in range(256))
+                        for k in range(4))
+    CODE_DIRS = tuple(bytes(Cell.DIRS[b >> 2 * k & 3] for b in range(256))
+                      for k in range(4))
+
+    # Number of cells packed at once when writing
+    CHUNK = 1 << 20
+
+    def __init__(self: "MazePacked", path: str) -> None:
+        """
+        Open a maze file in the packed format.
+
+        Args:
+            path (str): The path to the file.
+
+        Raises:
+            ValueError: If the file is not a maze in the packed format.
+        """
+        self.file = open(path, "rb")
+        try:
+            self.data = mmap.mmap(self.file.fileno(), 0,
+                                  access=mmap.ACCESS_READ)
+        except ValueError:
+            self.file.close()
+            raise ValueError(f"MazePacked: {path} is empty.")
+        try:
+            self.read_header()
+        except (ValueError, struct.error):
+            self.close()
+            raise ValueError(f"MazePacked: {path} is not a packed maze.")
+
+    def read_header(self: "MazePacked") -> None:
+        """Read the header and find where the walls and solution start."""
+        (magic, version, flags, width, height,
+         entry_x, entry_y, exit_x, exit_y, solution_length,
+         seed_length, algo_length) = self.HEADER.unpack_from(self.data, 0)
+        if magic != self.MAGIC or version not in (1, self.VERSION):
+            raise ValueError("Unknown format")
+
+        self.flags: int = flags
+        self.width: int = width
+        self.height: int = height
+        self.size = self.width * self.height
+        self.entry: tuple[int, ...] = (entry_x, entry_y)
+        self.exit: tuple[int, ...] = (exit_x, exit_y)
+        self.solution_length: int = solution_length
+        self.perfect = "true" if flags & self.PERFECT else "false"
+
+        offset = self.HEADER.size
+        seed = bytes(self.data[offset:offset + seed_length]).decode()
+        offset += seed_length
+        if flags & self.HAS_SEED:
+            self.seed = seed
+        algo = bytes(self.data[offset:offset + algo_length]).decode()
+        offset += algo_length
+        if algo:
+            self.algo = algo
+
+        self.cells_42: set[tuple[int, int]] = set()
+        if flags & self.HAS_42 and version == 1:
+            self.cells_42 = Grid.get_42_cells(self.width, self.height)
+        elif flags & self.HAS_42:
+            (count,) = self.COUNT_42.unpack_from(self.data, offset)
+            offset += self.COUNT_42.size
+            for _ in range(count):
+                x, y = self.CELL_42.unpack_from(self.data, offset)
+                offset += self.CELL_42.size
+                if x >= self.width or y >= self.height:
+                    raise ValueError("42 pattern outside of the maze")
+                self.cells_42.add((x, y))
+
+        self.walls_offset: int = offset
+        self.solution_offset = offset + (self.size + 1) // 2
+        end = self.solution_offset + (self.solution_length + 3) // 4
+        if len(self.data) < end:
+            raise ValueError("File too short")
+
+        self.is_42 = BitSet(self.size)
+        for (x, y) in self.cells_42:
+            self.is_42[self.index(x, y)] = True
+        self.offsets = {
+            Cell.NORTH: -self.width,
+            Cell.EAST: 1,
+            Cell.SOUTH: self.width,
+            Cell.WEST: -1
+        }
+        self.steps = tuple(
+            tuple((dir, self.offsets[dir])
+                  for dir in Cell.get_dirs() if mask & dir)
+            for mask in range(16)
+        )
+        # The walls of the file never change
+        self.revision = 0
+        self.walls = CellView(self.size, self.get_walls, self.get_cells)
+        self.neighbor_mask = CellView(self.size, self.get_neighbor_mask)
+
+    def close(self: "MazePacked") -> None:
+        """Unmap and close the file."""
+        self.data.close()
+        self.file.close()
+
+    def __enter__(self: "MazePacked") -> "MazePacked":
+        return self
+
+    def __exit__(self: "MazePacked", exc_type: type[BaseException] | None,
+                 exc: BaseException | None,
+                 traceback: TracebackType | None) -> None:
+        self.close()
+
+    def index(self: "MazePacked", x: int, y: int) -> int:
+        """Get the flat index of the cell at position (x, y)."""
+        return y * self.width + x
+
+    def get_pos(self: "MazePacked", index: int) -> tuple[int, int]:
+        """Get the position (x, y) of the cell at a flat index."""
+        y, x = divmod(index, self.width)
+        return (x, y)
+
+    def get_walls(self: "MazePacked", index: int) -> int:
+        """Get the walls value of the cell at a flat index."""
+        byte = self.data[self.walls_offset + (index >> 1)]
+        return byte >> 4 if index & 1 else byte & 15
+
+    def has_wall(self: "MazePacked", index: int, direction: int) -> bool:
+        """Check whether a cell has a wall in a given direction."""
+        return bool(self.get_walls(index) & direction)
+
+    def get_neighbor_mask(self: "MazePacked", index: int) -> int:
+        """
+        Get the neighbor_mask value of the cell at a flat index,
+        the same as in a Grid with the 42 pattern of the file:
+        the directions with a neighbor inside of the maze (low 4 bits)
+        and those of the neighbors that can be connected (high 4 bits).
+        """
+        y, x = divmod(index, self.width)
+        inside = 15
+        if y == 0:
+            inside &= ~Cell.NORTH
+        if y == self.height - 1:
+            inside &= ~Cell.SOUTH
+        if x == 0:
+            inside &= ~Cell.WEST
+        if x == self.width - 1:
+            inside &= ~Cell.EAST
+        if self.is_42[index]:
+            return inside
+        connectable = inside
+        for dir, offset in self.steps[inside]:
+            if self.is_42[index + offset]:
+                connectable &= ~dir
+        return inside | connectable << 4
+
+    def get_open_neighbors(self: "MazePacked",
+                           index: int) -> list[tuple[int, int]]:
+        """
+        Get a list of neighbors that are not separated by a wall.
+        A wall open on the border of the maze has no neighbor.
+        """
+        open_dirs = ((self.get_walls(index) ^ 15)
+                     & self.get_neighbor_mask(index))
+        return [(index + offset, dir) for dir, offset in self.steps[open_dirs]]
+
+    def get_cells(self: "MazePacked", start: int, count: int) -> bytearray:
+        """
+        Decode the walls of a range of cells.
+
+        Args:
+            start (int): The index of the first cell.
+            count (int): The number of cells.
+
+        Returns:
+            bytearray: The walls value of each cell.
+        """
+        first = self.walls_offset + (start >> 1)
+        last = self.walls_offset + ((start + count + 1) >> 1)
+        return self.unpack_walls(self.data[first:last])[start & 1:
+                                                        (start & 1) + count]
+
+    def get_row(self: "MazePacked", y: int) -> bytearray:
+        """Decode the walls of a row of the maze."""
+        return self.get_cells(y * self.width, self.width)
+
+    def get_solution(self: "MazePacked") -> list[int] | None:
+        """
+        Decode the solution.
+
+        Returns:
+            list[int] | None: A list of directions
+            (from previous cell to current cell) of the solution path.
+            None if the file has no solution.
+        """
+        if not self.flags & self.HAS_SOLUTION:
+            return None
+        start = self.solution_offset
+        packed = self.data[start:start + (self.solution_length + 3) // 4]
+        return self.unpack_solution(packed, self.solution_length)
+
+    def to_grid(self: "MazePacked") -> Grid:
+        """
+        Decode the whole maze into a Grid.
+
+        Returns:
+            Grid: A grid with the walls, entry, exit and 42 pattern
+            of the maze.
+        """
+        config = {
+            "WIDTH": str(self.width),
+            "HEIGHT": str(self.height),
+            "ENTRY": f"{self.entry[0]},{self.entry[1]}",
+            "EXIT": f"{self.exit[0]},{self.exit[1]}",
+            "OUTPUT_FILE": "",
+            "PERFECT": self.perfect
+        }
+        if hasattr(self, "seed"):
+            config["SEED"] = self.seed
+        if hasattr(self, "algo"):
+            config["ALGORITHM"] = self.algo
+        grid = Grid(Config(config), self.cells_42)
+
+        for start in range(0, self.size, self.CHUNK):
+            count = min(self.CHUNK, self.size - start)
+            grid.walls[start:start + count] = self.get_cells(start, count)
+        grid.visited.fill()
+        return grid
+
+    @classmethod
+    def unpack_walls(cls: "type[MazePacked]", packed: bytes) -> bytearray:
+        """Split each byte into the walls of two cells."""
+        walls = bytearray(2 * len(packed))
+        walls[0::2] = packed.translate(cls.LOW_BITS)
+        walls[1::2] = packed.translate(cls.HIGH_BITS)
+        return walls
+
+    @classmethod
+    def pack_walls(cls: "type[MazePacked]",
+                   walls: bytes | bytearray) -> bytes:
+        """Pack the walls of two cells into each byte."""
+        if len(walls) & 1:
+            walls = bytes(walls) + b"\x00"
+        low = walls[0::2]
+        high = walls[1::2].translate(cls.HIGH_NIBBLE)
+        # Combine the two halves at once as big integers
+        combined = (int.from_bytes(low, "little")
+                    | int.from_bytes(high, "little"))
+        return combined.to_bytes(len(low), "little")
+
+    @classmethod
+    def unpack_solution(cls: "type[MazePacked]", packed: bytes,
+                        length: int) -> list[int]:
+        """Split each byte into four steps of the solution."""
+        steps = bytearray(4 * len(packed))
+        for k in range(4):
+            steps[k::4] = packed.translate(cls.CODE_DIRS[k])
+        return list(steps[:length])
+
+    @classmethod
+    def pack_solution(cls: "type[MazePacked]",
+                      solution: Sequence[int]) -> bytes:
+        """Pack four steps of the solution into each byte."""
+        codes = bytes(solution).translate(cls.DIR_CODES)
+        codes += bytes(-len(codes) % 4)
+        combined = 0
+        for k in range(4):
+            combined |= int.from_bytes(
+                codes[k::4].translate(cls.CODE_SHIFTS[k]), "little")
+        return combined.to_bytes(len(codes) // 4, "little")
+
+    @classmethod
+    def write(cls: "type[MazePacked]", path: str, maze: Grid,
+              solution: list[int] | None) -> None:
+        """
+        Write a maze to a file in the packed format.
+
+        Args:
+            path (str): The path to the file.
+            maze (Grid): The maze to write.
+            solution (list[int] | None): The solution of the maze.
+        """
+        flags = 0
+        if maze.perfect == "true":
+            flags |= cls.PERFECT
+        if solution is not None:
+            flags |= cls.HAS_SOLUTION
+        cells_42 = b""
+        if maze.cells_42:
+            flags |= cls.HAS_42
+            cells_42 = cls.COUNT_42.pack(len(maze.cells_42)) + b"".join(
+                cls.CELL_42.pack(x, y) for (x, y) in sorted(maze.cells_42))
+        seed = b""
+        if hasattr(maze, "seed"):
+            flags |= cls.HAS_SEED
+            seed = str(maze.seed).encode()
+        algo = maze.algo.encode() if hasattr(maze, "algo") else b""
+        steps = solution if solution is not None else []
+
+        header = cls.HEADER.pack(cls.MAGIC, cls.VERSION, flags,
+                                 maze.width, maze.height,
+                                 maze.entry[0], maze.entry[1],
+                                 maze.exit[0], maze.exit[1],
+                                 len(steps), len(seed), len(algo))
+        with open(path, "wb", buffering=cls.CHUNK) as fd:
+            fd.write(header + seed + algo + cells_42)
+            for start in range(0, maze.size, cls.CHUNK):
+                fd.write(cls.pack_walls(maze.walls[start:start + cls.CHUNK]))
+            fd.write(cls.pack_solution(steps))
+
+
+class CellView:
+    """
+    A read-only sequence of one value per cell of a MazePacked,
+    computed when it is indexed, in place of a bytearray of Grid.
+    A slice is decoded into a bytearray.
+    """
+
+    def __init__(self: "CellView", size: int, get: Callable[[int], int],
+                 get_range: Callable[[int, int], bytearray] | None = None
+                 ) -> None:
+        """
+        Initialize the view.
+
+        Args:
+            size (int): The number of cells.
+            get (Callable[[int], int]): Get the value of a cell.
+            get_range (Callable[[int, int], bytearray] | None): Get the
+            values of a range of cells from its start and count.
+            Default: get each cell.
+        """
+        self.size = size
+        self.get = get
+        self.get_range = get_range
+
+    def __len__(self: "CellView") -> int:
+        """Returns the number of cells."""
+        return self.size
+
+    def __iter__(self: "CellView") -> Iterator[int]:
+        """Iterate over the values of the cells."""
+        return map(self.get, range(self.size))
+
+    @overload
+    def __getitem__(self: "CellView", index: int) -> int: ...
+
+    @overload
+    def __getitem__(self: "CellView", index: slice) -> bytearray: ...
+
+    def __getitem__(self: "CellView",
+                    index: int | slice) -> int | bytearray:
+        """Get the value of a cell, or the values of a slice of cells."""
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.size)
+            if step == 1 and self.get_range is not None:
+                return self.get_range(start, max(stop - start, 0))
+            return bytearray(self.get(i) for i in range(start, stop, step))
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("CellView: Index out of range.")
+        return self.get(index)
@@ -0,0 +1,518 @@
+"""
+Defines the class MazeValidator, which checks a maze output file
+row by row, keeping only two rows of the maze in memory.
+"""
+
+import os
+from array import array
+from itertools import accumulate, compress
+from typing import IO
+
+from mazegen.config.maze_config import Config
+from mazegen.grid.maze_cell import Cell
+from mazegen.grid.maze_grid import Grid
+from mazegen.io.maze_compression import MazeCompression
+from mazegen.io.maze_loader import DIR_VALUES, HEX_DIGITS, HEX_VALUES
+from mazegen.io.maze_loader import load_maze
+from mazegen.solve.maze_solver import MazeSolver
+
+# Report of an error: check, message, position (x, y) of the cell
+Error = dict[str, object]
+
+
+class MazeValidator:
+    """
+    A class that validates a maze file in the text format written
+    by OutputWriter, compressed or not, and returns a report that
+    can be dumped as JSON.
+
+    The footer (entry, exit, solution) is read first from the end
+    of the file (by reading a compressed file to the end), then the
+    rows are read one by one. Each row is
+    checked at once with translation tables against the row above:
+    - Every row has the same width and only hex digits.
+    - Neighbors agree on the walls they share, and the border is closed.
+    - The cells of the 42 pattern are fully closed.
+    - The maze is connected, counted with a union-find over the
+      horizontal runs of the row and of the row above: every run
+      is a new part and every open wall that joins two parts
+      takes one away, the maze is connected if one part is left.
+    - The number of loops is passages - cells + parts, it must be 0
+      if the config given to the validator has PERFECT=true.
+    - The walls are open along the solution, which goes from the entry
+      to the exit. The steps are sorted by cell in an array of 8 byte
+      ints so that they are checked in the same pass as the rows.
+    - The solution is a shortest path. Without loops, the only path
+      that does not visit a cell twice is the shortest one. With loops,
+      this needs the whole maze: it is only checked if check_shortest
+      is set, by loading the maze (O(cells) memory) to compare with
+      a BFS, otherwise the report says "unchecked".
+    """
+
+    # At most this many errors are listed in the report
+    MAX_ERRORS = 100
+    # Size of the blocks read backwards to find the footer
+    CHUNK = 1 << 16
+
+    # Translation tables from wall values to 1 if the wall is closed
+    NORTH_BITS = bytes(b >> 0 & 1 for b in range(256))
+    EAST_BITS = bytes(b >> 1 & 1 for b in range(256))
+    SOUTH_BITS = bytes(b >> 2 & 1 for b in range(256))
+    WEST_BITS = bytes(b >> 3 & 1 for b in range(256))
+    SOUTH_OPEN = bytes(~b >> 2 & 1 for b in range(256))
+
+    # Step (dx, dy) of each direction
+    MOVES = {
+        Cell.NORTH: (0, -1),
+        Cell.EAST: (1, 0),
+        Cell.SOUTH: (0, 1),
+        Cell.WEST: (-1, 0)
+    }
+
+    def __init__(self: "MazeValidator", path: str,
+                 config: Config | None = None,
+                 check_shortest: bool = False) -> None:
+        """
+        Initialize the validator.
+
+        Args:
+            path (str): The path to the maze file.
+            config (Config | None): The config the maze was generated
+            with. If given, the size, entry, exit and PERFECT of the
+            maze are checked against it.
+            check_shortest (bool): Whether to check that the solution
+            is a shortest path when the maze has loops, which loads
+            the whole maze into a Grid instead of two rows.
+        """
+        self.path = path
+        self.config = config
+        self.check_shortest = check_shortest
+        self.errors: list[Error] = []
+        self.error_count = 0
+
+    def add_error(self: "MazeValidator", check: str, message: str,
+                  x: int | None = None, y: int | None = None) -> None:
+        """Count an error, and list it if the list is not full."""
+        self.error_count += 1
+        if len(self.errors) < self.MAX_ERRORS:
+            self.errors.append({"check": check, "message": message,
+                                "x": x, "y": y})
+
+    def validate(self: "MazeValidator") -> dict[str, object]:
+        """
+        Validate the maze file.
+
+        Returns:
+            dict[str, object]: The report, with:
+            - valid (bool): Whether no error was found.
+            - width, height (int): The size of the maze.
+            - entry, exit (list[int]): The positions of the file.
+            - parts (int): The number of connected parts of the maze.
+            - loops (int): The number of independent loops of the maze.
+            - path_length (int | None): The length of the solution.
+            - shortest_length (int | None): The length of a shortest
+              path, if it was found.
+            - shortest (str | None): "checked" if the solution was
+              compared with a shortest path, "unchecked" if the maze
+              has loops and check_shortest is not set, None if the
+              solution could not be read.
+            - error_count (int): The number of errors found.
+            - errors (list[dict]): The first errors, with the check
+              (format, size, encoding, border, pattern_42, connected,
+              perfect, entry, exit, path, shortest), a message and
+              the position (x, y) of the cell if there is one.
+        """
+        self.errors = []
+        self.error_count = 0
+        self.width = 0
+        self.height = 0
+        self.entry: tuple[int, ...] = ()
+        self.exit: tuple[int, ...] = ()
+        self.parts = 0
+        self.loops = 0
+        self.path_length: int | None = None
+        self.shortest_length: int | None = None
+        self.shortest: str | None = None
+
+        self.compressed = (MazeCompression.detect_format(self.path)
+                           != MazeCompression.NONE)
+        with MazeCompression.open(self.path, "rb") as fd:
+            found = self.read_footer(fd)
+        if found:
+            with MazeCompression.open(self.path, "rb") as fd:
+                self.read_rows(fd)
+        if not self.error_count:
+            self.check_config()
+            self.check_shortest_path()
+        return self.get_report()
+
+    def get_report(self: "MazeValidator") -> dict[str, object]:
+        """Get the report of the last validation."""
+        return {
+            "file": self.path,
+            "valid": self.error_count == 0,
+            "width": self.width,
+            "height": self.height,
+            "entry": list(self.entry),
+            "exit": list(self.exit),
+            "parts": self.parts,
+            "loops": self.loops,
+            "path_length": self.path_length,
+            "shortest_length": self.shortest_length,
+            "shortest": self.shortest,
+            "error_count": self.error_count,
+            "errors": self.errors
+        }
+
+    def read_footer(self: "MazeValidator", fd: IO[bytes]) -> bool:
+        """
+        Read the first row to know the size of the maze, and the footer
+        (empty line, entry, exit, solution) at the end of the file.
+
+        Returns:
+            bool: Whether the rows can be read.
+        """
+        first = fd.readline()
+        if self.compressed:
+            pos, tail = self.read_tail_forward(fd, first)
+        else:
+            pos, tail = self.read_tail_backward(fd)
+        body = tail[:-1] if tail.endswith(b"\n") else tail
+        lines = body.split(b"\n")[-4:]
+        self.rows_end = pos + len(body) - len(b"\n".join(lines))
+        footer = [line.rstrip(b"\r") for line in lines]
+
+        self.width = len(first.rstrip(b"\r\n"))
+        self.newline = first[self.width:]
+        if (len(footer) < 4 or footer[0] or not self.width
+                or self.rows_end % len(first)):
+            self.add_error("format", "Not a maze file, or rows "
+                           "of different width.")
+            return False
+        self.height = self.rows_end // len(first)
+        self.cells_42 = Grid.get_42_cells(self.width, self.height)
+
+        self.entry = self.read_position("entry", footer[1])
+        self.exit = self.read_position("exit", footer[2])
+        if self.entry and self.entry == self.exit:
+            self.add_error("exit", "Entry and exit are the same cell.")
+        self.read_path(footer[3])
+        return True
+
+    def read_tail_backward(self: "MazeValidator",
+                           fd: IO[bytes]) -> tuple[int, bytes]:
+        """
+        Read the file backwards from the end until the last 5 lines
+        are found.
+
+        Returns:
+            tuple[int, bytes]: The offset of the part read, and the part.
+        """
+        pos = fd.seek(0, os.SEEK_END)
+        tail = b""
+        while pos > 0 and tail.count(b"\n") < 5:
+            step = min(self.CHUNK, pos)
+            pos -= step
+            fd.seek(pos)
+            tail = fd.read(step) + tail
+        return pos, tail
+
+    def read_tail_forward(self: "MazeValidator", fd: IO[bytes],
+                          first: bytes) -> tuple[int, bytes]:
+        """
+        Read a compressed file to the end, which cannot be read
+        backwards, keeping only the last 5 lines.
+
+        Returns:
+            tuple[int, bytes]: The offset of the part kept, and the part.
+        """
+        pos = 0
+        tail = bytearray(first)
+        while chunk := fd.read(self.CHUNK):
+            tail += chunk
+            if b"\n" not in chunk:
+                continue
+            cut = len(tail)
+            for _ in range(6):
+                cut = tail.rfind(b"\n", 0, cut)
+                if cut < 0:
+                    break
+            if cut >= 0:
+                pos += cut + 1
+                del tail[:cut + 1]
+        return pos, bytes(tail)
+
+    def read_position(self: "MazeValidator", check: str,
+                      line: bytes) -> tuple[int, ...]:
+        """Read the entry or exit line, empty if it is not valid."""
+        try:
+            x, y = (int(value) for value in line.split(b","))
+        except ValueError:
+            self.add_error(check, f"Invalid {check} line.")
+            return ()
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            self.add_error(check, f"The {check} is out of bounds.", x, y)
+            return ()
+        if (x, y) in self.cells_42:
+            self.add_error(check, f"The {check} is in the 42 pattern.", x, y)
+            return ()
+        return (x, y)
+
+    def read_path(self: "MazeValidator", letters: bytes) -> None:
+        """
+        Walk the solution from the entry, and keep the steps sorted
+        by cell (index << 4 | direction) to check the walls in order.
+        """
+        self.steps = array("q")
+        if not self.entry or not self.exit:
+            return
+        if not letters:
+            self.add_error("path", "The file has no solution.")
+            return
+        if letters.translate(None, b"NESW"):
+            self.add_error("path", "Invalid letter in the solution.")
+            return
+
+        width = self.width
+        x, y = self.entry
+        steps = array("q")
+        for dir in letters.translate(DIR_VALUES):
+            steps.append((y * width + x) << 4 | dir)
+            dx, dy = self.MOVES[dir]
+            x += dx
+            y += dy
+            if not (0 <= x < width and 0 <= y < self.height):
+                self.add_error("path", "The solution leaves the maze.", x, y)
+                return
+        if (x, y) != self.exit:
+            self.add_error("path", "The solution does not end at the exit.",
+                           x, y)
+            return
+
+        self.path_length = len(steps)
+        self.steps = self.sort_steps(steps)
+        # A shortest path never visits a cell twice: the steps from the
+        # same cell are next to each other, and none is from the exit
+        exit_cell = y * width + x
+        previous = -1
+        self.is_simple = True
+        for step in self.steps:
+            cell = step >> 4
+            if cell == previous or cell == exit_cell:
+                self.is_simple = False
+                break
+            previous = cell
+
+    def sort_steps(self: "MazeValidator",
+                   steps: "array[int]") -> "array[int]":
+        """
+        Sort the steps by cell without a list of all of them:
+        a counting sort by row moves the steps into a new array,
+        then the steps of each row are sorted one row at a time.
+        """
+        width = self.width
+        # Start of the steps of each row in the sorted array
+        starts = array("q", bytes(8 * (self.height + 1)))
+        for step in steps:
+            starts[(step >> 4) // width + 1] += 1
+        starts = array("q", accumulate(starts))
+
+        ends = array("q", starts)
+        sorted_steps = array("q", bytes(8 * len(steps)))
+        for step in steps:
+            y = (step >> 4) // width
+            sorted_steps[ends[y]] = step
+            ends[y] += 1
+
+        for y in range(self.height):
+            start, end = starts[y], starts[y + 1]
+            if end - start > 1:
+                sorted_steps[start:end] = array(
+                    "q", sorted(sorted_steps[start:end]))
+        return sorted_steps
+
+    def read_rows(self: "MazeValidator", fd: IO[bytes]) -> None:
+        """Read the rows one by one and check each against the one above."""
+        width = self.width
+        line_length = width + len(self.newline)
+        self.below: list[tuple[int, int]] = []
+        self.above_count = 0
+        self.new_parts = 0
+        self.joins = 0
+        self.passages = 0
+        self.next_step = 0
+
+        above = b""
+        for y in range(self.height):
+            line = fd.read(line_length)
+            row = line[:width]
+            if row.translate(None, HEX_DIGITS) or line[width:] != self.newline:
+                self.add_error("format", "Invalid cell or rows of "
+                               "different width.", None, y)
+                return
+            walls = row.translate(HEX_VALUES)
+            self.check_row(y, walls, above)
+            self.link_row(y, walls)
+            self.check_path_row(y, walls)
+            above = walls
+
+        # The cells of the 42 pattern are runs that are not in the maze
+        self.parts = self.new_parts - len(self.cells_42) - self.joins
+        free_cells = self.width * self.height - len(self.cells_42)
+        self.loops = self.passages - free_cells + self.parts
+        if self.parts > 1:
+            self.add_error("connected", f"The maze has {self.parts} parts "
+                           "that are not connected.")
+
+    def check_row(self: "MazeValidator", y: int, walls: bytes,
+                  above: bytes) -> None:
+        """
+        Check that the cells of a row agree with each other and with
+        the row above on the walls they share, that the border
+        is closed and that the cells of the 42 pattern are closed.
+        """
+        width = self.width
+        east = walls.translate(self.EAST_BITS)
+        west = walls.translate(self.WEST_BITS)
+        north = walls.translate(self.NORTH_BITS)
+
+        if east[:-1] != west[1:]:
+            for x in range(width - 1):
+                if east[x] != west[x + 1]:
+                    self.add_error("encoding", "East wall does not match "
+                                   "the west wall of the next cell.", x, y)
+        if above and north != above.translate(self.SOUTH_BITS):
+            south = above.translate(self.SOUTH_BITS)
+            for x in range(width):
+                if north[x] != south[x]:
+                    self.add_error("encoding", "North wall does not match "
+                                   "the south wall of the cell above.", x, y)
+
+        if not west[0]:
+            self.add_error("border", "Open wall on the border.", 0, y)
+        if not east[-1]:
+            self.add_error("border", "Open wall on the border.", width - 1, y)
+        border = []
+        if y == 0:
+            border.append(north)
+        if y == self.height - 1:
+            border.append(walls.translate(self.SOUTH_BITS))
+        for bits in border:
+            x = bits.find(0)
+            while x >= 0:
+                self.add_error("border", "Open wall on the border.", x, y)
+                x = bits.find(0, x + 1)
+
+        for x, y_42 in self.cells_42:
+            if y_42 == y and walls[x] != 15:
+                self.add_error("pattern_42", "Cell of the 42 pattern "
+                               "is not closed.", x, y)
+
+    def link_row(self: "MazeValidator", y: int, walls: bytes) -> None:
+        """
+        Join the cells of a row to the parts of the maze above.
+        A run is a group of cells joined by open east walls, so each
+        run is a new part, and each open north wall between two parts
+        joins them (the north walls were checked against the south
+        walls above by check_row()). The runs are numbered from 0,
+        and the runs of the row above after them, so the union-find
+        has one node per run of the two rows. The root of a part that
+        reaches the row is always a run of the row, so only the roots
+        of the cells with an open south wall are kept for the next row.
+        """
+        width = self.width
+        east = walls.translate(self.EAST_BITS)
+        # Run of each cell: the number of closed east walls before it
+        runs = list(accumulate(east[:-1], initial=0))
+        run_count = runs[-1] + 1
+        self.passages += width - 1 - east.count(1, 0, width - 1)
+        self.new_parts += run_count
+        parent = list(range(run_count + self.above_count))
+
+        def find(node: int) -> int:
+            while parent[node] != node:
+                parent[node] = parent[parent[node]]
+                node = parent[node]
+            return node
+
+        # The cells below the open south walls of the row above
+        joins = 0
+        for x, label in self.below:
+            a = runs[x]
+            if parent[a] != a:
+                a = find(a)
+            b = run_count + label
+            if parent[b] != b:
+                b = find(b)
+            if a != b:
+                parent[b] = a
+                joins += 1
+        self.joins += joins
+        self.passages += len(self.below)
+
+        if y < self.height - 1:
+            open_south = walls.translate(self.SOUTH_OPEN)
+            self.below = [(x, find(runs[x]))
+                          for x in compress(range(width), open_south)]
+        self.above_count = run_count
+
+    def check_path_row(self: "MazeValidator", y: int, walls: bytes) -> None:
+        """Check that the steps of the solution from a row are open."""
+        steps = self.steps
+        start = y * self.width
+        end = start + self.width
+        while self.next_step < len(steps):
+            step = steps[self.next_step]
+            cell = step >> 4
+            if cell >= end:
+                break
+            if walls[cell - start] & step & 15:
+                self.add_error("path", "The solution goes through a wall.",
+                               cell - start, y)
+            self.next_step += 1
+
+    def check_config(self: "MazeValidator") -> None:
+        """Check the maze against the config it was generated with."""
+        config = self.config
+        if config is None:
+            return
+        if (config.width, config.height) != (self.width, self.height):
+            self.add_error("size", f"The maze is {self.width}x{self.height}"
+                           f" instead of {config.width}x{config.height}.")
+        if config.entry != self.entry:
+            self.add_error("entry", "The entry is not the one of the config.",
+                           *self.entry)
+        if config.exit != self.exit:
+            self.add_error("exit", "The exit is not the one of the config.",
+                           *self.exit)
+        if config.perfect == "true" and self.loops:
+            self.add_error("perfect", f"The maze has {self.loops} loops "
+                           "but PERFECT is true.")
+
+    def check_shortest_path(self: "MazeValidator") -> None:
+        """
+        Check that the solution is a shortest path. With loops and
+        check_shortest set, the whole maze is loaded for a BFS.
+        """
+        if self.path_length is None:
+            return
+        self.shortest = "checked"
+        if not self.is_simple:
+            self.add_error("shortest", "The solution visits a cell twice.")
+            return
+        if not self.loops:
+            # Only one path without loops
+            self.shortest_length = self.path_length
+            return
+        if not self.check_shortest:
+            self.shortest = "unchecked"
+            return
+
+        maze, _ = load_maze(self.path)
+        solution = MazeSolver(maze).solve_maze()
+        if solution is not None:
+            self.shortest_length = len(solution)
+            if self.shortest_length < self.path_length:
+                self.add_error("shortest", "The solution is "
+                               f"{self.path_length} steps long but the "
+                               f"shortest is {self.shortest_length}.")
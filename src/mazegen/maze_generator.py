@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING
 
 from mazegen.config.maze_config import Config, ConfigError
 from mazegen.grid.maze_grid import Grid
+from mazegen.rng.maze_rng import MazeRNG
 # Import only for the type hint to avoid circular imports
 if TYPE_CHECKING:
     from mazegen.algo.maze_imperfect import MazeImperfect
@@ -18,8 +19,9 @@ class MazeGenerator(Grid, ABC):
     Base class for maze generation.
     Inherits from Grid and adds generation functions.
     """
-    def __init__(self: "MazeGenerator", config: Config) -> None:
-        super().__init__(config)
+    def __init__(self: "MazeGenerator", config: Config,
+                 cells_42: set[tuple[int, int]] | None = None) -> None:
+        super().__init__(config, cells_42)
 
     @abstractmethod
     def generate(self: "Grid") -> None:
@@ -30,34 +32,83 @@ class MazeGenerator(Grid, ABC):
         pass
 
     @classmethod
-    def generate_maze(cls: "type[MazeGenerator]",
-                      config: Config) -> "MazeGenerator | MazeImperfect":
+    def get_algorithm(cls: "type[MazeGenerator]",
+                      config: Config) -> "type[MazeGenerator]":
         """
-        A function to generate the maze based on the algo
-        and perfect value in the config file.
+        Get the generator class of the algorithm in the config file.
+        Default algo: DFS.
         """
         from mazegen.algo.maze_algo_dfs import MazeDFS
+        from mazegen.algo.maze_algo_eller import MazeEller
+        from mazegen.algo.maze_algo_kruskal import MazeKruskal
         from mazegen.algo.maze_algo_prim import MazePrim
+
+        algorithms: dict[str, type[MazeGenerator]] = {
+            "dfs": MazeDFS,
+            "prim": MazePrim,
+            "kruskal": MazeKruskal,
+            "eller": MazeEller
+        }
+        if not hasattr(config, "algo"):
+            return MazeDFS
+        if config.algo not in algorithms:
+            raise ConfigError(f"ConfigError: Algorithm {config.algo} "
+                              "is not implemented.")
+        return algorithms[config.algo]
+
+    @classmethod
+    def generate_maze(cls: "type[MazeGenerator]", config: Config,
+                      rng: MazeRNG | None = None
+                      ) -> "MazeGenerator | MazeImperfect":
+        """
+        A function to generate the maze based on the algo
+        and perfect value in the config file.
+        With more than one worker, the maze is generated in tiles
+        on multiple processes.
+        With CACHE true, a maze with a seed is stored in the cache
+        of the config (see MazeCache), and read from it the next time.
+
+        Args:
+            config (Config): The maze configuration.
+            rng (MazeRNG | None): The random number generator to use
+            instead of one seeded with the seed of the config.
+        """
         from mazegen.algo.maze_imperfect import MazeImperfect
+        from mazegen.algo.maze_tiled import MazeTiled
+        from mazegen.io.maze_cache import MazeCache
 
         maze: MazeGenerator
-        if hasattr(config, "algo"):
-            if config.algo == "dfs":
-                maze = MazeDFS(config)
-            elif config.algo == "prim":
-                maze = MazePrim(config)
-            else:
-                raise ConfigError(f"ConfigError: Algorithm {config.algo} "
-                                  "is not implemented.")
+        if hasattr(config, "workers") and config.workers > 1:
+            maze = MazeTiled(config)
         else:
-            # Default algo: DSF
-            maze = MazeDFS(config)
+            maze = cls.get_algorithm(config)(config)
+
+        # With CACHE true, a maze with a seed is read from the cache if it
+        # was generated before, a given random number generator is never
+        # cached
+        cache = MazeCache.from_config(config) if rng is None else None
+        if cache is not None:
+            maze.cache = cache
+            key = cache.get_config_key(config)
+            walls = cache.load_walls(key)
+            if walls is not None and len(walls) == maze.size:
+                maze.walls[:] = walls
+                maze.visited.fill()
+                if config.perfect == "false":
+                    return MazeImperfect(config, maze)
+                return maze
 
+        if rng is not None:
+            maze.rng = rng
         maze.generate()
 
+        result: MazeGenerator | MazeImperfect = maze
         if config.perfect == "false":
-            imperfect_maze = MazeImperfect(config, maze)
-            imperfect_maze.make_imperfect()
-            return imperfect_maze
+            result = MazeImperfect(config, maze)
+            if rng is not None:
+                result.rng = rng
+            result.make_imperfect()
 
-        return maze
+        if cache is not None:
+            cache.store_maze(key, result)
+        return result
@@ -0,0 +1,6 @@
+from mazegen.rng.maze_rng import MazeRNG, PythonRNG
+
+__all__ = [
+    "MazeRNG",
+    "PythonRNG"
+]
@@ -0,0 +1,107 @@
+"""
+Random number generators used by the maze generators.
+Each maze owns its own generator, so mazes generated at the same time
+(e.g. in threads) do not change each other's random sequence.
+
+Classes:
+- MazeRNG
+- PythonRNG
+"""
+
+import random
+from abc import ABC, abstractmethod
+from collections.abc import MutableSequence, Sequence
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+class MazeRNG(ABC):
+    """
+    Interface of a random number generator.
+    Subclasses implement random(), randbelow() and getrandbits(),
+    and can override the other functions with faster versions.
+    """
+
+    @abstractmethod
+    def random(self: "MazeRNG") -> float:
+        """Get a random float in the range [0, 1)."""
+        pass
+
+    @abstractmethod
+    def randbelow(self: "MazeRNG", n: int) -> int:
+        """Get a random int in the range [0, n)."""
+        pass
+
+    @abstractmethod
+    def getrandbits(self: "MazeRNG", k: int) -> int:
+        """Get a random int with k random bits."""
+        pass
+
+    def choice(self: "MazeRNG", seq: Sequence[T]) -> T:
+        """Get a random element of a non-empty sequence."""
+        return seq[self.randbelow(len(seq))]
+
+    def shuffle(self: "MazeRNG", seq: MutableSequence[T]) -> None:
+        """Shuffle a sequence in place."""
+        for i in reversed(range(1, len(seq))):
+            j = self.randbelow(i + 1)
+            seq[i], seq[j] = seq[j], seq[i]
+
+    def random_batch(self: "MazeRNG", count: int) -> list[float]:
+        """Get a list of random floats in the range [0, 1)."""
+        return [self.random() for _ in range(count)]
+
+    def randbelow_batch(self: "MazeRNG", n: int, count: int) -> list[int]:
+        """Get a list of random ints in the range [0, n)."""
+        return [self.randbelow(n) for _ in range(count)]
+
+    def coin_batch(self: "MazeRNG", count: int) -> bytes:
+        """
+        Get the results of flipping a coin count times,
+        as bytes with the value 0 or 1.
+        """
+        if count <= 0:
+            return b""
+        data = self.getrandbits(8 * count).to_bytes(count, "little")
+        return data.translate(COIN_TABLE)
+
+
+# Translation table from a random byte to its last bit
+COIN_TABLE = bytes(b & 1 for b in range(256))
+
+
+class PythonRNG(MazeRNG):
+    """
+    Random number generator based on a random.Random instance.
+    With the same seed, it gives the same results as seeding
+    and using the functions of the random module.
+    """
+
+    def __init__(self: "PythonRNG", seed: str | int | None = None) -> None:
+        """
+        Create a random number generator.
+
+        Args:
+            seed (str | int | None): The seed, None for a random seed.
+        """
+        self.generator = random.Random(seed)
+
+    def random(self: "PythonRNG") -> float:
+        return self.generator.random()
+
+    def randbelow(self: "PythonRNG", n: int) -> int:
+        return self.generator.randrange(n)
+
+    def getrandbits(self: "PythonRNG", k: int) -> int:
+        return self.generator.getrandbits(k)
+
+    def choice(self: "PythonRNG", seq: Sequence[T]) -> T:
+        return self.generator.choice(seq)
+
+    def shuffle(self: "PythonRNG", seq: MutableSequence[T]) -> None:
+        self.generator.shuffle(seq)
+
+    def random_batch(self: "PythonRNG", count: int) -> list[float]:
+        random = self.generator.random
+        return [random() for _ in range(count)]
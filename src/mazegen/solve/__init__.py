@@ -1,5 +1,17 @@
 from mazegen.solve.maze_solver import MazeSolver
+from mazegen.solve.maze_distance_field import MazeDistanceField
+from mazegen.solve.maze_path_index import MazePathIndex
+from mazegen.solve.maze_solver_astar import MazeAStarSolver
+from mazegen.solve.maze_solver_bidir import MazeBidirSolver
+from mazegen.solve.maze_solver_incremental import MazeIncrementalSolver
+from mazegen.solve.maze_solver_junction import MazeJunctionSolver
 
 __all__ = [
-    "MazeSolver"
+    "MazeSolver",
+    "MazeAStarSolver",
+    "MazeDistanceField",
+    "MazePathIndex",
+    "MazeBidirSolver",
+    "MazeIncrementalSolver",
+    "MazeJunctionSolver"
 ]
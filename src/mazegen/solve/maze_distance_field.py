@@ -0,0 +1,181 @@
+"""
+The MazeDistanceField class keeps the distance of every cell
+from the entry, to find the path from the entry to any cell
+without searching again.
+"""
+
+from __future__ import annotations
+from array import array
+from collections import deque
+from typing import TYPE_CHECKING
+
+from mazegen.solve.maze_solver import MazeSolver
+
+# Import only for the type hint to avoid runtime import overhead
+if TYPE_CHECKING:
+    from mazegen.grid.maze_grid import Grid
+
+
+class MazeDistanceField(MazeSolver):
+    """
+    Subclass of MazeSolver.
+    Runs one BFS over the whole maze from the entry and keeps
+    the distance and the direction from the parent of every cell.
+    The path from the entry to any cell is then read back
+    from the parents in O(path length).
+
+    The field is computed again on the next query when the walls
+    of the maze have changed (the revision of the grid is different)
+    or when the entry has moved.
+    """
+
+    # Distance of the cells that cannot be reached from the entry
+    UNREACHABLE = -1
+
+    def __init__(self: "MazeDistanceField", maze: Grid) -> None:
+        """Initalize the distance field, computed on the first query."""
+        super().__init__(maze)
+        self.distances = array("i", [self.UNREACHABLE]) * maze.size
+        # Revision of the maze and entry the field was computed for
+        self.revision: int | None = None
+        self.root: int | None = None
+
+    def is_stale(self: "MazeDistanceField") -> bool:
+        """Check whether the walls or the entry changed since the BFS."""
+        return (self.revision != self.maze.revision
+                or self.root != self.maze.index(self.maze.entry[0],
+                                                self.maze.entry[1])
+                or len(self.distances) != self.maze.size)
+
+    def update(self: "MazeDistanceField") -> None:
+        """
+        Compute the distance and parent of every cell from the entry
+        with a BFS, if the field is stale.
+        """
+        if not self.is_stale():
+            return
+
+        maze = self.maze
+        start = maze.index(maze.entry[0], maze.entry[1])
+        if len(self.distances) != maze.size:
+            self.distances = array("i", [self.UNREACHABLE]) * maze.size
+            self.parents = array("b", bytes(maze.size))
+        else:
+            self.distances[:] = array("i", [self.UNREACHABLE]) * maze.size
+        distances = self.distances
+        parents = self.parents
+        steps = maze.steps
+        walls = maze.walls
+        neighbor_mask = maze.neighbor_mask
+
+        distances[start] = 0
+        parents[start] = 0
+        queue = deque([start])
+        while queue:
+            current = queue.popleft()
+            distance = distances[current] + 1
+            open_dirs = (walls[current] ^ 15) & neighbor_mask[current]
+            for dir, offset in steps[open_dirs]:
+                neighbor = current + offset
+                if distances[neighbor] == self.UNREACHABLE:
+                    distances[neighbor] = distance
+                    parents[neighbor] = dir
+                    queue.append(neighbor)
+
+        self.revision = maze.revision
+        self.root = start
+
+    def get_distance(self: "MazeDistanceField",
+                     target: tuple[int, ...]) -> int | None:
+        """
+        Get the number of steps from the entry to a cell.
+
+        Args:
+            target (tuple[int, ...]): The position (x, y) of the cell.
+
+        Returns:
+            int | None: The length of the shortest path from the entry.
+            None if the cell is out of bounds or cannot be reached.
+        """
+        cell = self.maze.get_cell(target[0], target[1])
+        if cell is None:
+            return None
+        self.update()
+        distance = self.distances[cell.index]
+        if distance == self.UNREACHABLE:
+            return None
+        return distance
+
+    def get_path(self: "MazeDistanceField",
+                 target: tuple[int, ...]) -> list[int] | None:
+        """
+        Get the shortest path from the entry to a cell.
+
+        Args:
+            target (tuple[int, ...]): The position (x, y) of the cell.
+
+        Returns:
+            list[int] | None: A list of directions
+            (from previous cell to current cell) of the path.
+            None if the cell is out of bounds or cannot be reached.
+        """
+        if self.get_distance(target) is None:
+            return None
+        end = self.maze.index(target[0], target[1])
+        return self.reconstruct_path(self.parents, end)
+
+    def solve_maze(self: "MazeDistanceField") -> list[int] | None:
+        """
+        Get the shortest path from the entry to the exit from the field.
+
+        Returns:
+            list[int] | None: A list of directions
+            (from previous cell to current cell)
+            of the solution path. None if no solution was found.
+        """
+        return self.get_path(self.maze.exit)
+
+    def get_distance_rows(self: "MazeDistanceField") -> list[list[int]]:
+        """
+        Get the distance map of the maze.
+
+        Returns:
+            list[list[int]]: The distance of each cell from the entry,
+            row by row, UNREACHABLE for the cells that cannot be reached.
+        """
+        self.update()
+        width = self.maze.width
+        return [self.distances[y * width:(y + 1) * width].tolist()
+                for y in range(self.maze.height)]
+
+    def get_heatmap(self: "MazeDistanceField",
+                    levels: int = 10) -> list[bytes]:
+        """
+        Get the distance map scaled to a number of levels.
+
+        Args:
+            levels (int): The number of levels, from 0 at the entry
+            to levels - 1 for the furthest cells.
+
+        Returns:
+            list[bytes]: The level of each cell, row by row,
+            255 for the cells that cannot be reached.
+        """
+        self.update()
+        furthest = max(max(self.distances), 1)
+        table = [(d * levels // (furthest + 1)) if d >= 0 else 255
+                 for d in range(-1, furthest + 1)]
+        scaled = bytes(table[d + 1] for d in self.distances)
+        width = self.maze.width
+        return [scaled[y * width:(y + 1) * width]
+                for y in range(self.maze.height)]
+
+    def write_distance_map(self: "MazeDistanceField", path: str) -> None:
+        """
+        Write the distance map to a text file, one line per row,
+        distances separated by spaces, '-' for unreachable cells.
+        """
+        with open(path, "w") as file:
+            for row in self.get_distance_rows():
+                file.write(" ".join(str(d) if d >= 0 else "-"
+                                    for d in row) + "\n")
@@ -0,0 +1,201 @@
+"""
+The MazePathIndex class answers path and distance queries
+between any two cells of a perfect maze without searching.
+"""
+
+from __future__ import annotations
+from array import array
+from collections import deque
+from typing import TYPE_CHECKING
+
+from mazegen.grid.maze_bitset import BitSet
+
+# Import only for the type hint to avoid runtime import overhead
+if TYPE_CHECKING:
+    from mazegen.grid.maze_grid import Grid
+
+
+class MazePathIndex:
+    """
+    A class for querying paths in a perfect maze.
+    A perfect maze is a spanning tree of its cells, so there is exactly
+    one path between two cells: up from the first cell to their lowest
+    common ancestor (LCA), then down to the second cell.
+
+    The index is built once, with the entry as root of the tree.
+    It stores the depth and the direction from the parent of each cell,
+    and for binary lifting, the ancestor 2^k levels above each cell.
+    A query then takes O(log n) plus the length of the path.
+    The index is not updated when the walls of the maze change.
+    """
+
+    def __init__(self: "MazePathIndex", maze: Grid) -> None:
+        """
+        Build the index of a perfect maze.
+
+        Args:
+            maze (Grid): A perfect maze.
+
+        Raises:
+            ValueError: If the maze has a loop.
+        """
+        self.maze = maze
+        self.root = maze.index(maze.entry[0], maze.entry[1])
+        # Direction from the parent to each cell, 0 for the root
+        self.parents = array("b", bytes(maze.size))
+        self.depths = array("I", bytes(4 * maze.size))
+        self.reached = BitSet(maze.size)
+        # ancestors[k][cell] is the ancestor 2^k levels above the cell,
+        # the root (and cells not in the tree) are their own ancestors
+        self.ancestors: list[array[int]] = []
+        self.build()
+
+    def build(self: "MazePathIndex") -> None:
+        """
+        Walk the tree from the root with a BFS to find the parent
+        and depth of each cell, then build the ancestor tables.
+        """
+        maze = self.maze
+        steps = maze.steps
+        walls = maze.walls
+        neighbor_mask = maze.neighbor_mask
+        parents = self.parents
+        depths = self.depths
+        reached = self.reached
+        up = array("i", range(maze.size))
+
+        reached[self.root] = True
+        queue = deque([self.root])
+        max_depth = 0
+        while queue:
+            current = queue.popleft()
+            depth = depths[current] + 1
+            # The cell the walk came from is reached but not a loop
+            back = maze.OPPOSITE[parents[current]]
+            open_dirs = (walls[current] ^ 15) & neighbor_mask[current]
+            for dir, offset in steps[open_dirs]:
+                if dir == back:
+                    continue
+                neighbor = current + offset
+                if reached[neighbor]:
+                    raise ValueError("Cannot index a maze with loops, "
+                                     "the maze must be perfect.")
+                reached[neighbor] = True
+                parents[neighbor] = dir
+                depths[neighbor] = depth
+                up[neighbor] = current
+                queue.append(neighbor)
+            max_depth = depth - 1
+
+        self.ancestors = [up]
+        while 1 << len(self.ancestors) <= max_depth:
+            prev = self.ancestors[-1]
+            self.ancestors.append(array("i", map(prev.__getitem__, prev)))
+
+    def get_index(self: "MazePathIndex",
+                  pos: tuple[int, ...]) -> int | None:
+        """
+        Get the index of the cell at a position,
+        None if it is out of bounds or not in the tree.
+        """
+        cell = self.maze.get_cell(pos[0], pos[1])
+        if cell is None or not self.reached[cell.index]:
+            return None
+        return cell.index
+
+    def lift(self: "MazePathIndex", cell: int, levels: int) -> int:
+        """Get the ancestor of a cell a given number of levels above it."""
+        k = 0
+        while levels:
+            if levels & 1:
+                cell = self.ancestors[k][cell]
+            levels >>= 1
+            k += 1
+        return cell
+
+    def get_lca(self: "MazePathIndex", a: int, b: int) -> int:
+        """
+        Get the lowest common ancestor of two cells of the tree.
+
+        Args:
+            a (int): The index of the first cell.
+            b (int): The index of the second cell.
+
+        Returns:
+            int: The index of the deepest cell that is
+            an ancestor of both cells.
+        """
+        depths = self.depths
+        if depths[a] < depths[b]:
+            a, b = b, a
+        a = self.lift(a, depths[a] - depths[b])
+        if a == b:
+            return a
+        for up in reversed(self.ancestors):
+            if up[a] != up[b]:
+                a = up[a]
+                b = up[b]
+        return self.ancestors[0][a]
+
+    def get_distance(self: "MazePathIndex",
+                     start: tuple[int, ...],
+                     end: tuple[int, ...]) -> int | None:
+        """
+        Get the number of steps between two cells.
+
+        Args:
+            start (tuple[int, ...]): The position (x, y) of the first cell.
+            end (tuple[int, ...]): The position (x, y) of the second cell.
+
+        Returns:
+            int | None: The length of the path between the cells.
+            None if a cell is out of bounds or not connected to the entry.
+        """
+        a = self.get_index(start)
+        b = self.get_index(end)
+        if a is None or b is None:
+            return None
+        depths = self.depths
+        return depths[a] + depths[b] - 2 * depths[self.get_lca(a, b)]
+
+    def get_path(self: "MazePathIndex",
+                 start: tuple[int, ...],
+                 end: tuple[int, ...]) -> list[int] | None:
+        """
+        Get the path between two cells.
+
+        Args:
+            start (tuple[int, ...]): The position (x, y) of the first cell.
+            end (tuple[int, ...]): The position (x, y) of the second cell.
+
+        Returns:
+            list[int] | None: A list of directions
+            (from previous cell to current cell) of the path,
+            in the same format as MazeSolver.solve_maze().
+            None if a cell is out of bounds or not connected to the entry.
+        """
+        a = self.get_index(start)
+        b = self.get_index(end)
+        if a is None or b is None:
+            return None
+        lca = self.get_lca(a, b)
+        parents = self.parents
+        offsets = self.maze.offsets
+        opposite = self.maze.OPPOSITE
+
+        # Up from the first cell, against the parent directions
+        path = []
+        while a != lca:
+            dir = parents[a]
+            path.append(opposite[dir])
+            a -= offsets[dir]
+
+        # Down to the second cell, along the parent directions
+        down = []
+        while b != lca:
+            dir = parents[b]
+            down.append(dir)
+            b -= offsets[dir]
+        down.reverse()
+
+        return path + down
@@ -4,73 +4,146 @@ and includes functions to solve the maze.
 """
 
 from __future__ import annotations
+from array import array
+from collections import deque
 from typing import TYPE_CHECKING
 
-from mazegen.grid.maze_cell import Cell
 # Import only for the type hint to avoid runtime import overhead
 if TYPE_CHECKING:
+    from mazegen.config.maze_config import Config
     from mazegen.grid.maze_grid import Grid
 
 
 class MazeSolver:
     """
     A class for solving the maze.
+    The solver never changes the maze. It keeps its own 'visited' stamps,
+    so several solvers can work on the same maze at the same time.
+    A cell is visited in the current solve if its stamp is equal to
+    the current epoch, so nothing has to be reset between two solves.
     """
+
+    # Largest value of an unsigned int stamp
+    MAX_EPOCH = 0xFFFFFFFF
+
     def __init__(self: "MazeSolver", maze: Grid) -> None:
         """Initalize the maze solver."""
-        self.maze = self.reset_visited(maze)
+        self.maze = maze
+        self.epoch = 0
+        self.stamps = array("I", bytes(4 * maze.size))
+        # Only the parents of the cells visited in the current solve
+        # are read, so the array does not need to be cleared either
+        self.parents = array("b", bytes(maze.size))
+        # Cache of the solutions, from the maze
+        self.cache = maze.cache
+
+    @classmethod
+    def get_solver(cls: "type[MazeSolver]",
+                   config: Config) -> "type[MazeSolver]":
+        """
+        Get the solver class of the solver in the config file.
+        Default solver: BFS.
+        """
+        from mazegen.config.maze_config import ConfigError
+        from mazegen.solve.maze_solver_astar import MazeAStarSolver
+        from mazegen.solve.maze_solver_bidir import MazeBidirSolver
+        from mazegen.solve.maze_solver_junction import MazeJunctionSolver
+
+        solvers: dict[str, type[MazeSolver]] = {
+            "bfs": MazeSolver,
+            "bidir": MazeBidirSolver,
+            "astar": MazeAStarSolver,
+            "junction": MazeJunctionSolver
+        }
+        if not hasattr(config, "solver"):
+            return MazeSolver
+        if config.solver not in solvers:
+            raise ConfigError(f"ConfigError: Solver {config.solver} "
+                              "is not implemented.")
+        return solvers[config.solver]
+
+    def solve(self: "MazeSolver") -> list[int] | None:
+        """
+        Get the solution of the maze from the cache of the maze,
+        or find it with solve_maze() and store it in the cache.
+        The solutions are stored by walls, entry and exit of the maze
+        and by solver, so a maze changed since it was generated
+        is solved again. Without a cache, same as solve_maze().
 
-    def reset_visited(self: "MazeSolver", maze: Grid) -> Grid:
+        Returns:
+            list[int] | None: A list of directions
+            (from previous cell to current cell)
+            of the solution path. None if no solution was found.
         """
-        Resets 'visited' vallue of all cells in a maze
-        except for the 42 pattern.
+        if self.cache is None:
+            return self.solve_maze()
+        key = self.cache.get_solution_key(self.maze, type(self).__name__)
+        found, solution = self.cache.load_solution(key)
+        if not found:
+            solution = self.solve_maze()
+            self.cache.store_solution(key, solution)
+        return solution
+
+    def next_epoch(self: "MazeSolver") -> int:
         """
-        for y in range(maze.height):
-            for x in range(maze.width):
-                cell = maze.get_cell(x, y)
-                if cell and cell.is_42 is False:
-                    cell.visited = False
-        return maze
+        Start a new solve, all cells become unvisited.
+
+        Returns:
+            int: The stamp of the cells visited in the new solve.
+        """
+        if len(self.stamps) != self.maze.size:
+            self.stamps = array("I", bytes(4 * self.maze.size))
+            self.parents = array("b", bytes(self.maze.size))
+            self.epoch = 0
+        if self.epoch == self.MAX_EPOCH:
+            # Clear the old stamps once every 2^32 solves
+            self.stamps = array("I", bytes(4 * self.maze.size))
+            self.epoch = 0
+        self.epoch += 1
+        return self.epoch
 
     def find_open_neighbors(self: "MazeSolver",
-                            current: Cell,
-                            queue: list[Cell],
-                            parents: dict[Cell, tuple[Cell, int] | None]
+                            current: int,
+                            queue: deque[int],
+                            parents: array[int]
                             ) -> None:
         """
         Find neighbors with an open wall that is not visited yet,
-        and add them to the queue, visited list, and parents dict,
+        and add them to the queue, visited stamps, and parents array,
         respectively.
 
         Args:
-            current (Cell): The cell to find neighbors from.
-            queue (list[Cell]): The BFS queue to add neighbors to.
-            parents (dict[Cell, tuple[Cell, int]]): A dictionary mapping
-            visited cells to its previous cell in the path.
+            current (int): The index of the cell to find neighbors from.
+            queue (deque[int]): The BFS queue to add neighbors to.
+            parents (array[int]): The direction from the previous cell
+            in the path to each visited cell, 0 for no previous cell.
         """
-        for dir in Cell.get_dirs():
-            if current.has_wall(dir):
-                continue
-
-            neighbor = self.maze.get_neighbor(current, dir)
-            if neighbor and neighbor.visited is False:
-                neighbor.visited = True
+        stamps = self.stamps
+        epoch = self.epoch
+        maze = self.maze
+        open_dirs = (maze.walls[current] ^ 15) & maze.neighbor_mask[current]
+        for dir, offset in maze.steps[open_dirs]:
+            neighbor = current + offset
+            if stamps[neighbor] != epoch:
+                stamps[neighbor] = epoch
                 queue.append(neighbor)
-                parents[neighbor] = (current, dir)
+                parents[neighbor] = dir
 
     def reconstruct_path(self: "MazeSolver",
-                         parents: dict[Cell, tuple[Cell, int] | None],
-                         end: Cell) -> list[int]:
+                         parents: array[int],
+                         end: int) -> list[int]:
         """
         Reconstructs the solution from the exit based on stored parents info.
         """
         solution = []
+        offsets = self.maze.offsets
 
         current = end
-        while parents[current] is not None:
-            parent, dir = parents[current]  # type: ignore
+        while parents[current]:
+            dir = parents[current]
             solution.append(dir)
-            current = parent
+            # Step back to the previous cell
+            current -= offsets[dir]
 
         solution.reverse()
         return solution
@@ -85,17 +158,23 @@ class MazeSolver:
             (from previous cell to current cell)
             of the solution path. None if no solution was found.
         """
-        start = self.maze.get_cell(self.maze.entry[0], self.maze.entry[1])
-        end = self.maze.get_cell(self.maze.exit[0], self.maze.exit[1])
-        if start is None or end is None:
+        start_cell = self.maze.get_cell(self.maze.entry[0],
+                                        self.maze.entry[1])
+        end_cell = self.maze.get_cell(self.maze.exit[0], self.maze.exit[1])
+        if start_cell is None or end_cell is None:
             return None
+        start = start_cell.index
+        end = end_cell.index
 
-        start.visited = True
-        queue = [start]
-        parents: dict[Cell, tuple[Cell, int] | None] = {start: None}
+        epoch = self.next_epoch()
+        self.stamps[start] = epoch
+        queue = deque([start])
+        # One direction per cell instead of a dict of tuples
+        parents = self.parents
+        parents[start] = 0
 
         while queue:
-            current = queue.pop(0)
+            current = queue.popleft()
             if current == end:
                 return self.reconstruct_path(parents, end)
 
@@ -0,0 +1,157 @@
+"""
+The MazeBidirSolver class solves a maze with a bidirectional
+Breadth-First Search, expanding from the entry and the exit at once.
+"""
+
+from __future__ import annotations
+from array import array
+from collections import deque
+from typing import TYPE_CHECKING
+
+from mazegen.solve.maze_solver import MazeSolver
+
+# Import only for the type hint to avoid runtime import overhead
+if TYPE_CHECKING:
+    from mazegen.grid.maze_grid import Grid
+
+
+class MazeBidirSolver(MazeSolver):
+    """
+    Subclass of MazeSolver.
+    Runs one BFS from the entry and one from the exit,
+    always expanding a full level of the smaller frontier,
+    and stops as soon as the two searches meet.
+    Each search only has to go about half the distance,
+    so far fewer cells are visited than with a single BFS.
+
+    Each solve uses two epochs: cells visited from the entry
+    are stamped with the first one, cells visited from the exit
+    with the second one.
+    """
+
+    def __init__(self: "MazeBidirSolver", maze: Grid) -> None:
+        """Initalize the maze solver."""
+        super().__init__(maze)
+        # Direction from each cell to the next cell towards the exit
+        self.next_dirs = array("b", bytes(maze.size))
+
+    def next_epoch(self: "MazeBidirSolver") -> int:
+        """
+        Start a new solve, all cells become unvisited.
+
+        Returns:
+            int: The stamp of the cells visited from the entry.
+            The stamp of the cells visited from the exit is one more.
+        """
+        if len(self.next_dirs) != self.maze.size:
+            self.next_dirs = array("b", bytes(self.maze.size))
+        if self.epoch >= self.MAX_EPOCH - 1:
+            # Both epochs of the solve must fit
+            self.epoch = self.MAX_EPOCH
+        epoch = super().next_epoch()
+        super().next_epoch()
+        return epoch
+
+    def expand_level(self: "MazeBidirSolver",
+                     queue: deque[int],
+                     links: array[int],
+                     own: int,
+                     other: int,
+                     forward: bool) -> tuple[int, int, int] | None:
+        """
+        Visit the open neighbors of all cells of the current level
+        of one search.
+
+        Args:
+            queue (deque[int]): The queue of the search.
+            links (array[int]): The parent directions of the search.
+            own (int): The stamp of the cells visited by the search.
+            other (int): The stamp of the cells visited by the other search.
+            forward (bool): True for the search from the entry.
+
+        Returns:
+            tuple[int, int, int] | None: The cell reached from the entry,
+            the cell reached from the exit where the searches meet,
+            and the direction between them. None if they did not meet.
+        """
+        stamps = self.stamps
+        steps = self.maze.steps
+        walls = self.maze.walls
+        neighbor_mask = self.maze.neighbor_mask
+        opposite = self.maze.OPPOSITE
+        for _ in range(len(queue)):
+            current = queue.popleft()
+            open_dirs = (walls[current] ^ 15) & neighbor_mask[current]
+            for dir, offset in steps[open_dirs]:
+                neighbor = current + offset
+                stamp = stamps[neighbor]
+                if stamp == other:
+                    if forward:
+                        return current, neighbor, dir
+                    return neighbor, current, opposite[dir]
+                if stamp != own:
+                    stamps[neighbor] = own
+                    queue.append(neighbor)
+                    # The search from the exit walks against the path
+                    links[neighbor] = dir if forward else opposite[dir]
+        return None
+
+    def join_paths(self: "MazeBidirSolver",
+                   meet: tuple[int, int, int]) -> list[int]:
+        """
+        Reconstructs the solution from the cells where the searches met.
+        """
+        near, far, dir = meet
+        solution = self.reconstruct_path(self.parents, near)
+        solution.append(dir)
+
+        offsets = self.maze.offsets
+        next_dirs = self.next_dirs
+        current = far
+        while next_dirs[current]:
+            dir = next_dirs[current]
+            solution.append(dir)
+            current += offsets[dir]
+
+        return solution
+
+    def solve_maze(self: "MazeBidirSolver") -> list[int] | None:
+        """
+        A function to find the shortest path from entry to exit
+        using a bidirectional Breadth-First Search.
+
+        Returns:
+            list[int] | None: A list of directions
+            (from previous cell to current cell)
+            of the solution path. None if no solution was found.
+        """
+        start_cell = self.maze.get_cell(self.maze.entry[0],
+                                        self.maze.entry[1])
+        end_cell = self.maze.get_cell(self.maze.exit[0], self.maze.exit[1])
+        if start_cell is None or end_cell is None:
+            return None
+        start = start_cell.index
+        end = end_cell.index
+        if start == end:
+            return []
+
+        forward = self.next_epoch()
+        backward = forward + 1
+        self.stamps[start] = forward
+        self.stamps[end] = backward
+        self.parents[start] = 0
+        self.next_dirs[end] = 0
+        queue_start = deque([start])
+        queue_end = deque([end])
+
+        while queue_start and queue_end:
+            if len(queue_start) <= len(queue_end):
+                meet = self.expand_level(queue_start, self.parents,
+                                         forward, backward, True)
+            else:
+                meet = self.expand_level(queue_end, self.next_dirs,
+                                         backward, forward, False)
+            if meet is not None:
+                return self.join_paths(meet)
+
+        return None
@@ -0,0 +1,251 @@
+"""
+The MazeIncrementalSolver class keeps the distance field from the entry
+up to date while walls are opened and closed one at a time.
+"""
+
+from __future__ import annotations
+from collections import deque
+from heapq import heappop, heappush
+
+from mazegen.solve.maze_distance_field import MazeDistanceField
+
+
+class MazeIncrementalSolver(MazeDistanceField):
+    """
+    Subclass of MazeDistanceField.
+    Walls are opened and closed through open_wall() and close_wall(),
+    which only update the distances of the cells affected by the change
+    (dynamic BFS), and return the new solution:
+    - Opening a wall can only make cells closer to the entry.
+      If one side is more than one step closer than the other,
+      the other side and its surroundings are improved with a BFS
+      that stops where the distances do not improve anymore.
+    - Closing a wall only matters if the wall was on the path
+      from the entry to one of the cells (the parent of one side
+      is the other side). Then the cells whose path used the wall
+      (the branch of the BFS tree below it) are taken out,
+      and their distances are computed again from the cells around
+      the branch with Dijkstra's algorithm, inside the branch only.
+
+    Walls changed in another way make the field stale,
+    and the next query computes the whole field again.
+    """
+
+    def open_wall(self: "MazeIncrementalSolver", index: int,
+                  direction: int) -> list[int] | None:
+        """
+        Remove a wall between two cells and update the distance field.
+
+        Args:
+            index (int): The index of the cell.
+            direction (int): The direction of the wall from the cell.
+
+        Returns:
+            list[int] | None: The new solution, a list of directions
+            (from previous cell to current cell) from entry to exit.
+            None if no solution was found.
+        """
+        self.update()
+        maze = self.maze
+        if (not maze.neighbor_mask[index] >> 4 & direction
+                or not maze.walls[index] & direction):
+            return self.solve_maze()
+
+        maze.remove_wall_btw(index, direction)
+        neighbor = index + maze.offsets[direction]
+        distances = self.distances
+        if self.is_shorter_through(index, neighbor):
+            self.improve(neighbor, distances[index] + 1, direction)
+        elif self.is_shorter_through(neighbor, index):
+            self.improve(index, distances[neighbor] + 1,
+                         maze.OPPOSITE[direction])
+
+        self.revision = maze.revision
+        return self.solve_maze()
+
+    def close_wall(self: "MazeIncrementalSolver", index: int,
+                   direction: int) -> list[int] | None:
+        """
+        Add a wall between two cells and update the distance field.
+
+        Args:
+            index (int): The index of the cell.
+            direction (int): The direction of the wall from the cell.
+
+        Returns:
+            list[int] | None: The new solution, a list of directions
+            (from previous cell to current cell) from entry to exit.
+            None if no solution was found.
+        """
+        self.update()
+        maze = self.maze
+        if (not maze.neighbor_mask[index] >> 4 & direction
+                or maze.walls[index] & direction):
+            return self.solve_maze()
+
+        maze.add_wall_btw(index, direction)
+        neighbor = index + maze.offsets[direction]
+        if self.is_parent(index, neighbor, direction):
+            self.rebuild_branch(neighbor)
+        elif self.is_parent(neighbor, index, maze.OPPOSITE[direction]):
+            self.rebuild_branch(index)
+
+        self.revision = maze.revision
+        return self.solve_maze()
+
+    def is_shorter_through(self: "MazeIncrementalSolver", cell: int,
+                           neighbor: int) -> bool:
+        """Check whether the neighbor gets closer by going through the cell."""
+        distances = self.distances
+        if distances[cell] == self.UNREACHABLE:
+            return False
+        return (distances[neighbor] == self.UNREACHABLE
+                or distances[neighbor] > distances[cell] + 1)
+
+    def is_parent(self: "MazeIncrementalSolver", cell: int,
+                  neighbor: int, direction: int) -> bool:
+        """
+        Check whether a cell is the previous cell on the path
+        from the entry to its neighbor in a given direction.
+        """
+        distances = self.distances
+        return (self.parents[neighbor] == direction
+                and distances[cell] != self.UNREACHABLE
+                and distances[neighbor] == distances[cell] + 1)
+
+    def improve(self: "MazeIncrementalSolver", cell: int,
+                distance: int, direction: int) -> None:
+        """
+        Set a shorter distance to a cell, and spread it with a BFS
+        to the cells around that get closer too.
+        """
+        distances = self.distances
+        parents = self.parents
+        steps = self.maze.steps
+        walls = self.maze.walls
+        neighbor_mask = self.maze.neighbor_mask
+
+        distances[cell] = distance
+        parents[cell] = direction
+        queue = deque([cell])
+        while queue:
+            current = queue.popleft()
+            distance = distances[current] + 1
+            open_dirs = (walls[current] ^ 15) & neighbor_mask[current]
+            for dir, offset in steps[open_dirs]:
+                neighbor = current + offset
+                old = distances[neighbor]
+                if old == self.UNREACHABLE or old > distance:
+                    distances[neighbor] = distance
+                    parents[neighbor] = dir
+                    queue.append(neighbor)
+
+    def get_branch(self: "MazeIncrementalSolver", root: int) -> list[int]:
+        """
+        Get the cells whose path from the entry goes through a cell,
+        and mark them with the current epoch.
+        The branch is walked level by level, so that a cell with
+        another neighbor one step closer to the entry outside of
+        the branch only changes its parent and stays out of it.
+        """
+        distances = self.distances
+        parents = self.parents
+        steps = self.maze.steps
+        walls = self.maze.walls
+        neighbor_mask = self.maze.neighbor_mask
+        stamps = self.stamps
+        epoch = self.next_epoch()
+
+        if self.find_other_parent(root, epoch):
+            return []
+        stamps[root] = epoch
+        branch = [root]
+        queue = deque([root])
+        while queue:
+            current = queue.popleft()
+            distance = distances[current] + 1
+            open_dirs = (walls[current] ^ 15) & neighbor_mask[current]
+            for dir, offset in steps[open_dirs]:
+                neighbor = current + offset
+                if (parents[neighbor] != dir
+                        or distances[neighbor] != distance
+                        or stamps[neighbor] == epoch):
+                    continue
+                if not self.find_other_parent(neighbor, epoch):
+                    stamps[neighbor] = epoch
+                    branch.append(neighbor)
+                    queue.append(neighbor)
+        return branch
+
+    def find_other_parent(self: "MazeIncrementalSolver", cell: int,
+                          epoch: int) -> bool:
+        """
+        Look for a neighbor one step closer to the entry that is not
+        in the branch (stamped with the epoch), and make it the parent.
+
+        Returns:
+            bool: True if the cell got a new parent.
+        """
+        distances = self.distances
+        distance = distances[cell] - 1
+        maze = self.maze
+        open_dirs = (maze.walls[cell] ^ 15) & maze.neighbor_mask[cell]
+        for dir, offset in maze.steps[open_dirs]:
+            neighbor = cell + offset
+            if (distances[neighbor] == distance
+                    and self.stamps[neighbor] != epoch):
+                self.parents[cell] = self.maze.OPPOSITE[dir]
+                return True
+        return False
+
+    def rebuild_branch(self: "MazeIncrementalSolver", root: int) -> None:
+        """
+        Compute again the distances of the cells whose path
+        from the entry went through a cell that lost its parent.
+        """
+        distances = self.distances
+        parents = self.parents
+        steps = self.maze.steps
+        walls = self.maze.walls
+        neighbor_mask = self.maze.neighbor_mask
+        opposite = self.maze.OPPOSITE
+        stamps = self.stamps
+
+        branch = self.get_branch(root)
+        epoch = self.epoch
+        for cell in branch:
+            distances[cell] = self.UNREACHABLE
+
+        # Start from the best neighbor outside of the branch
+        heap: list[tuple[int, int]] = []
+        for cell in branch:
+            best = self.UNREACHABLE
+            open_dirs = (walls[cell] ^ 15) & neighbor_mask[cell]
+            for dir, offset in steps[open_dirs]:
+                neighbor = cell + offset
+                distance = distances[neighbor]
+                if stamps[neighbor] == epoch or distance == self.UNREACHABLE:
+                    continue
+                if best == self.UNREACHABLE or distance + 1 < best:
+                    best = distance + 1
+                    parents[cell] = opposite[dir]
+            if best != self.UNREACHABLE:
+                distances[cell] = best
+                heappush(heap, (best, cell))
+
+        # Spread the distances inside of the branch
+        while heap:
+            distance, current = heappop(heap)
+            if distance != distances[current]:
+                continue
+            distance += 1
+            open_dirs = (walls[current] ^ 15) & neighbor_mask[current]
+            for dir, offset in steps[open_dirs]:
+                neighbor = current + offset
+                if stamps[neighbor] != epoch:
+                    continue
+                old = distances[neighbor]
+                if old == self.UNREACHABLE or old > distance:
+                    distances[neighbor] = distance
+                    parents[neighbor] = dir
+                    heappush(heap, (distance, neighbor))
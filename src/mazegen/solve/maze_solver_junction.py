@@ -0,0 +1,362 @@
+"""
+The MazeJunctionSolver class solves a maze on a smaller graph
+of its junctions, where corridors are contracted into weighted edges
+and dead-end branches are left out.
+"""
+
+from __future__ import annotations
+from array import array
+from heapq import heappop, heappush
+from typing import TYPE_CHECKING
+
+from mazegen.solve.maze_solver import MazeSolver
+
+# Import only for the type hint to avoid runtime import overhead
+if TYPE_CHECKING:
+    from mazegen.grid.maze_grid import Grid
+
+# Edge of the junction graph: the node at the end, and the directions
+# from the cell at the start to the cell at the end
+Edge = tuple[int, bytes]
+
+
+class MazeJunctionSolver(MazeSolver):
+    """
+    Subclass of MazeSolver.
+    A shortest path never enters a dead-end branch of the maze unless
+    the entry or the exit is in it, and most of the other cells are
+    corridor cells with exactly two openings.
+    The junction graph is built in two steps:
+    - Dead ends are removed one by one until only the loops
+      of the maze are left (the 2-core). Each removed cell keeps
+      the direction towards the cell it was attached to.
+    - The cells left with three or more openings are the nodes,
+      and each corridor between two nodes is an edge, with
+      the directions to walk along it.
+
+    The graph is built once and built again when the walls of the maze
+    have changed (the revision of the grid is different).
+    Each solve climbs from the entry and the exit to the loops,
+    adds them to the graph, runs Dijkstra's algorithm on the graph,
+    and expands the edges of the shortest path back into directions.
+    """
+
+    # Masks of open walls with exactly two open walls
+    CORRIDORS = frozenset(mask for mask in range(16)
+                          if bin(mask).count("1") == 2)
+
+    def __init__(self: "MazeJunctionSolver", maze: Grid) -> None:
+        """Initalize the maze solver, the graph is built on first solve."""
+        super().__init__(maze)
+        # Open walls of each cell towards cells that are left in the graph
+        self.links = bytearray(maze.size)
+        # Direction from each removed cell towards the loops
+        self.toward = bytearray(maze.size)
+        # Node number of each cell, -1 for cells that are not nodes
+        self.node_of = array("i", [-1]) * maze.size
+        # Edges of node n are first[n] to first[n + 1] - 1
+        self.first = array("i", [0])
+        self.targets = array("i")
+        self.lengths = array("i")
+        self.paths: list[bytes] = []
+        self.nodes = array("i")
+        # Revision of the maze the graph was built for
+        self.revision: int | None = None
+
+    def prune_dead_ends(self: "MazeJunctionSolver") -> None:
+        """
+        Remove the dead ends one by one, until only cells
+        with at least two openings to other cells are left.
+        """
+        maze = self.maze
+        offsets = maze.offsets
+        opposite = maze.OPPOSITE
+        # The open walls toward a neighbor inside the grid
+        links = bytearray((mask ^ 15) & bounds for mask, bounds
+                          in zip(maze.walls, maze.neighbor_mask))
+        toward = bytearray(maze.size)
+        degree = bytes.maketrans(bytes(range(16)),
+                                 bytes(bin(mask).count("1")
+                                       for mask in range(16)))
+        degrees = links.translate(degree)
+
+        stack = [cell for cell in range(maze.size) if degrees[cell] == 1]
+        while stack:
+            cell = stack.pop()
+            if degrees[cell] != 1:
+                continue
+            dir = links[cell]
+            neighbor = cell + offsets[dir]
+            toward[cell] = dir
+            links[cell] = 0
+            degrees[cell] = 0
+            links[neighbor] &= ~opposite[dir]
+            degrees[neighbor] -= 1
+            if degrees[neighbor] == 1:
+                stack.append(neighbor)
+
+        self.links = links
+        self.toward = toward
+
+    def walk(self: "MazeJunctionSolver", start: int, dir: int,
+             stop: int = -1) -> Edge | None:
+        """
+        Walk along a corridor of the graph from a cell to the next node.
+
+        Args:
+            start (int): The index of the cell to walk from.
+            dir (int): The direction of the first step.
+            stop (int): A corridor cell to stop at as well.
+
+        Returns:
+            Edge | None: The cell where the walk stopped and the
+            directions of the walk. None if the corridor is a loop
+            back to the start.
+        """
+        links = self.links
+        offsets = self.maze.offsets
+        opposite = self.maze.OPPOSITE
+        corridors = self.CORRIDORS
+
+        dirs = bytearray()
+        current = start
+        while True:
+            dirs.append(dir)
+            current += offsets[dir]
+            if (current == start or current == stop
+                    or links[current] not in corridors):
+                break
+            # The only opening that is not the one walked through
+            dir = links[current] & ~opposite[dir]
+
+        if current == start:
+            return None
+        return current, bytes(dirs)
+
+    def build(self: "MazeJunctionSolver") -> None:
+        """
+        Build the junction graph, if the walls have changed.
+        """
+        if self.revision == self.maze.revision:
+            return
+
+        self.prune_dead_ends()
+        steps = self.maze.steps
+        links = self.links
+        corridors = self.CORRIDORS
+
+        # Number the nodes
+        node_of = array("i", [-1]) * self.maze.size
+        nodes = array("i", (cell for cell in range(self.maze.size)
+                            if links[cell] and links[cell] not in corridors))
+        for node, cell in enumerate(nodes):
+            node_of[cell] = node
+
+        # Store the edges of all nodes in flat arrays
+        first = array("i", [0])
+        targets = array("i")
+        lengths = array("i")
+        paths = []
+        for cell in nodes:
+            for dir, _ in steps[links[cell]]:
+                # Corridors that loop back to the cell are left out
+                edge = self.walk(cell, dir)
+                if edge is not None:
+                    targets.append(node_of[edge[0]])
+                    lengths.append(len(edge[1]))
+                    paths.append(edge[1])
+            first.append(len(targets))
+
+        self.node_of = node_of
+        self.nodes = nodes
+        self.first = first
+        self.targets = targets
+        self.lengths = lengths
+        self.paths = paths
+        self.revision = self.maze.revision
+
+    def climb(self: "MazeJunctionSolver",
+              cell: int) -> tuple[list[int], bytearray]:
+        """
+        Climb from a cell along the removed cells towards the loops.
+
+        Returns:
+            tuple[list[int], bytearray]: The cells of the climb,
+            from the cell to the first cell left in the graph
+            (or the last cell of a maze part without loops),
+            and the directions between them.
+        """
+        toward = self.toward
+        offsets = self.maze.offsets
+        cells = [cell]
+        dirs = bytearray()
+        while toward[cell]:
+            dir = toward[cell]
+            dirs.append(dir)
+            cell += offsets[dir]
+            cells.append(cell)
+        return cells, dirs
+
+    def get_terminal_edges(self: "MazeJunctionSolver", start: int,
+                           end: int) -> tuple[int, int, dict[int, list[Edge]]]:
+        """
+        Add the cells where the entry and the exit join the graph
+        to the graph, if they are not nodes. They get the numbers
+        after the last node, with edges from the start cell and
+        into the end cell.
+
+        Returns:
+            tuple[int, int, dict[int, list[Edge]]]: The node numbers
+            of the start and end cells, and the extra edges of each node.
+        """
+        steps = self.maze.steps
+        links = self.links
+        opposite = self.maze.OPPOSITE
+        node_of = self.node_of
+        source = node_of[start] if node_of[start] >= 0 else len(self.nodes)
+        target = node_of[end] if node_of[end] >= 0 else len(self.nodes) + 1
+        extra: dict[int, list[Edge]] = {}
+
+        if node_of[start] < 0:
+            extra[source] = []
+            for dir, _ in steps[links[start]]:
+                edge = self.walk(start, dir, end)
+                if edge is not None:
+                    cell, dirs = edge
+                    node = target if cell == end else node_of[cell]
+                    extra[source].append((node, dirs))
+
+        if node_of[end] < 0:
+            for dir, _ in steps[links[end]]:
+                edge = self.walk(end, dir, start)
+                if edge is None:
+                    continue
+                cell, dirs = edge
+                if node_of[cell] < 0:
+                    # The start cell, already has an edge to the end
+                    continue
+                # Walk the corridor back from the node to the exit
+                back = bytes(opposite[d] for d in reversed(dirs))
+                extra.setdefault(node_of[cell], []).append((target, back))
+
+        return source, target, extra
+
+    def solve_maze(self: "MazeJunctionSolver") -> list[int] | None:
+        """
+        A function to find the shortest path from entry to exit
+        using Dijkstra's algorithm on the junction graph.
+
+        Returns:
+            list[int] | None: A list of directions
+            (from previous cell to current cell)
+            of the solution path. None if no solution was found.
+        """
+        start_cell = self.maze.get_cell(self.maze.entry[0],
+                                        self.maze.entry[1])
+        end_cell = self.maze.get_cell(self.maze.exit[0], self.maze.exit[1])
+        if start_cell is None or end_cell is None:
+            return None
+
+        self.build()
+        opposite = self.maze.OPPOSITE
+        start_cells, start_dirs = self.climb(start_cell.index)
+        end_cells, end_dirs = self.climb(end_cell.index)
+
+        # Both climbs meet before the graph if the entry and exit
+        # are in the same dead-end branch
+        on_start_climb = {cell: i for i, cell in enumerate(start_cells)}
+        for j, cell in enumerate(end_cells):
+            if cell in on_start_climb:
+                i = on_start_climb[cell]
+                return (list(start_dirs[:i])
+                        + [opposite[d] for d in reversed(end_dirs[:j])])
+
+        start = start_cells[-1]
+        end = end_cells[-1]
+        if not self.links[start] or not self.links[end]:
+            # Not connected to the loops, in different parts of the maze
+            return None
+
+        middle = self.search(start, end)
+        if middle is None:
+            return None
+        return (list(start_dirs) + middle
+                + [opposite[d] for d in reversed(end_dirs)])
+
+    def search(self: "MazeJunctionSolver", start: int,
+               end: int) -> list[int] | None:
+        """
+        Find the shortest path between two cells of the graph
+        with Dijkstra's algorithm.
+
+        Returns:
+            list[int] | None: A list of directions of the path.
+            None if the cells are not connected.
+        """
+        source, target, extra = self.get_terminal_edges(start, end)
+
+        first = self.first
+        targets = self.targets
+        lengths = self.lengths
+        paths = self.paths
+        node_count = len(self.nodes)
+
+        # Extra edges are numbered after the edges of the graph
+        extra_paths: list[bytes] = []
+        extra_edges: dict[int, list[tuple[int, int]]] = {}
+        for node, node_edges in extra.items():
+            for neighbor, dirs in node_edges:
+                extra_edges.setdefault(node, []).append(
+                    (neighbor, len(paths) + len(extra_paths)))
+                extra_paths.append(dirs)
+
+        # Each heap entry is one int: distance << shift | node
+        shift = (node_count + 2).bit_length()
+        mask = (1 << shift) - 1
+        unreached = 0x7FFFFFFF
+        distances = array("i", [unreached]) * (node_count + 2)
+        # The node before each node on the shortest path,
+        # and the edge walked from it
+        previous = array("i", [-1]) * (node_count + 2)
+        previous_edge = array("i", [-1]) * (node_count + 2)
+        distances[source] = 0
+        heap = [source]
+        while heap:
+            entry = heappop(heap)
+            node = entry & mask
+            distance = entry >> shift
+            if distance != distances[node]:
+                continue
+            if node == target:
+                break
+            if node < node_count:
+                for edge in range(first[node], first[node + 1]):
+                    neighbor = targets[edge]
+                    new_distance = distance + lengths[edge]
+                    if new_distance < distances[neighbor]:
+                        distances[neighbor] = new_distance
+                        previous[neighbor] = node
+                        previous_edge[neighbor] = edge
+                        heappush(heap, new_distance << shift | neighbor)
+            for neighbor, edge in extra_edges.get(node, ()):
+                new_distance = distance + len(extra_paths[edge - len(paths)])
+                if new_distance < distances[neighbor]:
+                    distances[neighbor] = new_distance
+                    previous[neighbor] = node
+                    previous_edge[neighbor] = edge
+                    heappush(heap, new_distance << shift | neighbor)
+        else:
+            return None
+
+        # Expand the edges of the path back into directions
+        parts = []
+        node = target
+        while node != source:
+            edge = previous_edge[node]
+            if edge < len(paths):
+                parts.append(paths[edge])
+            else:
+                parts.append(extra_paths[edge - len(paths)])
+            node = previous[node]
+        parts.reverse()
+        return list(b"".join(parts))
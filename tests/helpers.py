@@ -0,0 +1,138 @@
+"""
+Helpers shared by the tests: configs, and checks of a maze that
+walk its walls directly instead of using the tables of Grid,
+so that they do not share the bugs of the code they check.
+"""
+
+from collections import deque
+
+from mazegen.config.maze_config import Config
+from mazegen.grid.maze_grid import Grid
+
+# Step (dx, dy) and opposite of each direction
+MOVES = {
+    1: (0, -1, 4),
+    2: (1, 0, 8),
+    4: (0, 1, 1),
+    8: (-1, 0, 2)
+}
+
+
+def make_config(width: int = 21, height: int = 15, perfect: bool = True,
+                **keys: str) -> Config:
+    """
+    Make a config with the entry and the exit in opposite corners.
+
+    Args:
+        width (int): The width of the maze.
+        height (int): The height of the maze.
+        perfect (bool): The PERFECT value.
+        keys (str): Other keys of the config file, e.g. SEED="42".
+    """
+    values = {
+        "WIDTH": str(width),
+        "HEIGHT": str(height),
+        "ENTRY": "0,0",
+        "EXIT": f"{width - 1},{height - 1}",
+        "OUTPUT_FILE": "maze.txt",
+        "PERFECT": "true" if perfect else "false"
+    }
+    values.update(keys)
+    return Config(values)
+
+
+def get_open_neighbors(maze: Grid, index: int) -> list[tuple[int, int]]:
+    """Get the (direction, index) of the neighbors without a wall."""
+    x, y = index % maze.width, index // maze.width
+    neighbors = []
+    for dir, (dx, dy, _) in MOVES.items():
+        nx, ny = x + dx, y + dy
+        if (not maze.walls[index] & dir
+                and 0 <= nx < maze.width and 0 <= ny < maze.height):
+            neighbors.append((dir, ny * maze.width + nx))
+    return neighbors
+
+
+def check_walls(maze: Grid) -> None:
+    """Check that the border is closed and neighbors agree on walls."""
+    walls = maze.walls
+    assert len(walls) == maze.width * maze.height
+    for index in range(len(walls)):
+        x, y = index % maze.width, index // maze.width
+        for dir, (dx, dy, opposite) in MOVES.items():
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < maze.width and 0 <= ny < maze.height:
+                neighbor = ny * maze.width + nx
+                assert bool(walls[index] & dir) == bool(
+                    walls[neighbor] & opposite), (x, y, dir)
+            else:
+                assert walls[index] & dir, (x, y, dir)
+
+
+def get_distances(maze: Grid, start: int) -> dict[int, int]:
+    """Get the distance of every cell that can be reached from a cell."""
+    distances = {start: 0}
+    queue = deque([start])
+    while queue:
+        current = queue.popleft()
+        for _, neighbor in get_open_neighbors(maze, current):
+            if neighbor not in distances:
+                distances[neighbor] = distances[current] + 1
+                queue.append(neighbor)
+    return distances
+
+
+def get_shortest_length(maze: Grid) -> int | None:
+    """Get the length of a shortest path from the entry to the exit."""
+    start = maze.index(maze.entry[0], maze.entry[1])
+    end = maze.index(maze.exit[0], maze.exit[1])
+    return get_distances(maze, start).get(end)
+
+
+def count_passages(maze: Grid) -> int:
+    """Count the open walls between two cells."""
+    return sum(len(get_open_neighbors(maze, index))
+               for index in range(maze.size)) // 2
+
+
+def count_42_cells(maze: Grid) -> int:
+    """Count the cells of the 42 pattern."""
+    return sum(1 for index in range(maze.size) if maze.is_42[index])
+
+
+def check_connected(maze: Grid) -> None:
+    """Check that every cell outside of the 42 pattern can be reached."""
+    check_walls(maze)
+    start = maze.index(maze.entry[0], maze.entry[1])
+    reached = len(get_distances(maze, start))
+    assert reached == maze.size - count_42_cells(maze)
+
+
+def check_perfect(maze: Grid) -> None:
+    """Check that the maze is connected and has no loop."""
+    check_connected(maze)
+    assert count_passages(maze) == maze.size - count_42_cells(maze) - 1
+
+
+def check_solution(maze: Grid, solution: list[int] | None) -> None:
+    """Check that a solution is a shortest path from the entry to the exit."""
+    assert solution is not None
+    x, y = maze.entry[0], maze.entry[1]
+    for dir in solution:
+        assert not maze.walls[maze.index(x, y)] & dir, (x, y, dir)
+        dx, dy, _ = MOVES[dir]
+        x, y = x + dx, y + dy
+        assert 0 <= x < maze.width and 0 <= y < maze.height
+    assert (x, y) == tuple(maze.exit)
+    assert len(solution) == get_shortest_length(maze)
+
+
+def open_border(maze: Grid) -> None:
+    """Clear the wall bits on the border, as a hand-edited file could."""
+    width, height = maze.width, maze.height
+    for x in range(width):
+        maze.walls[x] &= ~1
+        maze.walls[(height - 1) * width + x] &= ~4
+    for y in range(height):
+        maze.walls[y * width] &= ~8
+        maze.walls[y * width + width - 1] &= ~2
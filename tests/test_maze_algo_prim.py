@@ -0,0 +1,31 @@
+"""Tests of the Prim generator with the frontier set."""
+
+import pytest
+
+from mazegen.maze_generator import MazeGenerator
+from mazegen.solve.maze_solver import MazeSolver
+from tests.helpers import (check_connected, check_perfect, check_solution,
+                           make_config)
+
+
+@pytest.mark.parametrize("size", [(21, 15), (40, 9), (9, 30)])
+@pytest.mark.parametrize("seed", ["1", "2"])
+def test_is_perfect(size: tuple[int, int], seed: str) -> None:
+    config = make_config(*size, ALGORITHM="prim", SEED=seed)
+    maze = MazeGenerator.generate_maze(config)
+    check_perfect(maze)
+    check_solution(maze, MazeSolver(maze).solve_maze())
+
+
+def test_imperfect_is_connected() -> None:
+    config = make_config(perfect=False, ALGORITHM="prim", SEED="7")
+    maze = MazeGenerator.generate_maze(config)
+    check_connected(maze)
+    check_solution(maze, MazeSolver(maze).solve_maze())
+
+
+def test_same_seed_same_maze() -> None:
+    config = make_config(ALGORITHM="prim", SEED="42")
+    first = MazeGenerator.generate_maze(config)
+    second = MazeGenerator.generate_maze(config)
+    assert first.walls == second.walls
@@ -0,0 +1,71 @@
+"""Tests of the cache of generated mazes and solutions."""
+
+from pathlib import Path
+
+import pytest
+
+from mazegen.io.maze_cache import MazeCache
+from mazegen.io.maze_packed import MazePacked
+from mazegen.maze_generator import MazeGenerator
+from mazegen.solve.maze_solver import MazeSolver
+from tests.helpers import check_solution, make_config
+
+
+@pytest.mark.parametrize("perfect", [True, False])
+@pytest.mark.parametrize("algorithm", ["dfs", "eller"])
+def test_hit_equals_miss(tmp_path: Path, perfect: bool,
+                         algorithm: str) -> None:
+    config = make_config(perfect=perfect, SEED="15", ALGORITHM=algorithm,
+                         CACHE="true", CACHE_DIR=str(tmp_path))
+    miss = MazeGenerator.generate_maze(config)
+    miss_solution = MazeSolver(miss).solve()
+    assert any(tmp_path.iterdir())
+
+    hit = MazeGenerator.generate_maze(config)
+    assert hit.walls == miss.walls
+    assert hit.perfect == miss.perfect
+    hit_solution = MazeSolver(hit).solve()
+    assert hit_solution == miss_solution
+    check_solution(hit, hit_solution)
+
+    uncached = make_config(perfect=perfect, SEED="15", ALGORITHM=algorithm)
+    assert MazeGenerator.generate_maze(uncached).walls == miss.walls
+
+
+def test_off_by_default(tmp_path: Path) -> None:
+    assert MazeCache.from_config(make_config(SEED="15")) is None
+    config = make_config(SEED="15", CACHE="false", CACHE_DIR=str(tmp_path))
+    assert MazeCache.from_config(config) is None
+    config = make_config(CACHE="true", CACHE_DIR=str(tmp_path))
+    assert MazeCache.from_config(config) is None
+
+
+def test_keys() -> None:
+    config = make_config(SEED="15")
+    key = MazeCache.get_config_key(config)
+    assert key == MazeCache.get_config_key(make_config(SEED="15"))
+    assert key != MazeCache.get_config_key(make_config(SEED="16"))
+    assert key != MazeCache.get_config_key(make_config(SEED="15",
+                                                       ALGORITHM="prim"))
+
+
+def test_evict(tmp_path: Path) -> None:
+    cache = MazeCache(str(tmp_path), max_size=0)
+    config = make_config(SEED="15")
+    maze = MazeGenerator.generate_maze(config)
+    key = MazeCache.get_config_key(config)
+    cache.store_maze(key, maze)
+    cache.evict()
+    assert cache.load_walls(key) is None
+
+
+@pytest.mark.parametrize("solution", [[], [1], [1, 2, 4, 8, 8, 4, 2]])
+def test_solution_round_trip(tmp_path: Path, solution: list[int]) -> None:
+    packed = MazePacked.pack_solution(solution)
+    assert MazePacked.unpack_solution(packed, len(solution)) == solution
+    cache = MazeCache(str(tmp_path))
+    cache.store_solution("key", solution)
+    assert cache.load_solution("key") == (True, solution)
+    cache.store_solution("none", None)
+    assert cache.load_solution("none") == (True, None)
+    assert cache.load_solution("missing") == (False, None)
@@ -0,0 +1,54 @@
+"""Tests of the compressed output files."""
+
+from pathlib import Path
+
+import pytest
+
+from mazegen.io.maze_compression import MazeCompression
+from mazegen.io.maze_loader import load_maze
+from mazegen.io.maze_validator import MazeValidator
+from mazegen.maze_generator import MazeGenerator
+from mazegen.solve.maze_solver import MazeSolver
+from tests.helpers import make_config
+from write_output import OutputWriter
+
+
+@pytest.mark.parametrize("name, format", [
+    ("maze.txt", MazeCompression.NONE),
+    ("maze.mzb", MazeCompression.NONE),
+    ("maze.txt.gz", MazeCompression.GZIP),
+    ("maze.txt.zz", MazeCompression.ZLIB),
+    ("maze.txt.xz", MazeCompression.LZMA)
+])
+@pytest.mark.parametrize("perfect", [True, False])
+def test_round_trip(tmp_path: Path, name: str, format: str,
+                    perfect: bool) -> None:
+    path = str(tmp_path / name)
+    config = make_config(45, 33, perfect, SEED="14", OUTPUT_FILE=path)
+    maze = MazeGenerator.generate_maze(config)
+    solution = MazeSolver(maze).solve_maze()
+    OutputWriter(maze, solution, config).write_output_file()
+
+    if not name.endswith(".mzb"):
+        assert MazeCompression.detect_format(path) == format
+        assert MazeValidator(path, config).validate()["valid"]
+    grid, loaded = load_maze(path)
+    assert grid.walls == maze.walls
+    assert loaded == solution
+
+
+@pytest.mark.parametrize("format", MazeCompression.FORMATS)
+def test_format_from_config(tmp_path: Path, format: str) -> None:
+    path = str(tmp_path / "maze.txt")
+    config = make_config(SEED="14", OUTPUT_FILE=path, COMPRESSION=format)
+    maze = MazeGenerator.generate_maze(config)
+    OutputWriter(maze, MazeSolver(maze).solve_maze(),
+                 config).write_output_file()
+    assert MazeCompression.detect_format(path) == format
+    grid, _ = load_maze(path)
+    assert grid.walls == maze.walls
+
+
+def test_unknown_format(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        MazeCompression.open(str(tmp_path / "maze.txt"), "wb", "zip")
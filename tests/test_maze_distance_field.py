@@ -0,0 +1,56 @@
+"""Tests of the distance field from the entry."""
+
+import pytest
+
+from mazegen.algo.maze_imperfect import MazeImperfect
+from mazegen.maze_generator import MazeGenerator
+from mazegen.solve.maze_distance_field import MazeDistanceField
+from tests.helpers import (check_solution, get_distances, make_config,
+                           open_border)
+
+
+@pytest.mark.parametrize("perfect", [True, False])
+def test_matches_bfs(perfect: bool) -> None:
+    maze = MazeGenerator.generate_maze(make_config(31, 23, perfect,
+                                                   SEED="8"))
+    field = MazeDistanceField(maze)
+    expected = get_distances(maze, 0)
+    for index in range(maze.size):
+        pos = maze.get_pos(index)
+        assert field.get_distance(pos) == expected.get(index)
+    check_solution(maze, field.solve_maze())
+
+
+def test_stale_after_wall_edit() -> None:
+    maze = MazeGenerator.generate_maze(make_config(perfect=False, SEED="8"))
+    field = MazeDistanceField(maze)
+    check_solution(maze, field.solve_maze())
+    for index in range(maze.size - 1):
+        if (maze.walls[index] & 2 and (index + 1) % maze.width
+                and not maze.is_42[index] and not maze.is_42[index + 1]):
+            maze.remove_wall_btw(index, 2)
+    assert field.is_stale()
+    check_solution(maze, field.solve_maze())
+
+
+def test_open_border_is_not_crossed() -> None:
+    maze = MazeGenerator.generate_maze(make_config(perfect=False, SEED="4"))
+    open_border(maze)
+    check_solution(maze, MazeDistanceField(maze).solve_maze())
+
+
+def test_revision_shared_with_perfect_maze() -> None:
+    maze = MazeGenerator.generate_maze(make_config(perfect=False, SEED="8"))
+    assert isinstance(maze, MazeImperfect)
+    on_imperfect = MazeDistanceField(maze)
+    on_perfect = MazeDistanceField(maze.maze)
+    on_imperfect.update()
+    on_perfect.update()
+    index = next(i for i in range(maze.size)
+                 if maze.walls[i] & 2 and maze.neighbor_mask[i] >> 4 & 2)
+    maze.maze.remove_wall_btw(index, 2)
+    assert on_imperfect.is_stale()
+    on_imperfect.update()
+    maze.add_wall_btw(index, 2)
+    assert on_perfect.is_stale()
+    assert on_imperfect.is_stale()
@@ -0,0 +1,52 @@
+"""Tests of the flat arrays of Grid and of the DFS generator."""
+
+import pytest
+
+from mazegen.grid.maze_bitset import BitSet
+from mazegen.grid.maze_grid import Grid
+from mazegen.maze_generator import MazeGenerator
+from mazegen.solve.maze_solver import MazeSolver
+from tests.helpers import (check_connected, check_perfect, check_solution,
+                           make_config)
+
+
+def test_new_grid_is_closed() -> None:
+    grid = Grid(make_config(9, 7))
+    assert isinstance(grid.walls, bytearray)
+    assert grid.size == 63
+    assert all(walls == 15 for walls in grid.walls)
+
+
+def test_index_and_position() -> None:
+    grid = Grid(make_config(9, 7))
+    for index in range(grid.size):
+        x, y = grid.get_pos(index)
+        assert grid.index(x, y) == index
+    assert grid.get_cell(9, 0) is None
+    assert grid.get_cell(0, -1) is None
+
+
+def test_bitset() -> None:
+    bits = BitSet(20)
+    bits[3] = True
+    bits[19] = True
+    assert bits[3] and bits[19] and not bits[4]
+    assert bits.count() == 2
+    bits[3] = False
+    assert bits.count() == 1
+    bits.clear()
+    assert bits.count() == 0
+
+
+@pytest.mark.parametrize("seed", ["1", "2", "3"])
+def test_dfs_is_perfect(seed: str) -> None:
+    maze = MazeGenerator.generate_maze(make_config(SEED=seed))
+    check_perfect(maze)
+    check_solution(maze, MazeSolver(maze).solve_maze())
+
+
+@pytest.mark.parametrize("seed", ["1", "2", "3"])
+def test_imperfect_is_connected(seed: str) -> None:
+    maze = MazeGenerator.generate_maze(make_config(perfect=False, SEED=seed))
+    check_connected(maze)
+    check_solution(maze, MazeSolver(maze).solve_maze())
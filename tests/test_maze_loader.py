@@ -0,0 +1,67 @@
+"""Tests of load_maze: the output files are loaded back into a Grid."""
+
+from pathlib import Path
+
+import pytest
+
+from mazegen.io.maze_loader import load_maze
+from mazegen.maze_generator import MazeGenerator
+from mazegen.solve.maze_solver import MazeSolver
+from tests.helpers import check_walls, make_config
+from write_output import OutputWriter
+
+
+def write_maze(tmp_path: Path, name: str, perfect: bool = True,
+               seed: str = "12") -> tuple[str, bytearray, list[int] | None]:
+    """Generate, solve and write a maze, return its path, walls, solution."""
+    path = str(tmp_path / name)
+    config = make_config(perfect=perfect, SEED=seed, OUTPUT_FILE=path)
+    maze = MazeGenerator.generate_maze(config)
+    solution = MazeSolver(maze).solve_maze()
+    OutputWriter(maze, solution, config).write_output_file()
+    return path, maze.walls, solution
+
+
+@pytest.mark.parametrize("name", ["maze.txt", "maze.mzb"])
+@pytest.mark.parametrize("perfect", [True, False])
+def test_round_trip(tmp_path: Path, name: str, perfect: bool) -> None:
+    path, walls, solution = write_maze(tmp_path, name, perfect)
+    grid, loaded = load_maze(path)
+    assert grid.walls == walls
+    assert loaded == solution
+    assert grid.perfect == ("true" if perfect else "false")
+    check_walls(grid)
+    assert MazeSolver(grid).solve_maze() == solution
+
+
+def corrupt(path: str, row: int, column: int, digit: str) -> None:
+    """Replace one hex digit of a maze file in the text format."""
+    lines = Path(path).read_text().split("\n")
+    line = lines[row]
+    lines[row] = line[:column] + digit + line[column + 1:]
+    Path(path).write_text("\n".join(lines))
+
+
+def test_open_border(tmp_path: Path) -> None:
+    path, walls, _ = write_maze(tmp_path, "maze.txt")
+    # Open the north wall of the top-left cell
+    corrupt(path, 0, 0, "%X" % (walls[0] & ~1))
+    with pytest.raises(ValueError, match="border"):
+        load_maze(path)
+
+
+def test_walls_of_neighbors_differ(tmp_path: Path) -> None:
+    path, walls, _ = write_maze(tmp_path, "maze.txt")
+    # Flip the east wall of the top-left cell only
+    corrupt(path, 0, 0, "%X" % (walls[0] ^ 2))
+    with pytest.raises(ValueError, match="neighboring"):
+        load_maze(path)
+
+
+@pytest.mark.parametrize("row, column, digit", [(0, 0, "G"), (1, 21, "F")])
+def test_invalid_rows(tmp_path: Path, row: int, column: int,
+                      digit: str) -> None:
+    path, _, _ = write_maze(tmp_path, "maze.txt")
+    corrupt(path, row, column, digit)
+    with pytest.raises(ValueError):
+        load_maze(path)
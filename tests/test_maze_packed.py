@@ -0,0 +1,119 @@
+"""Tests of the packed binary maze format."""
+
+from pathlib import Path
+
+import pytest
+
+from mazegen.grid.maze_grid import Grid
+from mazegen.io.maze_packed import MazePacked
+from mazegen.maze_generator import MazeGenerator
+from mazegen.solve.maze_solver import MazeSolver
+from tests.helpers import make_config, open_border
+
+
+@pytest.mark.parametrize("size", [(21, 15), (20, 15), (9, 30)])
+@pytest.mark.parametrize("perfect", [True, False])
+def test_round_trip(tmp_path: Path, size: tuple[int, int],
+                    perfect: bool) -> None:
+    config = make_config(*size, perfect, SEED="11", ALGORITHM="prim")
+    maze = MazeGenerator.generate_maze(config)
+    solution = MazeSolver(maze).solve_maze()
+    path = str(tmp_path / "maze.mzb")
+    MazePacked.write(path, maze, solution)
+
+    with MazePacked(path) as packed:
+        assert (packed.width, packed.height) == size
+        assert tuple(packed.entry) == tuple(maze.entry)
+        assert tuple(packed.exit) == tuple(maze.exit)
+        assert packed.perfect == maze.perfect
+        assert packed.get_solution() == solution
+        assert packed.cells_42 == maze.cells_42
+        for y in range(packed.height):
+            start = y * packed.width
+            assert packed.get_row(y) == maze.walls[start:start + packed.width]
+        for index in range(maze.size):
+            assert packed.get_walls(index) == maze.walls[index]
+        grid = packed.to_grid()
+    assert grid.walls == maze.walls
+    assert MazeSolver(grid).solve_maze() == solution
+
+
+def test_grid_view(tmp_path: Path) -> None:
+    maze = MazeGenerator.generate_maze(make_config(21, 15, False, SEED="5"))
+    path = str(tmp_path / "maze.mzb")
+    MazePacked.write(path, maze, None)
+
+    with MazePacked(path) as packed:
+        assert len(packed.walls) == maze.size
+        assert packed.walls[:] == maze.walls
+        assert packed.walls[3:40] == maze.walls[3:40]
+        assert packed.walls[::7] == maze.walls[::7]
+        assert packed.walls[-1] == maze.walls[-1]
+        assert list(packed.neighbor_mask) == list(maze.neighbor_mask)
+        assert packed.is_42.bits == maze.is_42.bits
+        assert packed.steps == maze.steps
+        assert packed.revision == 0
+        for index in range(maze.size):
+            assert (packed.get_open_neighbors(index)
+                    == maze.get_open_neighbors(index))
+        with pytest.raises(IndexError):
+            packed.walls[maze.size]
+
+
+def test_open_border_has_no_neighbor(tmp_path: Path) -> None:
+    maze = MazeGenerator.generate_maze(make_config(9, 9, SEED="5"))
+    open_border(maze)
+    path = str(tmp_path / "maze.mzb")
+    MazePacked.write(path, maze, None)
+
+    with MazePacked(path) as packed:
+        for index in range(packed.size):
+            for neighbor, _ in packed.get_open_neighbors(index):
+                assert 0 <= neighbor < packed.size
+        assert packed.get_open_neighbors(0) == maze.get_open_neighbors(0)
+
+
+def test_custom_42_cells(tmp_path: Path) -> None:
+    cells_42 = {(3, 2), (4, 2), (4, 3)}
+    maze = Grid(make_config(9, 9), cells_42)
+    path = str(tmp_path / "maze.mzb")
+    MazePacked.write(path, maze, None)
+
+    with MazePacked(path) as packed:
+        assert packed.cells_42 == cells_42
+        grid = packed.to_grid()
+    assert grid.cells_42 == cells_42
+    assert grid.is_42.bits == maze.is_42.bits
+    assert grid.walls == maze.walls
+
+
+def test_version_1_has_default_42_cells(tmp_path: Path) -> None:
+    maze = Grid(make_config())
+    path = tmp_path / "maze.mzb"
+    MazePacked.write(str(path), maze, None)
+    # Version 1: no cells after the header, the pattern is implied
+    data = bytearray(path.read_bytes())
+    data[4] = 1
+    start = MazePacked.HEADER.size
+    del data[start:start + MazePacked.COUNT_42.size
+             + MazePacked.CELL_42.size * len(maze.cells_42)]
+    path.write_bytes(data)
+
+    with MazePacked(str(path)) as packed:
+        assert packed.cells_42 == Grid.get_42_cells(21, 15)
+        assert packed.walls[:] == maze.walls
+
+
+def test_wall_packing() -> None:
+    walls = bytearray(range(16)) + b"\x05"
+    packed = MazePacked.pack_walls(walls)
+    assert len(packed) == 9
+    assert MazePacked.unpack_walls(packed)[:len(walls)] == walls
+    assert len(MazePacked.pack_solution([1, 2, 4, 8, 8, 4, 2])) == 2
+
+
+def test_not_a_packed_maze(tmp_path: Path) -> None:
+    path = tmp_path / "maze.mzb"
+    path.write_bytes(b"0123456789ABCDEF" * 4)
+    with pytest.raises(ValueError):
+        MazePacked(str(path))
@@ -0,0 +1,45 @@
+"""Tests of the path index: paths and distances between any two cells."""
+
+import random
+
+import pytest
+
+from mazegen.maze_generator import MazeGenerator
+from mazegen.solve.maze_path_index import MazePathIndex
+from tests.helpers import MOVES, get_distances, make_config
+
+
+@pytest.mark.parametrize("algorithm", ["dfs", "kruskal"])
+def test_matches_bfs(algorithm: str) -> None:
+    config = make_config(31, 23, ALGORITHM=algorithm, SEED="6")
+    maze = MazeGenerator.generate_maze(config)
+    index = MazePathIndex(maze)
+    rng = random.Random(1)
+    cells = [i for i in range(maze.size) if not maze.is_42[i]]
+    for _ in range(50):
+        a = rng.choice(cells)
+        b = rng.choice(cells)
+        start, end = maze.get_pos(a), maze.get_pos(b)
+        expected = get_distances(maze, a)[b]
+        assert index.get_distance(start, end) == expected
+
+        path = index.get_path(start, end)
+        assert path is not None and len(path) == expected
+        x, y = start
+        for dir in path:
+            assert not maze.walls[maze.index(x, y)] & dir
+            x, y = x + MOVES[dir][0], y + MOVES[dir][1]
+        assert (x, y) == end
+
+
+def test_out_of_bounds() -> None:
+    maze = MazeGenerator.generate_maze(make_config(SEED="6"))
+    index = MazePathIndex(maze)
+    assert index.get_distance((0, 0), (maze.width, 0)) is None
+    assert index.get_path((-1, 0), (0, 0)) is None
+
+
+def test_loops_are_rejected() -> None:
+    maze = MazeGenerator.generate_maze(make_config(perfect=False, SEED="6"))
+    with pytest.raises(ValueError):
+        MazePathIndex(maze)
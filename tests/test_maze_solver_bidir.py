@@ -0,0 +1,33 @@
+"""Tests of the bidirectional BFS solver against the BFS paths."""
+
+import pytest
+
+from mazegen.grid.maze_grid import Grid
+from mazegen.maze_generator import MazeGenerator
+from mazegen.solve.maze_solver import MazeSolver
+from mazegen.solve.maze_solver_bidir import MazeBidirSolver
+from tests.helpers import check_solution, make_config, open_border
+
+
+@pytest.mark.parametrize("algorithm", ["dfs", "prim"])
+@pytest.mark.parametrize("perfect", [True, False])
+@pytest.mark.parametrize("seed", ["1", "2", "3"])
+def test_matches_bfs(algorithm: str, perfect: bool, seed: str) -> None:
+    config = make_config(31, 23, perfect, ALGORITHM=algorithm, SEED=seed)
+    maze = MazeGenerator.generate_maze(config)
+    solution = MazeBidirSolver(maze).solve_maze()
+    check_solution(maze, solution)
+    bfs = MazeSolver(maze).solve_maze()
+    assert bfs is not None and solution is not None
+    assert len(solution) == len(bfs)
+
+
+def test_no_solution() -> None:
+    maze = Grid(make_config(9, 7))
+    assert MazeBidirSolver(maze).solve_maze() is None
+
+
+def test_open_border_is_not_crossed() -> None:
+    maze = MazeGenerator.generate_maze(make_config(perfect=False, SEED="4"))
+    open_border(maze)
+    check_solution(maze, MazeBidirSolver(maze).solve_maze())
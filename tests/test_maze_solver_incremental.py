@@ -0,0 +1,51 @@
+"""Tests of the incremental solver: after each wall edit, its distances
+are the ones of a new BFS."""
+
+import random
+
+import pytest
+
+from mazegen.maze_generator import MazeGenerator
+from mazegen.solve.maze_solver_incremental import MazeIncrementalSolver
+from tests.helpers import check_solution, get_distances, make_config
+
+
+def check_distances(solver: MazeIncrementalSolver) -> None:
+    """Check the distance of every cell against a new BFS."""
+    maze = solver.maze
+    expected = get_distances(maze, maze.index(*maze.entry))
+    for index in range(maze.size):
+        position = maze.get_pos(index)
+        assert solver.get_distance(position) == expected.get(index), position
+
+
+@pytest.mark.parametrize("perfect", [True, False])
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_edits_match_new_bfs(perfect: bool, seed: int) -> None:
+    maze = MazeGenerator.generate_maze(make_config(25, 19, perfect,
+                                                   SEED=str(seed)))
+    solver = MazeIncrementalSolver(maze)
+    solver.solve_maze()
+    rng = random.Random(seed)
+    for _ in range(100):
+        index = rng.randrange(maze.size)
+        direction = rng.choice((1, 2, 4, 8))
+        if rng.random() < 0.5:
+            solution = solver.open_wall(index, direction)
+        else:
+            solution = solver.close_wall(index, direction)
+        assert not solver.is_stale()
+        check_distances(solver)
+        if solution is not None:
+            check_solution(maze, solution)
+
+
+def test_closing_the_only_path() -> None:
+    maze = MazeGenerator.generate_maze(make_config(SEED="5"))
+    solver = MazeIncrementalSolver(maze)
+    solution = solver.solve_maze()
+    assert solution is not None
+    # Every wall on the path of a perfect maze disconnects the exit
+    assert solver.close_wall(0, solution[0]) is None
+    check_distances(solver)
+    check_solution(maze, solver.open_wall(0, solution[0]))
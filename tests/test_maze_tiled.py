@@ -0,0 +1,31 @@
+"""Tests of the generation of a maze in tiles on multiple processes."""
+
+import pytest
+
+from mazegen.algo.maze_tiled import MazeTiled
+from mazegen.maze_generator import MazeGenerator
+from mazegen.solve.maze_solver import MazeSolver
+from tests.helpers import (check_connected, check_perfect, check_solution,
+                           make_config)
+
+
+@pytest.mark.parametrize("algorithm", ["dfs", "prim", "kruskal", "eller"])
+def test_tiles_are_joined_into_a_perfect_maze(algorithm: str) -> None:
+    config = make_config(40, 30, ALGORITHM=algorithm, SEED="3", WORKERS="4")
+    maze = MazeGenerator.generate_maze(config)
+    assert isinstance(maze, MazeTiled)
+    check_perfect(maze)
+    check_solution(maze, MazeSolver(maze).solve_maze())
+
+
+def test_imperfect_is_connected() -> None:
+    config = make_config(40, 30, perfect=False, SEED="3", WORKERS="3")
+    maze = MazeGenerator.generate_maze(config)
+    check_connected(maze)
+
+
+def test_same_seed_same_maze() -> None:
+    config = make_config(40, 30, SEED="9", WORKERS="2")
+    first = MazeGenerator.generate_maze(config)
+    second = MazeGenerator.generate_maze(config)
+    assert first.walls == second.walls
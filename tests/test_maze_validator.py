@@ -0,0 +1,122 @@
+"""Tests of the maze validator on valid and corrupted output files."""
+
+from array import array
+from collections.abc import Callable
+from pathlib import Path
+from random import Random
+
+import pytest
+
+from mazegen.config.maze_config import Config
+from mazegen.io.maze_validator import MazeValidator
+from mazegen.maze_generator import MazeGenerator
+from mazegen.solve.maze_solver import MazeSolver
+from tests.helpers import make_config
+from write_output import OutputWriter
+
+
+def write_maze(tmp_path: Path, perfect: bool = True) -> tuple[str, Config]:
+    """Generate, solve and write a maze, return its path and config."""
+    path = str(tmp_path / "maze.txt")
+    config = make_config(perfect=perfect, SEED="13", OUTPUT_FILE=path)
+    maze = MazeGenerator.generate_maze(config)
+    OutputWriter(maze, MazeSolver(maze).solve_maze(),
+                 config).write_output_file()
+    return path, config
+
+
+def get_checks(report: dict[str, object]) -> set[object]:
+    """Get the checks that failed in a report."""
+    errors = report["errors"]
+    assert isinstance(errors, list)
+    return {error["check"] for error in errors}
+
+
+@pytest.mark.parametrize("perfect", [True, False])
+def test_valid(tmp_path: Path, perfect: bool) -> None:
+    path, config = write_maze(tmp_path, perfect)
+    report = MazeValidator(path, config, check_shortest=True).validate()
+    assert report["valid"], report["errors"]
+    assert report["parts"] == 1
+    assert (report["loops"] == 0) == perfect
+    assert report["path_length"] == report["shortest_length"]
+    assert report["shortest"] == "checked"
+
+
+def test_shortest_unchecked_with_loops(tmp_path: Path) -> None:
+    path, config = write_maze(tmp_path, perfect=False)
+    report = MazeValidator(path, config).validate()
+    assert report["valid"], report["errors"]
+    assert report["loops"]
+    assert report["shortest"] == "unchecked"
+    assert report["shortest_length"] is None
+
+
+def edit_line(path: str, row: int, edit: str) -> None:
+    """Replace a line of a maze file."""
+    lines = Path(path).read_text().split("\n")
+    lines[row] = edit
+    Path(path).write_text("\n".join(lines))
+
+
+def test_wrong_digit(tmp_path: Path) -> None:
+    path, _ = write_maze(tmp_path)
+    line = Path(path).read_text().split("\n")[3]
+    edit_line(path, 3, line[:4] + ("0" if line[4] != "0" else "F")
+              + line[5:])
+    assert "encoding" in get_checks(MazeValidator(path).validate())
+
+
+@pytest.mark.parametrize("row, edit", [(5, lambda line: line[:-1]),
+                                       (2, lambda line: "X" + line[1:])])
+def test_bad_row(tmp_path: Path, row: int,
+                 edit: Callable[[str], str]) -> None:
+    path, _ = write_maze(tmp_path)
+    line = Path(path).read_text().split("\n")[row]
+    edit_line(path, row, edit(line))
+    assert "format" in get_checks(MazeValidator(path).validate())
+
+
+@pytest.mark.parametrize("edit", [lambda path: "N" + path,
+                                  lambda path: path[:-1],
+                                  lambda path: path + "EW"])
+def test_bad_solution(tmp_path: Path, edit: Callable[[str], str]) -> None:
+    path, _ = write_maze(tmp_path)
+    lines = Path(path).read_text().split("\n")
+    # The entry is in the top-left corner: north is the border
+    edit_line(path, len(lines) - 2, edit(lines[-2]))
+    report = MazeValidator(path).validate()
+    assert get_checks(report) & {"path", "shortest"}
+
+
+def test_solution_visits_a_cell_twice(tmp_path: Path) -> None:
+    path, _ = write_maze(tmp_path)
+    lines = Path(path).read_text().split("\n")
+    solution = lines[-2]
+    back = {"N": "S", "E": "W", "S": "N", "W": "E"}[solution[0]]
+    edit_line(path, len(lines) - 2, solution[0] + back + solution)
+    report = MazeValidator(path).validate()
+    assert get_checks(report) == {"shortest"}
+
+
+def test_sort_steps() -> None:
+    validator = MazeValidator("maze.txt")
+    validator.width = 7
+    validator.height = 5
+    rng = Random(3)
+    steps = array("q", (rng.randrange(35) << 4 | rng.choice((1, 2, 4, 8))
+                        for _ in range(100)))
+    assert validator.sort_steps(steps).tolist() == sorted(steps)
+
+
+def test_loops_with_perfect_config(tmp_path: Path) -> None:
+    path, _ = write_maze(tmp_path, perfect=False)
+    config = make_config(SEED="13", OUTPUT_FILE=path)
+    assert "perfect" in get_checks(MazeValidator(path, config).validate())
+
+
+def test_missing_footer(tmp_path: Path) -> None:
+    path, _ = write_maze(tmp_path)
+    text = Path(path).read_text()
+    Path(path).write_text(text[:text.index("\n\n")] + "\n")
+    assert not MazeValidator(path).validate()["valid"]
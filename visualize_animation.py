@@ -0,0 +1,111 @@
+"""Schedule the frames of the drawing animation."""
+
+
+import curses
+import time
+from collections.abc import Callable
+
+
+class AnimationScheduler:
+    """
+    Batches the draw operations of the painter into frames.
+    Each draw operation reports its work (the number of characters
+    drawn), and once the work of a frame reaches the speed,
+    the frame is shown with one refresh and the scheduler waits
+    for the time of the next frame at the target frame rate.
+
+    With a speed of 0, there is no animation: the drawing is only
+    shown by the refresh after it. During the animation, the keys
+    of the input window change the speed or skip to the end.
+    """
+
+    # Target number of frames per second
+    FPS = 60
+    # Default number of characters drawn per frame
+    DEFAULT_SPEED = 400
+    # Keys during the animation
+    FASTER_KEYS = (ord("+"), ord("="))
+    SLOWER_KEYS = (ord("-"), ord("_"))
+    SKIP_KEYS = (ord("s"), ord(" "))
+
+    def __init__(self: "AnimationScheduler", present: Callable[[], None],
+                 speed: int = DEFAULT_SPEED,
+                 input_window: curses.window | None = None) -> None:
+        """
+        Initialize the scheduler.
+
+        Args:
+            present: Function that shows the current drawing.
+            speed: Number of characters drawn per frame,
+            0 for no animation.
+            input_window: Window to read the keys from
+            during the animation.
+        """
+        self.present = present
+        self.speed = speed
+        self.input_window = input_window
+        self.frame_time = 1 / self.FPS
+        # Work done since the last frame
+        self.pending = 0
+        self.next_frame = 0.0
+        self.skipping = False
+
+    def step(self: "AnimationScheduler", work: int = 1) -> None:
+        """Count the work of a draw operation, and show a frame if due."""
+        if not self.is_running():
+            return
+        self.pending += work
+        if self.pending >= self.speed:
+            self.show_frame()
+
+    def is_running(self: "AnimationScheduler") -> bool:
+        """Check whether the drawing is animated (not off or skipped)."""
+        return self.speed > 0 and not self.skipping
+
+    def show_frame(self: "AnimationScheduler") -> None:
+        """Show the drawing, read the keys and wait for the next frame."""
+        self.pending = 0
+        try:
+            self.present()
+        except curses.error:
+            pass
+        self.read_keys()
+        if self.skipping:
+            return
+
+        now = time.monotonic()
+        # Do not try to catch up with frames that were missed
+        self.next_frame = max(now, self.next_frame + self.frame_time)
+        time.sleep(self.next_frame - now)
+
+    def read_keys(self: "AnimationScheduler") -> None:
+        """
+        Read the keys pressed since the last frame without waiting.
+        Other keys are put back to be read after the animation.
+        """
+        if self.input_window is None:
+            return
+        others = []
+        self.input_window.nodelay(True)
+        try:
+            key = self.input_window.getch()
+            while key != -1:
+                if key in self.FASTER_KEYS:
+                    self.speed *= 2
+                elif key in self.SLOWER_KEYS:
+                    self.speed = max(1, self.speed // 2)
+                elif key in self.SKIP_KEYS:
+                    self.skipping = True
+                else:
+                    others.append(key)
+                key = self.input_window.getch()
+        finally:
+            self.input_window.nodelay(False)
+        for key in reversed(others):
+            curses.ungetch(key)
+
+    def finish(self: "AnimationScheduler") -> None:
+        """End a drawing: the next one is animated again."""
+        self.pending = 0
+        self.skipping = False
+        self.next_frame = 0.0
@@ -1,4 +1,7 @@
-"""Display the maze and a user interface on a scrollable curses pad."""
+"""
+Display the maze and a user interface on a curses pad of the size
+of the screen, on which the painter draws the part scrolled to.
+"""
 
 
 import curses
@@ -8,12 +11,18 @@ from mazegen.grid.maze_grid import Grid
 from mazegen.maze_generator import MazeGenerator
 from mazegen.solve.maze_solver import MazeSolver
 from write_output import OutputWriter
+from visualize_animation import AnimationScheduler
 from visualize_maze import MazePainter
 from visualize_colors import ColorTheme
 
 
 class MazeDisplay:
     """Handles the interactive display of the maze."""
+
+    # Lines of the prompt and of the messages below the maze
+    PROMPT_LINE = 9
+    MESSAGE_LINE = 10
+
     def __init__(self: "MazeDisplay", stdscr: curses.window,
                  config: Config) -> None:
         """Initialize the maze display"""
@@ -22,7 +31,7 @@ class MazeDisplay:
         # Screen dimensions
         self.screen_height = 0
         self.screen_width = 0
-        # Scroll offsets, pad's starting position
+        # Scroll offsets, position of the viewport on the canvas
         self.scroll_offset_y = 0
         self.scroll_offset_x = 0
         # Maze dimensions
@@ -46,7 +55,8 @@ class MazeDisplay:
         self.maze = MazeGenerator.generate_maze(self.config)
 
         # Solve maze
-        self.solution = MazeSolver(self.maze).solve_maze()
+        solver = MazeSolver.get_solver(self.config)
+        self.solution = solver(self.maze).solve()
 
         # Write output
         output = OutputWriter(self.maze, self.solution, self.config)
@@ -60,15 +70,31 @@ class MazeDisplay:
         # Refresh screen
         self.stdscr.refresh()
 
-        if self.pad is None:
+        if self.painter is None:
             return
 
         try:
-            self.pad.refresh(self.scroll_offset_y, self.scroll_offset_x, 0, 0,
-                             self.screen_height - 1, self.screen_width - 1)
+            self.painter.refresh()
         except curses.error:
             pass
 
+    def create_painter(self: "MazeDisplay",
+                       theme: ColorTheme) -> MazePainter:
+        """
+        Create the painter of the maze on the pad, animated at the
+        ANIMATION_SPEED of the config (characters per frame).
+        """
+        if self.pad is None or self.maze is None:
+            raise ValueError("MazeDisplay: No maze to paint.")
+        speed = (self.config.animation_speed
+                 if hasattr(self.config, "animation_speed")
+                 else AnimationScheduler.DEFAULT_SPEED)
+        painter = MazePainter(self.pad, self.maze, self.solution, theme,
+                              speed, self.stdscr)
+        painter.set_viewport(self.scroll_offset_y, self.scroll_offset_x,
+                             self.screen_height, self.screen_width)
+        return painter
+
     def display_maze(self: "MazeDisplay") -> None:
         """Display the maze and the menu."""
         # Get terminal dimensions
@@ -88,18 +114,12 @@ class MazeDisplay:
         self.total_height = maze_height + self.menu_height
         self.total_width = self.maze.width * 4 + 1
 
-        # Create a pad
-        pad_height = max(self.total_height, self.screen_height)
-        pad_width = max(self.total_width, self.screen_width)
-        self.pad = curses.newpad(pad_height, pad_width)
+        # Create a pad of the size of the screen
+        self.pad = curses.newpad(self.screen_height, self.screen_width)
 
         # Draw on the pad
         theme = ColorTheme.get_theme(self.current_theme)
-        self.painter = MazePainter(self.pad, self.maze, self.solution, theme)
-        self.painter.set_pad_refresh_params(self.scroll_offset_y,
-                                            self.scroll_offset_x,
-                                            self.screen_height,
-                                            self.screen_width)
+        self.painter = self.create_painter(theme)
 
         # Hide cursor
         curses.curs_set(0)
@@ -109,9 +129,10 @@ class MazeDisplay:
         self.painter.fill_42()
         self.painter.draw_entry_exit("E", 2)
         self.painter.draw_entry_exit("X", 3)
+        self.painter.finish_animation()
 
         # The position where the prompt should be shown
-        self.prompt_row = self.maze.height * 2 + 1 + 2 + 7
+        self.prompt_row = self.maze.height * 2 + 1 + self.PROMPT_LINE
 
         # Display on pad
         self.redraw()
@@ -120,12 +141,14 @@ class MazeDisplay:
         """Show solution path."""
         if self.painter:
             self.painter.draw_path()
+            self.painter.finish_animation()
             self.redraw()
 
     def hide_solution(self: "MazeDisplay") -> None:
         """Hide solution path."""
         if self.painter:
             self.painter.clear_path()
+            self.painter.finish_animation()
             self.redraw()
 
     def rotate_colors(self: "MazeDisplay") -> None:
@@ -133,18 +156,18 @@ class MazeDisplay:
         if self.pad is None or self.maze is None:
             return
 
-        # Clear the pad
-        self.pad.clear()
-
         self.current_theme = (self.current_theme + 1) \
             % ColorTheme.get_theme_count()
-
         theme = ColorTheme.get_theme(self.current_theme)
-        self.painter = MazePainter(self.pad, self.maze, self.solution, theme)
-        self.painter.set_pad_refresh_params(self.scroll_offset_y,
-                                            self.scroll_offset_x,
-                                            self.screen_height,
-                                            self.screen_width)
+
+        # Only redefine the color pairs of the pad if possible
+        if self.painter is not None and self.painter.set_theme(theme):
+            self.redraw()
+            return
+
+        # Otherwise clear the pad and draw everything again
+        self.pad.clear()
+        self.painter = self.create_painter(theme)
         self.show_choices()
         self.painter.print_walls()
         self.painter.fill_42()
@@ -152,49 +175,51 @@ class MazeDisplay:
         self.painter.draw_entry_exit("X", 3)
         if self.solution_visible:
             self.painter.draw_path()
+        self.painter.finish_animation()
         self.redraw()
 
     def show_choices(self: "MazeDisplay") -> None:
-        if self.maze is None or self.pad is None:
+        if self.painter is None:
             return
 
-        start_row = self.maze.height * 2 + 1 + 2
-
-        try:
-            self.pad.move(start_row, 0)
-            self.pad.addstr(start_row, 0,
-                            "=== A-Maze-ing ===", curses.color_pair(6))
-            self.pad.addstr(start_row + 1, 0,
-                            "Use ← ↑ → ↓ to scroll.", curses.color_pair(6))
-            self.pad.addstr(start_row + 2, 0,
-                            "Press i to enter input mode.",
-                            curses.color_pair(6))
-            self.pad.addstr(start_row + 3, 0,
-                            "1. Re-generate a new maze", curses.color_pair(6))
-            self.pad.addstr(start_row + 4, 0,
-                            "2. Show/Hide path from entry to exit",
-                            curses.color_pair(6))
-            self.pad.addstr(start_row + 5, 0,
-                            "3. Rotate maze colors", curses.color_pair(6))
-            self.pad.addstr(start_row + 6, 0,
-                            "4. Quit", curses.color_pair(6))
-            self.pad.addstr(start_row + 7, 0,
-                            "Choice? (1-4): ", curses.color_pair(6))
-        except curses.error:
-            pass
+        # The lines below the maze, with the menu from the third one
+        self.painter.footer = [
+            "",
+            "",
+            "=== A-Maze-ing ===",
+            "Use ← ↑ → ↓ to scroll.",
+            "Press i to enter input mode.",
+            "1. Re-generate a new maze",
+            "2. Show/Hide path from entry to exit",
+            "3. Rotate maze colors",
+            "4. Quit",
+            "Choice? (1-4): ",
+            ""
+        ]
+        self.painter.draw_footer()
 
     def display_message(self: "MazeDisplay", message: str) -> None:
-        if self.maze is None or self.pad is None:
+        if self.painter is None:
             return
 
-        start_row = self.maze.height * 2 + 1 + 2 + 8
-
-        try:
-            self.pad.move(start_row, 0)
-            self.pad.clrtoeol()
-            self.pad.addstr(start_row, 0, message, curses.color_pair(6))
-        except curses.error:
-            pass
+        self.painter.footer[self.MESSAGE_LINE] = message
+        self.painter.draw_footer(self.MESSAGE_LINE)
+
+    def clear_prompt(self: "MazeDisplay") -> None:
+        """Clear the input after the prompt."""
+        if self.painter is not None:
+            self.painter.draw_footer(self.PROMPT_LINE)
+
+    def move_viewport(self: "MazeDisplay", offset_y: int,
+                      offset_x: int) -> None:
+        """Scroll to a position, drawing only what becomes visible."""
+        dy = offset_y - self.scroll_offset_y
+        dx = offset_x - self.scroll_offset_x
+        self.scroll_offset_y = offset_y
+        self.scroll_offset_x = offset_x
+        if self.painter is not None and (dy or dx):
+            self.painter.scroll(dy, dx)
+        self.redraw()
 
     def handle_resize(self: "MazeDisplay") -> None:
         """Redraw when resize the terminal window."""
@@ -205,39 +230,43 @@ class MazeDisplay:
         # Adjust scroll offset
         self.scroll_offset_y = min(self.scroll_offset_y, max_scroll_y)
         self.scroll_offset_x = min(self.scroll_offset_x, max_scroll_x)
-        # Redraw everything
+        # Resize the pad and redraw everything
+        if self.pad is not None and self.painter is not None:
+            self.pad.resize(self.screen_height, self.screen_width)
+            self.painter.set_viewport(self.scroll_offset_y,
+                                      self.scroll_offset_x,
+                                      self.screen_height, self.screen_width)
+            self.painter.draw_view()
         self.redraw()
 
     def scroll_up(self: "MazeDisplay") -> None:
         """Redraw when scrolling up with up button."""
-        self.scroll_offset_y = max(0, self.scroll_offset_y - 1)
-        self.redraw()
+        self.move_viewport(max(0, self.scroll_offset_y - 1),
+                           self.scroll_offset_x)
 
     def scroll_down(self: "MazeDisplay") -> None:
         """Redraw when scrolling down with down button."""
         max_scroll_y = max(0, self.total_height - self.screen_height)
-        self.scroll_offset_y = min(max_scroll_y, self.scroll_offset_y + 1)
-        self.redraw()
+        self.move_viewport(min(max_scroll_y, self.scroll_offset_y + 1),
+                           self.scroll_offset_x)
 
     def scroll_left(self: "MazeDisplay") -> None:
         """Redraw when scrolling left with left button."""
-        self.scroll_offset_x = max(0, self.scroll_offset_x - 1)
-        self.redraw()
+        self.move_viewport(self.scroll_offset_y,
+                           max(0, self.scroll_offset_x - 1))
 
     def scroll_right(self: "MazeDisplay") -> None:
         """Redraw when scrolling right with right button."""
         max_scroll_x = max(0, self.total_width - self.screen_width)
-        self.scroll_offset_x = min(max_scroll_x, self.scroll_offset_x + 1)
-        self.redraw()
+        self.move_viewport(self.scroll_offset_y,
+                           min(max_scroll_x, self.scroll_offset_x + 1))
 
     def scroll_to_prompt(self: "MazeDisplay") -> None:
         """Scroll to prompt row."""
         if self.prompt_row - self.scroll_offset_y >= self.screen_height - 2 \
                 or self.prompt_col <= self.scroll_offset_x:
             calc_y = self.prompt_row - self.screen_height + 2
-            self.scroll_offset_y = max(0, calc_y)
-            self.scroll_offset_x = 0
-            self.redraw()
+            self.move_viewport(max(0, calc_y), 0)
 
     def get_user_input(self: "MazeDisplay") -> str:
         """
@@ -317,14 +346,8 @@ class MazeDisplay:
         curses.curs_set(0)
 
         # Update the pad with the final input
-        try:
-            self.pad.move(self.prompt_row, self.prompt_col)
-            self.pad.clrtoeol()
-            self.pad.refresh(self.scroll_offset_y, self.scroll_offset_x,
-                             0, 0,
-                             self.screen_height - 1, self.screen_width - 1)
-        except curses.error:
-            pass
+        self.clear_prompt()
+        self.redraw()
 
         # Clear the input area on stdscr
         try:
@@ -344,8 +367,7 @@ class MazeDisplay:
         if self.pad is None or self.painter is None:
             return True
         # Clear any message
-        self.pad.move(self.prompt_row + 1, 0)
-        self.pad.clrtoeol()
+        self.display_message("")
         self.scroll_to_prompt()
         # Get input
         user_input = self.get_user_input()
@@ -373,8 +395,7 @@ class MazeDisplay:
         # Invalid choice
         else:
             self.display_message("Invalid choice!")
-            self.pad.move(self.prompt_row, self.prompt_col)
-            self.pad.clrtoeol()
+            self.clear_prompt()
             self.redraw()
             return True
 
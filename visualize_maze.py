@@ -1,21 +1,50 @@
-"""Drawing the maze on a curses window."""
+"""
+Drawing the maze on a curses window.
+
+Only the part of the maze in the viewport (the part of the screen
+scrolled to) is drawn, on a pad of the size of the screen, so the
+memory and the drawing time do not depend on the size of the maze.
+"""
 
 
 import curses
-import time
+from collections.abc import Iterator
 
 from mazegen.grid.maze_cell import Cell
 from mazegen.grid.maze_grid import Grid
+from visualize_animation import AnimationScheduler
 from visualize_colors import ColorTheme
 
 
 class MazePainter:
-    """A class for drawing the maze."""
+    """
+    A class for drawing the maze.
+    The maze is drawn on a canvas of characters: the walls take
+    a row and a column between the cells, and the lines of the footer
+    are below the maze. Only the rows and columns of the canvas
+    in the viewport are drawn on the pad, and after a scroll only
+    the strips that become visible.
+    """
+
+    # Tables of the fragments of each wall value,
+    # by wall character and cell width
+    fragment_tables: dict[tuple[str, int], tuple[list[str], ...]] = {}
+
     def __init__(self: "MazePainter", stdscr: curses.window, maze: Grid,
                  path: list[int] | None,
                  theme: ColorTheme | None = None,
-                 delay: float = 0.01) -> None:
-        """Initialize the visualizer."""
+                 speed: int = AnimationScheduler.DEFAULT_SPEED,
+                 input_window: curses.window | None = None) -> None:
+        """
+        Initialize the visualizer.
+
+        Args:
+            stdscr: The pad of the viewport, of the size of the screen.
+            speed: Number of characters drawn per frame of the
+            animation, 0 for no animation.
+            input_window: Window to read the keys from
+            during the animation.
+        """
         self.stdscr = stdscr
         self.maze = maze
         self.path = path
@@ -23,27 +52,41 @@ class MazePainter:
         self.fill = "█"
         self.cell_width = 3
         self.cell_height = 1
+        self.fragments = self.get_fragments()
+        # Rows of the maze on the canvas, and lines below it
+        self.maze_rows = self.maze.height * (self.cell_height + 1) + 1
+        self.footer: list[str] = []
+        # Cells of the path, and passages west and south of cells
+        self.path_cells: set[int] = set()
+        self.path_west: set[int] = set()
+        self.path_south: set[int] = set()
+        self.path_visible = False
+        self.index_path()
         # Color theme
         if theme is None:
             self.theme = ColorTheme.get_theme(0)
         else:
             self.theme = theme
         self.init_colors()
+        # Viewport: position on the canvas and size
+        self.offset_y = 0
+        self.offset_x = 0
+        self.view_height = 0
+        self.view_width = 0
         # Animation
-        self.pad_refresh_params: tuple[int, int, int, int] | None = None
-        self.delay = delay
+        self.animation = AnimationScheduler(self.refresh, speed, input_window)
 
     def print_ascii(self: "MazePainter") -> None:
         # Print top border
         for x in range(self.maze.width):
-            cell = self.maze.grid[0][x]
-            print("+---" if cell.walls & Cell.NORTH else "+   ", end="")
+            walls = self.maze.walls[self.maze.index(x, 0)]
+            print("+---" if walls & Cell.NORTH else "+   ", end="")
         print("+")
 
         for y in range(self.maze.height):
             # Print left/right walls and interior
             for x in range(self.maze.width):
-                cell = self.maze.grid[y][x]
+                walls = self.maze.walls[self.maze.index(x, y)]
 
                 # Determine the character inside the cell
                 if (x, y) == self.maze.entry:
@@ -54,7 +97,7 @@ class MazePainter:
                     content = "   "
 
                 # Print left wall if present
-                if cell.walls & Cell.WEST:
+                if walls & Cell.WEST:
                     print("|" + content, end="")
                 else:
                     print(" " + content, end="")
@@ -63,8 +106,8 @@ class MazePainter:
 
             # Print bottom walls
             for x in range(self.maze.width):
-                cell = self.maze.grid[y][x]
-                print("+---" if cell.walls & Cell.SOUTH else "+   ", end="")
+                walls = self.maze.walls[self.maze.index(x, y)]
+                print("+---" if walls & Cell.SOUTH else "+   ", end="")
             print("+")
 
     def init_colors(self: "MazePainter") -> None:
@@ -72,65 +115,315 @@ class MazePainter:
         curses.start_color()
         curses.use_default_colors()
 
-        # Set up a color pairs based on predefined themes
-        curses.init_pair(1, self.theme.walls, -1)
-        curses.init_pair(2, -1, self.theme.entry)
-        curses.init_pair(3, -1, self.theme.exit)
-        curses.init_pair(4, self.theme.path, -1)
-        curses.init_pair(5, self.theme.fill_42, -1)
-        curses.init_pair(6, -1, -1)
+        # Set up a color pairs based on predefined themes,
+        # the default colors are kept if the terminal cannot show them
+        self.init_pairs()
 
         # Set the space character to the default fore- and background colors
         self.stdscr.bkgd(" ", curses.color_pair(1))
 
-    def set_pad_refresh_params(self: "MazePainter", scroll_offset_y: int,
-                               scroll_offset_x: int, screen_height: int,
-                               screen_width: int) -> None:
-        """Set parameters for refreshing pad."""
-        self.pad_refresh_params = (scroll_offset_y, scroll_offset_x,
-                                   screen_height, screen_width)
-
-    def animate(self: "MazePainter") -> None:
-        """Do one animation step, refresh and delay."""
-        if self.delay > 0 and self.pad_refresh_params:
-            (scroll_offset_y, scroll_offset_x, screen_height,
-             screen_width) = self.pad_refresh_params
-            try:
-                self.stdscr.refresh(scroll_offset_y, scroll_offset_x, 0, 0,
-                                    screen_height - 1, screen_width - 1)
-                time.sleep(self.delay)
-            except curses.error:
-                pass
+    def init_pairs(self: "MazePainter") -> bool:
+        """
+        Set up the color pairs 1 to 6 with the colors of the theme.
+
+        Returns:
+            bool: False if the terminal cannot define them.
+        """
+        try:
+            curses.init_pair(1, self.theme.walls, -1)
+            curses.init_pair(2, -1, self.theme.entry)
+            curses.init_pair(3, -1, self.theme.exit)
+            curses.init_pair(4, self.theme.path, -1)
+            curses.init_pair(5, self.theme.fill_42, -1)
+            curses.init_pair(6, -1, -1)
+        except (curses.error, ValueError):
+            return False
+        return True
+
+    def set_theme(self: "MazePainter", theme: ColorTheme) -> bool:
+        """
+        Change the color theme without drawing again: everything
+        on the pad is drawn with the color pairs 1 to 6, so redefining
+        them changes the colors on the screen at the next refresh.
+
+        Returns:
+            bool: False if the terminal cannot redefine the color
+            pairs, then the pad has to be drawn again.
+        """
+        self.theme = theme
+        return curses.has_colors() and self.init_pairs()
+
+    def index_path(self: "MazePainter") -> None:
+        """Find the cells and the passages of the solution path."""
+        if self.path is None:
+            return
+        index = self.maze.index(*self.maze.entry)
+        self.path_cells.add(index)
+        for i in self.path:
+            if i == Cell.NORTH:
+                index -= self.maze.width
+                self.path_south.add(index)
+            elif i == Cell.SOUTH:
+                self.path_south.add(index)
+                index += self.maze.width
+            elif i == Cell.WEST:
+                self.path_west.add(index)
+                index -= 1
+            elif i == Cell.EAST:
+                index += 1
+                self.path_west.add(index)
+            self.path_cells.add(index)
+
+    def set_viewport(self: "MazePainter", offset_y: int, offset_x: int,
+                     height: int, width: int) -> None:
+        """Set the position of the viewport on the canvas and its size."""
+        self.offset_y = offset_y
+        self.offset_x = offset_x
+        self.view_height = height
+        self.view_width = width
+
+    def refresh(self: "MazePainter") -> None:
+        """Refresh the pad on the screen."""
+        if self.view_height and self.view_width:
+            self.stdscr.refresh(0, 0, 0, 0,
+                                self.view_height - 1, self.view_width - 1)
+
+    def animate(self: "MazePainter", work: int = 1) -> None:
+        """Count one animation step, the frame is shown when it is full."""
+        self.animation.step(work)
+
+    def finish_animation(self: "MazePainter") -> None:
+        """End the animation of a drawing, before refreshing it."""
+        self.animation.finish()
 
     def get_cell_row(self: "MazePainter", y: int) -> int:
         """
-        Get the row position of the cell on the pad
+        Get the row position of the cell on the canvas
         from its y position in the grid.
         """
         return 1 + y * (self.cell_height + 1)
 
     def get_cell_col(self: "MazePainter", x: int) -> int:
         """
-        Get the column position of the cell on the pad
+        Get the column position of the cell on the canvas
         from its x position in the grid.
         """
         return 1 + x * (self.cell_width + 1)
 
-    def draw_char(self: "MazePainter", row: int, col: int,
-                  char: str, color_pair: int = 0) -> None:
-        """Draw a single character at position (row, col)."""
-        try:
-            self.stdscr.addstr(row, col, char, curses.color_pair(color_pair))
-        except curses.error:
-            pass
-
-    def draw_str(self: "MazePainter", row: int, col: int, char: str,
-                 repeat: int, color_pair: int = 0) -> int:
-        """Repeat drawing a character multiple times in a row."""
-        for i in range(repeat):
-            self.draw_char(row, col + i, char, color_pair)
-        self.animate()
-        return col + repeat
+    def get_fragments(self: "MazePainter") -> tuple[list[str], ...]:
+        """
+        Get the tables of the fragments drawn for each wall value:
+        the top border, the west wall and inside, and the south wall
+        of a cell. The tables are shared by the painters with the same
+        wall character and cell width.
+        """
+        key = (self.wall, self.cell_width)
+        if key not in self.fragment_tables:
+            wall = self.wall
+            space = " " * self.cell_width
+            self.fragment_tables[key] = (
+                [wall * (self.cell_width + 1) if walls & Cell.NORTH
+                 else wall + space for walls in range(16)],
+                [(wall if walls & Cell.WEST else " ") + space
+                 for walls in range(16)],
+                [wall * (self.cell_width + 1) if walls & Cell.SOUTH
+                 else wall + space for walls in range(16)])
+        return self.fragment_tables[key]
+
+    def render_cells(self: "MazePainter", y: int, table: list[str],
+                     start: int, end: int) -> str:
+        """Render the cells start to end of a row with a table of fragments."""
+        first = self.maze.index(start, y)
+        cells = self.maze.walls[first:first + end - start]
+        text = "".join(map(table.__getitem__, cells))
+        # The rightmost border
+        if end == self.maze.width:
+            text += self.wall
+        return text
+
+    def get_overlays(self: "MazePainter", row: int, start: int,
+                     end: int) -> list[tuple[int, str, int]]:
+        """
+        Get what is drawn over the walls in the cells start to end
+        of a row of the canvas: the 42 pattern, the entry, the exit
+        and the path if it is visible.
+
+        Returns:
+            list[tuple[int, str, int]]: The column, text and color pair
+            of each overlay, from left to right.
+        """
+        overlays: list[tuple[int, str, int]] = []
+        if row == 0 or (row % 2 == 0 and not self.path_visible):
+            return overlays
+        y = (row - 1) // (self.cell_height + 1)
+        index = self.maze.index(start, y)
+        cell = self.fill * self.cell_width
+        for x in range(start, end):
+            col = self.get_cell_col(x)
+            if row % 2 == 0:
+                if self.path_visible and index in self.path_south:
+                    overlays.append((col, cell, 4))
+                index += 1
+                continue
+            if self.path_visible and index in self.path_west:
+                overlays.append((col - 1, self.fill, 4))
+            if self.maze.is_42[index]:
+                overlays.append((col, cell, 5))
+            elif (x, y) == self.maze.entry:
+                overlays.append((col, " E ", 2))
+            elif (x, y) == self.maze.exit:
+                overlays.append((col, " X ", 3))
+            elif self.path_visible and index in self.path_cells:
+                overlays.append((col, cell, 4))
+            index += 1
+        return overlays
+
+    def render_runs(self: "MazePainter", row: int, start: int, end: int,
+                    overlays: bool = True) -> list[tuple[str, int]]:
+        """
+        Render the columns start to end of a row of the canvas.
+
+        Args:
+            row: The row on the canvas.
+            start: The first column.
+            end: The column after the last one.
+            overlays: Whether to draw the 42 pattern, the entry,
+            the exit and the path, or only the walls.
+
+        Returns:
+            list[tuple[str, int]]: Runs of characters with their color
+            pair, of end - start characters in total.
+        """
+        if row >= self.maze_rows:
+            line = row - self.maze_rows
+            text = self.footer[line][start:end] if line < len(
+                self.footer) else ""
+            return [(text, 6), (" " * (end - start - len(text)), 1)]
+
+        if row == 0:
+            (table, y) = (self.fragments[0], 0)
+        elif row % 2:
+            (table, y) = (self.fragments[1], (row - 1) // 2)
+        else:
+            (table, y) = (self.fragments[2], row // 2 - 1)
+        step = self.cell_width + 1
+        first = min(start // step, self.maze.width)
+        last = min((end - 1) // step + 1, self.maze.width)
+        base = first * step
+        text = self.render_cells(y, table, first, last)
+
+        runs = []
+        col = start
+        if overlays:
+            for (over_col, over_text, color_pair) in self.get_overlays(
+                    row, first, last):
+                left = max(over_col, col)
+                right = min(over_col + len(over_text), end)
+                if left >= right:
+                    continue
+                if left > col:
+                    runs.append((text[col - base:left - base], 1))
+                runs.append((over_text[left - over_col:right - over_col],
+                             color_pair))
+                col = right
+        if col < end:
+            runs.append((text[col - base:end - base].ljust(end - col), 1))
+        return runs
+
+    def write_runs(self: "MazePainter", screen_row: int, screen_col: int,
+                   runs: list[tuple[str, int]], insert: bool = False) -> int:
+        """
+        Write runs of characters of the same color on the pad,
+        with one call to addstr (or insstr to insert them) per run.
+
+        Returns:
+            int: The number of characters written.
+        """
+        col = screen_col
+        for text, color_pair in runs:
+            try:
+                if insert:
+                    self.stdscr.insstr(screen_row, col, text,
+                                       curses.color_pair(color_pair))
+                else:
+                    self.stdscr.addstr(screen_row, col, text,
+                                       curses.color_pair(color_pair))
+            except curses.error:
+                pass
+            col += len(text)
+        return col - screen_col
+
+    def draw_rows(self: "MazePainter", start: int, end: int,
+                  overlays: bool = True, animate: bool = False) -> None:
+        """Draw the rows start to end of the canvas in the viewport."""
+        for row in range(max(start, self.offset_y),
+                         min(end, self.offset_y + self.view_height)):
+            runs = self.render_runs(row, self.offset_x,
+                                    self.offset_x + self.view_width, overlays)
+            work = self.write_runs(row - self.offset_y, 0, runs)
+            if animate:
+                self.animate(work)
+
+    def draw_view(self: "MazePainter") -> None:
+        """Draw the whole viewport."""
+        self.draw_rows(self.offset_y, self.offset_y + self.view_height)
+
+    def draw_footer(self: "MazePainter", line: int | None = None) -> None:
+        """Draw a line of the footer (default: all lines)."""
+        if line is None:
+            self.draw_rows(self.maze_rows, self.maze_rows + len(self.footer))
+        else:
+            self.draw_rows(self.maze_rows + line, self.maze_rows + line + 1)
+
+    def draw_canvas(self: "MazePainter", row: int, col: int, text: str,
+                    color_pair: int) -> None:
+        """Draw a text at a position of the canvas, if it is visible."""
+        screen_row = row - self.offset_y
+        if not 0 <= screen_row < self.view_height:
+            return
+        left = max(col, self.offset_x)
+        right = min(col + len(text), self.offset_x + self.view_width)
+        if left < right:
+            self.write_runs(screen_row, left - self.offset_x,
+                            [(text[left - col:right - col], color_pair)])
+            self.animate(right - left)
+
+    def scroll(self: "MazePainter", dy: int, dx: int) -> None:
+        """
+        Move the viewport on the canvas. The pad is shifted,
+        and only the rows and columns that become visible are drawn.
+        """
+        if abs(dy) >= self.view_height or abs(dx) >= self.view_width:
+            self.offset_y += dy
+            self.offset_x += dx
+            self.draw_view()
+            return
+
+        if dx:
+            self.offset_x += dx
+            right = self.offset_x + self.view_width
+            for screen_row in range(self.view_height):
+                row = self.offset_y + screen_row
+                if dx > 0:
+                    self.stdscr.move(screen_row, 0)
+                    for _ in range(dx):
+                        self.stdscr.delch()
+                    self.write_runs(screen_row, self.view_width - dx,
+                                    self.render_runs(row, right - dx, right))
+                else:
+                    self.write_runs(screen_row, 0,
+                                    self.render_runs(row, self.offset_x,
+                                                     self.offset_x - dx),
+                                    insert=True)
+        if dy:
+            self.offset_y += dy
+            bottom = self.offset_y + self.view_height
+            self.stdscr.move(0, 0)
+            self.stdscr.insdelln(-dy)
+            if dy > 0:
+                self.draw_rows(bottom - dy, bottom)
+            else:
+                self.draw_rows(self.offset_y, self.offset_y - dy)
 
     def draw_entry_exit(self: "MazePainter", char: str,
                         color_pair: int) -> None:
@@ -141,167 +434,87 @@ class MazePainter:
         else:
             return
 
-        cell_row = self.get_cell_row(y)
-        cell_col = self.get_cell_col(x)
-        self.draw_char(cell_row, cell_col, " ", color_pair)
-        self.draw_char(cell_row, cell_col + 1, char, color_pair)
-        self.draw_char(cell_row, cell_col + 2, " ", color_pair)
+        self.draw_canvas(self.get_cell_row(y), self.get_cell_col(x),
+                         f" {char} ", color_pair)
 
     def fill_42(self: "MazePainter") -> None:
         """Fill the 42 pattern."""
-        for y in range(self.maze.height):
-            for x in range(self.maze.width):
-                cell = self.maze.grid[y][x]
-                if cell.is_42:
-                    cell_row = self.get_cell_row(y)
-                    cell_col = self.get_cell_col(x)
-                    self.draw_str(cell_row, cell_col, self.fill,
-                                  self.cell_width, 5)
-
-    def draw_top_border(self: "MazePainter", row: int) -> None:
-        """Draw the top border of the maze."""
-        col = 0
-        for x in range(self.maze.width):
-            cell = self.maze.grid[0][x]
-            if cell.walls & Cell.NORTH:
-                col = self.draw_str(row, col, self.wall,
-                                    self.cell_width + 1, 1)
-            else:
-                col = self.draw_str(row, col, self.wall, 1, 1)
-                col = self.draw_str(row, col, " ", self.cell_width, 1)
-        col = self.draw_str(row, col, self.wall, 1, 1)
-
-    def draw_vertical_walls(self: "MazePainter", row: int, y: int) -> None:
-        """Draw the vertical walls (only west) in a row."""
-        col = 0
-        for x in range(self.maze.width):
-            cell = self.maze.grid[y][x]
-            if cell.walls & Cell.WEST:
-                col = self.draw_str(row, col, self.wall, self.cell_height, 1)
-            else:
-                col = self.draw_str(row, col, " ", self.cell_height, 1)
-            # Inside of the cell
-            col = self.draw_str(row, col, " ", self.cell_width, 1)
-        # Rightmost border
-        col = self.draw_str(row, col, self.wall, self.cell_height, 1)
-
-    def draw_horizontal_walls(self: "MazePainter", row: int, y: int) -> None:
-        """Draw the horizontal walls (only south) in a row."""
-        col = 0
-        for x in range(self.maze.width):
-            cell = self.maze.grid[y][x]
-            if cell.walls & Cell.SOUTH:
-                col = self.draw_str(row, col, self.wall,
-                                    self.cell_width + 1, 1)
-            else:
-                col = self.draw_str(row, col, self.wall, 1)
-                col = self.draw_str(row, col, " ", self.cell_width, 1)
-        col = self.draw_str(row, col, self.wall, 1, 1)
+        for (x, y) in sorted(self.maze.cells_42,
+                             key=lambda cell: (cell[1], cell[0])):
+            self.draw_canvas(self.get_cell_row(y), self.get_cell_col(x),
+                             self.fill * self.cell_width, 5)
 
     def print_walls(self: "MazePainter") -> None:
         """Print the walls."""
-        row = 0
+        self.draw_rows(0, self.maze_rows, overlays=False, animate=True)
 
-        self.draw_top_border(row)
-        row += 1
-        # Print maze row by row
-        for y in range(self.maze.height):
-            self.draw_vertical_walls(row, y)
-            row += 1
-            self.draw_horizontal_walls(row, y)
-            row += 1
+    def get_path_spans(self: "MazePainter") -> Iterator[tuple[int, int, int]]:
+        """
+        Get the parts of the canvas filled by the solution path,
+        from entry to exit.
 
-    def draw_path(self: "MazePainter") -> None:
-        """Draw the solution path on the maze from enrty to exit."""
+        Returns:
+            Iterator[tuple[int, int, int]]: The row, column and length
+            of the cells (without the entry and exit) and of the walls
+            between them.
+        """
         if self.path is None:
             return
 
         (x, y) = self.maze.entry
 
         for i in self.path:
-            # Calculate the cell position on the pad
+            # Calculate the cell position on the canvas
             cell_row = self.get_cell_row(y)
             cell_col = self.get_cell_col(x)
 
-            # Fill the cell if it is not entry or exit
+            # The cell if it is not entry or exit
             if (x, y) != self.maze.entry and (x, y) != self.maze.exit:
-                self.draw_str(cell_row, cell_col, self.fill,
-                              self.cell_width, 4)
+                yield (cell_row, cell_col, self.cell_width)
 
-            # Fill the walls between open cells
+            # The walls between open cells
             if i == Cell.NORTH:
-                wall_row = cell_row - 1
-                wall_col = cell_col
-                self.draw_str(wall_row, wall_col, self.fill,
-                              self.cell_width, 4)
+                yield (cell_row - 1, cell_col, self.cell_width)
                 y -= 1
             elif i == Cell.SOUTH:
-                wall_row = cell_row + 1
-                wall_col = cell_col
-                self.draw_str(wall_row, wall_col, self.fill,
-                              self.cell_width, 4)
+                yield (cell_row + 1, cell_col, self.cell_width)
                 y += 1
             elif i == Cell.WEST:
-                wall_row = cell_row
-                wall_col = cell_col - 1
-                self.draw_str(wall_row, wall_col, self.fill,
-                              self.cell_height, 4)
+                yield (cell_row, cell_col - 1, self.cell_height)
                 x -= 1
             elif i == Cell.EAST:
-                wall_row = cell_row
-                wall_col = cell_col + self.cell_width
-                self.draw_str(wall_row, wall_col, self.fill,
-                              self.cell_height, 4)
+                yield (cell_row, cell_col + self.cell_width,
+                       self.cell_height)
                 x += 1
 
-        # Fill the last cell
-        cell_row = self.get_cell_row(y)
-        cell_col = self.get_cell_col(x)
+        # The last cell
         if (x, y) != self.maze.entry and (x, y) != self.maze.exit:
-            self.draw_str(cell_row, cell_col, self.fill,
-                          self.cell_width, 4)
+            yield (self.get_cell_row(y), self.get_cell_col(x),
+                   self.cell_width)
 
-    def clear_path(self: "MazePainter") -> None:
-        """Clear the solution path on the maze from exit to entry."""
+    def draw_path(self: "MazePainter") -> None:
+        """Draw the solution path on the maze from enrty to exit."""
         if self.path is None:
             return
 
-        (x, y) = self.maze.exit
+        self.path_visible = True
+        for (row, col, length) in self.get_path_spans():
+            if not self.animation.is_running():
+                break
+            self.draw_canvas(row, col, self.fill * length, 4)
+        # The part of the path not animated
+        self.draw_rows(0, self.maze_rows)
 
-        for i in reversed(self.path):
-            # Calculate the cell position on the pad
-            cell_row = self.get_cell_row(y)
-            cell_col = self.get_cell_col(x)
-
-            # Clear the cell
-            if (x, y) != self.maze.entry and (x, y) != self.maze.exit:
-                self.draw_str(cell_row, cell_col, " ", self.cell_width)
-
-            # Clear walls between open cells
-            opp = Grid.get_opposite_direction(i)
-            if opp == Cell.NORTH:
-                wall_row = cell_row - 1
-                wall_col = cell_col
-                self.draw_str(wall_row, wall_col, " ", self.cell_width)
-                y -= 1
-            elif opp == Cell.SOUTH:
-                wall_row = cell_row + 1
-                wall_col = cell_col
-                self.draw_str(wall_row, wall_col, " ", self.cell_width)
-                y += 1
-            elif opp == Cell.WEST:
-                wall_row = cell_row
-                wall_col = cell_col - 1
-                self.draw_str(wall_row, wall_col, " ", self.cell_height)
-                x -= 1
-            elif opp == Cell.EAST:
-                wall_row = cell_row
-                wall_col = cell_col + self.cell_width
-                self.draw_str(wall_row, wall_col, " ", self.cell_height)
-                x += 1
+    def clear_path(self: "MazePainter") -> None:
+        """Clear the solution path on the maze from exit to entry."""
+        if self.path is None:
+            return
 
-        # Clear last cell
-        cell_row = self.get_cell_row(y)
-        cell_col = self.get_cell_col(x)
-        if (x, y) != self.maze.entry and (x, y) != self.maze.exit:
-            self.draw_str(cell_row, cell_col, " ", self.cell_width)
+        self.path_visible = False
+        if self.animation.is_running():
+            for (row, col, length) in reversed(list(self.get_path_spans())):
+                if not self.animation.is_running():
+                    break
+                self.draw_canvas(row, col, " " * length, 1)
+        # The part of the path not animated
+        self.draw_rows(0, self.maze_rows)
@@ -9,34 +9,95 @@ The exit coordinates.
 The shorted valid path from entry to exit, using the four letters N, E, S, W.
 """
 
+from collections.abc import Iterable, Iterator
+
 from mazegen.config.maze_config import Config
 from mazegen.grid.maze_cell import Cell
 from mazegen.grid.maze_grid import Grid
+from mazegen.io.maze_compression import MazeCompression
+from mazegen.io.maze_packed import MazePacked
 
 
 class OutputWriter:
     """
     Write maze generation output to a file.
     """
-    def __init__(self: "OutputWriter", maze: Grid, solution: list[int] | None,
-                 config: Config) -> None:
+
+    # Translation table from wall values to hex digits
+    HEX_TABLE = bytes.maketrans(bytes(range(16)), b"0123456789ABCDEF")
+    # Translation table from directions to letters,
+    # and the values that are not directions
+    DIR_TABLE = bytes.maketrans(bytes(Cell.DIRS), b"NESW")
+    NOT_DIRS = bytes(value for value in range(256) if value not in Cell.DIRS)
+
+    def __init__(self: "OutputWriter", maze: Grid | None,
+                 solution: list[int] | None, config: Config) -> None:
+        """
+        Initialize the writer.
+        The maze can be None if the rows are passed to write_rows().
+        """
         self.maze = maze
         self.solution = solution
         self.entry = config.entry
         self.exit = config.exit
         self.output = config.output
+        self.compression = MazeCompression.get_format(self.output, config)
 
     def write_output_file(self: "OutputWriter") -> None:
-        # The maze as hex
-        hex = "0123456789ABCDEF"
-        str = ""
-        for y in range(self.maze.height):
-            for x in range(self.maze.width):
-                str += hex[self.maze.grid[y][x].walls % 16]
-            str += "\n"
+        """
+        Write the maze, entry, exit and solution to the output file.
+        The maze is written in the packed binary format (see MazePacked)
+        if the output file has the extension of that format.
+        """
+        if self.maze is None:
+            raise ValueError("OutputWriter: No maze to write.")
+
+        if self.output.endswith(MazePacked.EXTENSION):
+            try:
+                MazePacked.write(self.output, self.maze, self.solution)
+            except OSError as e:
+                raise OSError("OSError: ", e)
+            return
 
+        self.write_rows(self.get_rows())
+
+    def get_rows(self: "OutputWriter") -> Iterator[bytearray]:
+        """Get the wall values of each row of the maze."""
+        if self.maze is None:
+            return
+        walls = self.maze.walls
+        width = self.maze.width
+        for start in range(0, self.maze.size, width):
+            yield walls[start:start + width]
+
+    def write_rows(self: "OutputWriter",
+                   rows: Iterable[bytes | bytearray]) -> None:
+        """
+        Write the maze to the output file one row at a time,
+        while the rows are produced, e.g. by EllerRowGenerator.
+        Only one row is kept in memory. Each row is converted to hex
+        digits at once with a translation table, and written through
+        a buffered file, compressed chunk by chunk if the output file
+        has the extension of a compressed format (.gz, .zz, .xz)
+        or if the config has a COMPRESSION key.
+
+        Args:
+            rows (Iterable[bytes | bytearray]): The wall values of each row.
+        """
+        try:
+            with MazeCompression.open(self.output, "wb",
+                                      self.compression) as fd:
+                for row in rows:
+                    fd.write(row.translate(self.HEX_TABLE))
+                    fd.write(b"\n")
+                fd.write(self.format_footer().encode())
+        except OSError as e:
+            raise OSError("OSError: ", e)
+
+    def format_footer(self: "OutputWriter") -> str:
+        """Format the part of the output after the maze."""
         # Entry and exit points
-        str += "\n"
+        str = "\n"
         (x, y) = self.entry
         str += f"{x},{y}\n"
         (x, y) = self.exit
@@ -44,15 +105,8 @@ class OutputWriter:
 
         # Solution
         if self.solution is not None:
-            for dir in self.solution:
-                dir_str = Cell.dir_to_str(dir)
-                if dir_str is not None:
-                    str += dir_str
+            str += bytes(self.solution).translate(self.DIR_TABLE,
+                                                  self.NOT_DIRS).decode()
 
         str += "\n"
-        # Write to file
-        try:
-            with open(self.output, "w") as fd:
-                fd.write(str)
-        except OSError as e:
-            raise OSError("OSError: ", e)
+        return str